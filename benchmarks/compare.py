@@ -0,0 +1,69 @@
+"""Compares two result files of benchmarks/run.py and reports the benchmarks \
+whose median got slower than a threshold.
+
+Run from the root of the repository:
+    python -m benchmarks.compare before.json after.json
+"""
+
+import argparse
+import json
+import sys
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+DEFAULT_THRESHOLD = 0.2
+
+
+def load(filename: str) -> Dict[Tuple[str, str], Dict[str, Any]]:
+    """Reads a result file.
+
+    Args:
+        filename (str): The path of the file
+
+    Returns:
+        Dict[Tuple[str, str], Dict[str, Any]]: The statistics of each \
+benchmark, by name and parameters
+    """
+    with open(filename, encoding="utf-8") as file:
+        report = json.load(file)
+
+    return {
+        (entry["name"], json.dumps(entry["params"], sort_keys=True)): entry["stats"]
+        for entry in report["results"]
+    }
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compares two benchmark result files.")
+    parser.add_argument("before", help="The results of the reference commit")
+    parser.add_argument("after", help="The results to check")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="The relative slowdown of the median reported as a regression (0.2 for 20%%)",
+    )
+    options = parser.parse_args(args)
+
+    before = load(options.before)
+    after = load(options.after)
+    regressions = 0
+    for key in sorted(before.keys() & after.keys()):
+        old = before[key]["p50_ms"]
+        new = after[key]["p50_ms"]
+        ratio = new / old if old > 0 else 1.0
+        regressed = ratio > 1 + options.threshold
+        regressions += regressed
+        name, params = key
+        print(
+            f"{'REGRESSION' if regressed else '':<10} {name:<28} {params:<70} "
+            f"{old:10.3f} -> {new:10.3f} ms ({ratio:.2f}x)"
+        )
+
+    for name, params in sorted(before.keys() ^ after.keys()):
+        print(f"{'MISSING':<10} {name:<28} {params}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
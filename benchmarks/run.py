@@ -0,0 +1,335 @@
+"""Times the hot paths of the application on deterministic synthetic data and \
+writes the results to a JSON file, so that runs on different commits can be \
+compared with benchmarks/compare.py.
+
+Run from the root of the repository:
+    python -m benchmarks.run --output results.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import tkinter as tk
+from datetime import datetime, timezone
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import cv2
+import numpy as np
+
+from benchmarks.synthetic import generate_video
+from src.models.filerepo import FileRepo
+from src.models.point import Point
+from src.models.referenceframe import ReferenceFrame
+from src.models.sessionfile import SessionFile
+from src.models.sessionsnapshot import SessionSnapshot
+from src.models.trajectorystore import TrajectoryStore
+from src.models.transformcache import TransformCache
+from src.models.video import Video
+
+# width, height, frame count, codec and extension of each synthetic video
+VIDEO_CASES = (
+    (640, 360, 250, "mp4v", ".mp4"),
+    (1280, 720, 250, "mp4v", ".mp4"),
+    (1920, 1080, 250, "mp4v", ".mp4"),
+    (1280, 720, 250, "MJPG", ".avi"),
+    (1280, 720, 1500, "mp4v", ".mp4"),
+)
+QUICK_VIDEO_CASES = ((640, 360, 100, "mp4v", ".mp4"), (640, 360, 100, "MJPG", ".avi"))
+
+POINT_COUNTS = (10_000, 100_000, 1_000_000)
+QUICK_POINT_COUNTS = (10_000,)
+
+SEEKS = 30
+BACK_STEPS = 60
+REPEATS = 5
+SEED = 0
+
+
+def summarize(durations_ns: Sequence[int]) -> Dict[str, float]:
+    """Returns statistics of durations.
+
+    Args:
+        durations_ns (Sequence[int]): The durations (in nanoseconds)
+
+    Returns:
+        Dict[str, float]: The count and the mean, median, 95th percentile \
+and maximum (in milliseconds)
+    """
+    values = np.array(durations_ns, dtype=np.float64) / 1e6
+    return {
+        "count": len(values),
+        "mean_ms": float(values.mean()),
+        "p50_ms": float(np.percentile(values, 50)),
+        "p95_ms": float(np.percentile(values, 95)),
+        "max_ms": float(values.max()),
+    }
+
+
+def timed(function: Callable[[], Any], repeats: int = REPEATS) -> List[int]:
+    """Calls a function several times and returns how long each call took.
+
+    Args:
+        function (Callable[[], Any]): The function
+        repeats (int, optional): The amount of calls. Defaults to REPEATS.
+
+    Returns:
+        List[int]: The durations (in nanoseconds)
+    """
+    durations: List[int] = []
+    for _ in range(repeats):
+        start = perf_counter_ns()
+        function()
+        durations.append(perf_counter_ns() - start)
+
+    return durations
+
+
+def result(name: str, params: Dict[str, Any], durations: Sequence[int]) -> Dict:
+    """Returns a result as stored in the output file."""
+    print(
+        f"{name:<28} {json.dumps(params):<70} p50 {summarize(durations)['p50_ms']:.3f} ms"
+    )
+    return {"name": name, "params": params, "stats": summarize(durations)}
+
+
+def display_root() -> Optional[tk.Tk]:
+    """Returns a hidden window to time displaying frames, or None if there \
+is no display (run under Xvfb to get one)."""
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+
+    root.withdraw()
+    return root
+
+
+def bench_video(
+    path: Path, params: Dict[str, Any], root: Optional[tk.Tk] = None
+) -> List[Dict]:
+    """Times reading a video forwards, seeking and stepping backwards, \
+and displaying each frame if there is a display.
+
+    Args:
+        path (Path): The path of the video
+        params (Dict[str, Any]): The description of the video
+        root (Optional[Tk], optional): The window where frames are displayed, \
+or None to skip displaying them. Defaults to None.
+
+    Returns:
+        List[Dict]: The results
+    """
+    results: List[Dict] = []
+
+    if root is not None:
+        # decoding, conversion and loading into the photo image of the view
+        video = Video(str(path))
+        photo = tk.PhotoImage(master=root)
+        durations: List[int] = []
+        while True:
+            start = perf_counter_ns()
+            frame = video.get_frame()
+            if frame is None:
+                break
+            photo.configure(data=frame, format="PPM")
+            durations.append(perf_counter_ns() - start)
+        results.append(result("video.display", params, durations))
+
+    # sequential reading without prefetching: decoding and conversion only
+    video = Video(str(path))
+    durations: List[int] = []
+    while True:
+        start = perf_counter_ns()
+        frame = video.get_frame()
+        if frame is None:
+            break
+        durations.append(perf_counter_ns() - start)
+    results.append(result("video.get_frame", params, durations))
+
+    # random seeks, each followed by reading the frame that was sought
+    rng = np.random.default_rng(SEED)
+    targets = rng.integers(0, video.frame_count - 1, SEEKS)
+    video = Video(str(path))
+    video.build_index()
+    durations = []
+    for target in targets:
+        start = perf_counter_ns()
+        video.go_to(int(target))
+        video.get_frame()
+        durations.append(perf_counter_ns() - start)
+    results.append(result("video.go_to", params, durations))
+
+    # stepping backwards from the end, as with the previous frame button
+    video = Video(str(path))
+    video.start_prefetching()
+    video.go_to(video.frame_count - 1)
+    video.get_frame()
+    durations = []
+    for _ in range(min(BACK_STEPS, video.frame_count - 2)):
+        start = perf_counter_ns()
+        video.get_previous_frame()
+        durations.append(perf_counter_ns() - start)
+    video.stop_prefetching()
+    results.append(result("video.previous_frame", params, durations))
+
+    return results
+
+
+def trajectory(count: int) -> TrajectoryStore:
+    """Returns a deterministic trajectory with a point missing every ten frames."""
+    rng = np.random.default_rng(SEED)
+    x = rng.uniform(0, 1920, count)
+    y = rng.uniform(0, 1080, count)
+    valid = np.arange(count) % 10 != 9
+    return TrajectoryStore.from_arrays(x, y, valid)
+
+
+def bench_points(count: int, directory: Path) -> List[Dict]:
+    """Times transforming and exporting points.
+
+    Args:
+        count (int): The amount of points
+        directory (Path): Where the exported files are written
+
+    Returns:
+        List[Dict]: The results
+    """
+    params = {"points": count}
+    points = trajectory(count)
+    cache = TransformCache(points, 40.0)
+    frame = ReferenceFrame(Point(960, 540), 0.01)
+
+    def transform_all() -> None:
+        cache.set_reference_frame(frame)
+        cache.values()
+
+    results = [result("transformed_values.full", params, timed(transform_all))]
+
+    def transform_one() -> None:
+        points[count // 2] = Point(1, 2)
+        cache.update(count // 2)
+        cache.values()
+
+    results.append(result("transformed_values.update", params, timed(transform_one)))
+
+    values, times = cache.values()
+    filerepo = FileRepo()
+    for compress in (False, True):
+        filename = directory.joinpath(
+            f"points_{count}.csv" + (".gz" if compress else "")
+        )
+        durations = timed(
+            lambda: filerepo.export_to_csv(
+                times / 1000, values, filename, compress=compress
+            ),
+            repeats=1 if count >= 1_000_000 else REPEATS,
+        )
+        results.append(
+            result("filerepo.export_to_csv", {**params, "gzip": compress}, durations)
+        )
+
+    session_file = SessionFile(directory.joinpath(f"points_{count}.vtsession"))
+    snapshot = SessionSnapshot("video.mp4", None, count, {"Objet 1": points}, "Objet 1")
+    results.append(
+        result("sessionfile.save", params, timed(lambda: session_file.save(snapshot)))
+    )
+    results.append(
+        result(
+            "sessionfile.append",
+            params,
+            timed(lambda: session_file.append(0, count // 2, Point(1, 2))),
+        )
+    )
+    results.append(result("sessionfile.load", params, timed(session_file.load)))
+    session_file.close()
+
+    return results
+
+
+def git_commit() -> Optional[str]:
+    """Returns the current commit of the repository, if any."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(args: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Times decoding, seeking, transforming and exporting on synthetic data."
+    )
+    parser.add_argument(
+        "--output",
+        default="benchmark.json",
+        help="The JSON file where the results are written",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Use small videos and point counts only"
+    )
+    parser.add_argument(
+        "--videos",
+        metavar="DIRECTORY",
+        help="Where the synthetic videos are kept between runs (a temporary directory by default)",
+    )
+    options = parser.parse_args(args)
+
+    video_cases = QUICK_VIDEO_CASES if options.quick else VIDEO_CASES
+    point_counts = QUICK_POINT_COUNTS if options.quick else POINT_COUNTS
+
+    results: List[Dict] = []
+    root = display_root()
+    if root is None:
+        print("No display: video.display is skipped")
+
+    with tempfile.TemporaryDirectory() as temporary:
+        video_directory = Path(options.videos or temporary)
+        video_directory.mkdir(parents=True, exist_ok=True)
+        for width, height, frame_count, fourcc, extension in video_cases:
+            path = video_directory.joinpath(
+                f"{width}x{height}_{frame_count}_{fourcc}{extension}"
+            )
+            if not path.is_file():
+                generate_video(path, width, height, frame_count, fourcc, seed=SEED)
+
+            params = {
+                "width": width,
+                "height": height,
+                "frames": frame_count,
+                "codec": fourcc,
+            }
+            results.extend(bench_video(path, params, root))
+
+        for count in point_counts:
+            results.extend(bench_points(count, Path(temporary)))
+
+    if root is not None:
+        root.destroy()
+
+    report = {
+        "metadata": {
+            "commit": git_commit(),
+            "date": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "opencv": cv2.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "quick": options.quick,
+        },
+        "results": results,
+    }
+    with open(options.output, "w", encoding="utf-8") as file:
+        json.dump(report, file, indent=2)
+
+    print(f"Results written to {options.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+from pathlib import Path
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+DEFAULT_FPS = 25.0
+DISC_RADIUS_RATIO = 0.05
+
+
+def disc_center(
+    frame_index: int, frame_count: int, width: int, height: int
+) -> Tuple[int, int]:
+    """Returns where the disc is drawn on a frame: it is thrown from the \
+left edge and follows a parabola, like the objects the application tracks.
+
+    Args:
+        frame_index (int): The index of the frame
+        frame_count (int): The amount of frames in the video
+        width (int): The width of the video (in pixels)
+        height (int): The height of the video (in pixels)
+
+    Returns:
+        Tuple[int, int]: The center of the disc (in pixels)
+    """
+    progress = frame_index / max(frame_count - 1, 1)
+    x = width * (0.1 + 0.8 * progress)
+    y = height * (0.2 + 2.4 * (progress - 0.5) ** 2)
+    return round(x), round(y)
+
+
+def generate_video(
+    filename: str | Path,
+    width: int,
+    height: int,
+    frame_count: int,
+    fourcc: str = "mp4v",
+    fps: float = DEFAULT_FPS,
+    seed: int = 0,
+) -> Path:
+    """Writes a deterministic video of a disc moving over a noisy gradient. \
+The noise keeps the encoder from compressing frames to almost nothing, so \
+decoding costs are close to those of real videos.
+
+    Args:
+        filename (str | Path): The path of the video, with an extension \
+matching the codec (.mp4 for mp4v, .avi for MJPG for example)
+        width (int): The width of the video (in pixels)
+        height (int): The height of the video (in pixels)
+        frame_count (int): The amount of frames
+        fourcc (str, optional): The code of the codec. Defaults to "mp4v".
+        fps (float, optional): The frame rate. Defaults to DEFAULT_FPS.
+        seed (int, optional): The seed of the noise. Defaults to 0.
+
+    Raises:
+        ValueError: The video cannot be written with this codec
+
+    Returns:
+        Path: The path of the video
+    """
+    path = Path(filename)
+    writer = cv2.VideoWriter(
+        str(path), cv2.VideoWriter_fourcc(*fourcc), fps, (width, height)
+    )
+    if not writer.isOpened():
+        raise ValueError(f"Cannot write a {fourcc} video to {path}")
+
+    rng = np.random.default_rng(seed)
+    gradient = np.linspace(0, 160, width, dtype=np.float32)
+    background = np.empty((height, width, 3), np.uint8)
+    background[:, :, 0] = gradient.astype(np.uint8)
+    background[:, :, 1] = np.linspace(40, 120, height, dtype=np.uint8)[:, None]
+    background[:, :, 2] = 80
+    # a few noise patterns are reused so that generating long videos stays fast
+    noise = rng.integers(0, 24, (4, height, width, 1), dtype=np.uint8)
+    radius = max(round(min(width, height) * DISC_RADIUS_RATIO), 1)
+
+    try:
+        for frame_index in range(frame_count):
+            frame = cv2.add(background, noise[frame_index % len(noise)].repeat(3, 2))
+            center = disc_center(frame_index, frame_count, width, height)
+            cv2.circle(frame, center, radius, (0, 0, 255), -1)
+            writer.write(frame)
+    finally:
+        writer.release()
+
+    return path
@@ -1,30 +1,94 @@
+from time import perf_counter
+
+# measured before anything else is imported, for the startup report
+STARTED_AT = perf_counter()
+
+import argparse
+import importlib
 import os
 import sys
+from threading import Thread
+from typing import Optional
 
 import tkinter as tk
+from tkinter import ttk
 from views.view import View
 
 from controllers.controller import Controller
+from models.startuptimer import StartupTimer
 
 src_path = os.path.abspath(os.path.dirname(__file__))
 sys.path.append(src_path)
 
+# loaded in the background once the window is shown, so that opening a video
+# or showing a graph for the first time does not wait for them
+WARM_UP_MODULES = (
+    "cv2",
+    "models.video",
+    "models.tracker",
+    "views.widgets.graphpanel",
+)
+
 
 class Application(tk.Tk):
     """The application's main window"""
 
-    def __init__(self):
+    def __init__(self, startup: Optional[StartupTimer] = None, report: bool = False):
         super().__init__()
+        self.__startup = StartupTimer() if startup is None else startup
+        self.__report = report
+
         self.title("Video Tracker")
         self.geometry("960x540")
 
-        self.view = View(self)
-        self.view.pack(fill=tk.BOTH, expand=True)
+        # graphs are shown in a pane next to the view
+        self.panes = ttk.PanedWindow(self, orient=tk.HORIZONTAL)
+        self.panes.pack(fill=tk.BOTH, expand=True)
+        self.view = View(self.panes)
+        self.panes.add(self.view, weight=1)
+        self.__startup.mark("view")
 
         self.controller = Controller(self.view, self.quit)
         self.protocol("WM_DELETE_WINDOW", self.controller.clean_quit)
+        self.__startup.mark("controller")
+
+        # called once the event loop is idle, after the window is drawn
+        self.after_idle(self.__on_shown)
+
+    @property
+    def startup(self) -> StartupTimer:
+        """The timer of the startup of the application."""
+        return self.__startup
+
+    def __on_shown(self) -> None:
+        """Records when the window appeared and starts loading the heavy \
+modules in the background."""
+        self.__startup.mark("first window")
+        Thread(target=self.__warm_up, daemon=True).start()
+
+    def __warm_up(self) -> None:
+        """Imports the modules that are only needed later."""
+        for module in WARM_UP_MODULES:
+            try:
+                importlib.import_module(module)
+            except ImportError:
+                pass
+
+        self.__startup.mark("warm-up")
+        if self.__report:
+            print(self.__startup.report(), file=sys.stderr)
 
 
 if __name__ == "__main__":
-    app = Application()
+    parser = argparse.ArgumentParser(description="Video Tracker")
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="Print how long each step of the startup took",
+    )
+    options = parser.parse_args()
+
+    timer = StartupTimer(STARTED_AT)
+    timer.mark("imports")
+    app = Application(timer, options.startup_report)
     app.mainloop()
@@ -0,0 +1,318 @@
+"""Runs the tracking pipeline without a display, for example on a server.
+
+From the project root:
+
+    python -m src.batch video.mp4 --origin 320 240 --scale 150 0.5 \
+--points clicks.csv --output results.csv
+
+Instead of clicks, --track X Y follows the object found at this position \
+on the first frame automatically.
+
+With --kinematics, the velocity and acceleration are written after the \
+points, and the energies too if --mass is given.
+
+Several videos can be processed at once, in which case --points and \
+--output are directories and files are matched by the video's name.
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+from .models.filerepo import FileRepo
+from .models.kinematics import Kinematics
+from .models.point import Point
+from .models.referenceframe import ReferenceFrame
+from .models.tracker import Tracker, track
+from .models.trajectorystore import TrajectoryStore
+from .models.video import Video
+
+
+def tracked_points(video: Video, point: Point, start_frame: int = 0) -> TrajectoryStore:
+    """Tracks an object in a video until it is lost or the video ends.
+
+    Args:
+        video (Video): The video
+        point (Point): The position of the object on the start frame (in pixels)
+        start_frame (int, optional): The index (starting at 0) of the frame \
+where the object is selected. Defaults to 0.
+
+    Returns:
+        TrajectoryStore: The point of each frame where the object was found
+    """
+    points = TrajectoryStore(video.frame_count)
+    tracker = Tracker()
+    for index, position, confidence in track(
+        video.filename, start_frame, point, tracker, video.build_index()
+    ):
+        if confidence < tracker.min_confidence or index >= video.frame_count:
+            break
+
+        points[index] = position
+
+    return points
+
+
+def process_video(
+    video_path: str | Path,
+    points_path: Optional[str | Path],
+    output_path: str | Path,
+    origin: Point,
+    scale: float,
+    sep: str = ",",
+    tracked: Optional[Point] = None,
+    start_frame: int = 0,
+    kinematics: bool = False,
+    mass: Optional[float] = None,
+    smoothing_window: int = 0,
+) -> Path:
+    """Transforms the points clicked on a video, or found by tracking an object, \
+and saves them in a CSV file.
+
+    Args:
+        video_path (str | Path): The path of the video
+        points_path (Optional[str | Path]): The path of a CSV file with the frame, \
+x and y columns, in canvas coordinates, or None to track an object instead
+        output_path (str | Path): The path of the resulting CSV file
+        origin (Point): The origin of the reference frame (in pixels)
+        scale (float): The scale of the reference frame (in pixels per meter)
+        sep (str, optional): The separator used in both CSV files ("," by default)
+        tracked (Optional[Point], optional): The position of the object to track \
+(in pixels), used when there is no CSV file. Defaults to None.
+        start_frame (int, optional): The index (starting at 0) of the frame \
+where the tracked object is selected. Defaults to 0.
+        kinematics (bool, optional): Whether the velocity and acceleration \
+are written after the points. Defaults to False.
+        mass (Optional[float], optional): The mass of the object (in kilograms), \
+to write the energies too, or None. Defaults to None.
+        smoothing_window (int, optional): The window of the Savitzky-Golay \
+filter applied before differentiating, or 0 for no smoothing. Defaults to 0.
+
+    Raises:
+        ValueError: The video or the points cannot be read
+
+    Returns:
+        Path: The path of the resulting CSV file
+    """
+    video = Video(str(video_path))
+    repo = FileRepo()
+
+    if points_path is not None:
+        points = repo.read_points_from_csv(points_path, video.frame_count, sep)
+    elif tracked is not None:
+        points = tracked_points(video, tracked, start_frame)
+    else:
+        raise ValueError("No point source")
+
+    transformed, time = ReferenceFrame(origin, scale).transformed_values(
+        points, video.timestamps_ms
+    )
+    columns = None
+    if kinematics or mass is not None:
+        columns = Kinematics(
+            transformed,
+            time,
+            smoothing_window=smoothing_window,
+            frames=points.indices(),
+        ).columns(mass)
+
+    repo.export_to_csv(time, transformed, output_path, sep, columns=columns)
+
+    return Path(output_path)
+
+
+def matching_path(path: Path, video_path: Path, many: bool) -> Path:
+    """Returns the file matching a video in a directory, or the path itself \
+if it is a file used for a single video.
+
+    Args:
+        path (Path): A file or a directory
+        video_path (Path): The path of the video
+        many (bool): Whether several videos are processed
+
+    Returns:
+        Path: The matching file
+    """
+    if many or path.is_dir():
+        return path / f"{video_path.stem}.csv"
+
+    return path
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parses the command-line arguments.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The arguments, or None \
+to use sys.argv. Defaults to None.
+
+    Returns:
+        argparse.Namespace: The parsed arguments
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m src.batch",
+        description="Transforms the points acquired on videos and saves them "
+        "in CSV files, without a display.",
+    )
+    parser.add_argument("videos", nargs="+", type=Path, help="the video files")
+    parser.add_argument(
+        "--origin",
+        nargs=2,
+        type=float,
+        required=True,
+        metavar=("X", "Y"),
+        help="the origin of the reference frame (in pixels)",
+    )
+    parser.add_argument(
+        "--scale",
+        nargs=2,
+        type=float,
+        required=True,
+        metavar=("PIXELS", "METERS"),
+        help="a distance in pixels and the corresponding real distance",
+    )
+
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument(
+        "--points",
+        type=Path,
+        help="a CSV file with the frame, x and y columns (in pixels), "
+        "or a directory of such files named after the videos",
+    )
+    source.add_argument(
+        "--track",
+        nargs=2,
+        type=float,
+        metavar=("X", "Y"),
+        help="the position of an object to track automatically (in pixels)",
+    )
+    parser.add_argument(
+        "--track-from",
+        type=int,
+        default=0,
+        metavar="FRAME",
+        help="the index (starting at 0) of the frame where the tracked object "
+        "is at the position given to --track (0 by default)",
+    )
+
+    parser.add_argument(
+        "--output",
+        type=Path,
+        required=True,
+        help="the resulting CSV file, or a directory when processing several videos",
+    )
+    parser.add_argument(
+        "--kinematics",
+        action="store_true",
+        help="also write the velocity and the acceleration of each point",
+    )
+    parser.add_argument(
+        "--mass",
+        type=float,
+        metavar="KG",
+        help="the mass of the object, to also write its energies",
+    )
+    parser.add_argument(
+        "--smooth",
+        type=int,
+        default=0,
+        metavar="WINDOW",
+        help="the odd window of the Savitzky-Golay filter applied before "
+        "computing the kinematics (no smoothing by default)",
+    )
+    parser.add_argument("--sep", default=",", help='the CSV separator ("," by default)')
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="the amount of videos processed in parallel (one per core by default)",
+    )
+
+    args = parser.parse_args(argv)
+    if args.scale[0] <= 0 or args.scale[1] <= 0:
+        parser.error("the distances given to --scale must be positive")
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    if args.track_from < 0:
+        parser.error("--track-from must be at least 0")
+
+    if args.mass is not None and args.mass <= 0:
+        parser.error("--mass must be positive")
+
+    if args.smooth != 0 and (args.smooth < 3 or args.smooth % 2 == 0):
+        parser.error("--smooth must be an odd window of at least 3")
+
+    return args
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs the command-line interface.
+
+    Args:
+        argv (Optional[Sequence[str]], optional): The arguments, or None \
+to use sys.argv. Defaults to None.
+
+    Returns:
+        int: The exit status, 1 if a video could not be processed
+    """
+    args = parse_args(argv)
+
+    videos: List[Path] = args.videos
+    many = len(videos) > 1
+    if many:
+        args.output.mkdir(parents=True, exist_ok=True)
+
+    origin = Point(*args.origin)
+    scale = args.scale[0] / args.scale[1]
+    tracked = None if args.track is None else Point(*args.track)
+    jobs = [
+        (
+            video,
+            None if args.points is None else matching_path(args.points, video, many),
+            matching_path(args.output, video, many),
+            origin,
+            scale,
+            args.sep,
+            tracked,
+            args.track_from,
+            args.kinematics,
+            args.mass,
+            args.smooth,
+        )
+        for video in videos
+    ]
+
+    status = 0
+    if args.jobs == 1 or not many:
+        for job in jobs:
+            try:
+                print(process_video(*job))
+            except (OSError, ValueError) as error:
+                print(f"{job[0]}: {error}", file=sys.stderr)
+                status = 1
+    else:
+        with ProcessPoolExecutor(
+            max_workers=min(args.jobs, len(jobs)),
+            mp_context=multiprocessing.get_context("spawn"),
+        ) as executor:
+            futures: List[Tuple[Path, Future[Path]]] = [
+                (job[0], executor.submit(process_video, *job)) for job in jobs
+            ]
+            for video, future in futures:
+                try:
+                    print(future.result())
+                except (OSError, ValueError) as error:
+                    print(f"{video}: {error}", file=sys.stderr)
+                    status = 1
+
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
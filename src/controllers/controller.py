@@ -1,17 +1,57 @@
 from tkinter import Event, messagebox, filedialog
-from typing import Any, Callable, Optional, Tuple, List
-from time import perf_counter
+import os
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 from pathlib import Path
 
+import numpy as np
+
 from views.view import View
 from models.editingmode import EditingMode
 from models.axesdisplay import AxesDisplay
 from models.point import Point
-from models.video import Video
 from models.filerepo import FileRepo
 from models.coordinates import Coordinates
+from models.referenceframe import ReferenceFrame
+from models.trajectorystore import TrajectoryStore
+from models.trackedobject import TrackedObject
+from models.trackingsession import TrackingSession
+from models.kinematics import Kinematics
+from models.loadingphase import LoadingPhase
+from models.playbackclock import PlaybackClock
+from models.profiler import Profiler
+from models.proxycache import ProxyCache, ProxyWorker
+from models.sessionfile import SESSION_EXTENSION, SessionFile, default_session_path
+from models.sessionsnapshot import SessionSnapshot
+from models.thumbnails import (
+    THUMBNAIL_HEIGHT,
+    ThumbnailCache,
+    ThumbnailGenerator,
+    thumbnail_frames,
+)
+from views.widgets.menu import DISPLAY_SCALES
+
+# these modules import OpenCV, which is only loaded once a video is opened
+if TYPE_CHECKING:
+    from models.tracker import TrackingWorker
+    from models.video import Video
+    from models.videoloader import VideoLoader
 
 SHOWN_POINTS = 5
+TRAIL_POINTS = 250
+TRACKING_POLL_MS = 50
+PROXY_POLL_MS = 500
+THUMBNAILS_POLL_MS = 200
+PROFILE_REFRESH_MS = 500
+GRAPH_REFRESH_MS = 100
+LOADING_POLL_MS = 100
+LOADING_LABELS = {
+    LoadingPhase.PROBING: "Ouverture de la vidéo",
+    LoadingPhase.INDEXING: "Indexation de la vidéo",
+    LoadingPhase.VERIFYING: "Vérification du nombre d'images",
+    LoadingPhase.OPENING: "Ouverture de la vidéo",
+}
+SMOOTHING_WINDOW = 7
+SMOOTHING_ORDER = 2
 
 
 class Controller:
@@ -22,17 +62,42 @@ class Controller:
         self.__quit = on_quit
 
         self.__paused = True
+        self.__backwards = False
         self.__current_mode = EditingMode.DEFINING_ORIGIN
         self.__filerepo = FileRepo()
 
-        self.__points: List[Point | None] = []
-        self.__video: Optional[Video] = None
+        self.__session = TrackingSession()
+        self.__video: Optional["Video"] = None
         self.__origin: Optional[Point] = None
         self.__scale: Optional[float] = None
+        self.__mass: Optional[float] = None
 
         # used to store the first point when defining the scale
         self.__scale_start: Optional[Point] = None
 
+        self.__tracking_worker: Optional["TrackingWorker"] = None
+        # the object whose points are found by the tracking worker
+        self.__tracked_object: Optional[TrackedObject] = None
+        self.__clock: Optional[PlaybackClock] = None
+        self.__proxy_cache = ProxyCache()
+        self.__proxy_worker: Optional[ProxyWorker] = None
+
+        # times each stage of the frame processing, cheap enough to stay enabled
+        self.__profiler = Profiler()
+        self.__profile_refreshing = False
+        self.__graph_refresh_pending = False
+        self.__thumbnails: Optional[ThumbnailCache] = None
+        self.__thumbnail_generator: Optional[ThumbnailGenerator] = None
+
+        # the content hash of the video, used to name its cached files
+        self.__video_hash: Optional[str] = None
+        self.__loader: Optional["VideoLoader"] = None
+
+        # where the session is saved automatically, None if it cannot be saved
+        self.__session_file: Optional[SessionFile] = None
+        # the session to restore once its video is loaded
+        self.__pending_session: Optional[Tuple[SessionFile, SessionSnapshot]] = None
+
         self.reconfigure_view()
         self.config_events()
 
@@ -40,40 +105,159 @@ class Controller:
         """Asks user for confirmation if needed, then quits."""
         message = "Si vous quittez l'application, vous perdrez les modifications non enregistrées. Êtes vous sûr de vouloir quitter ?"
         if self.__video is None or messagebox.askokcancel("Quitter", message):  # type: ignore
+            self.cancel_loading()
+            self.cancel_tracking()
+            self.cancel_proxy()
+            self.cancel_thumbnails()
+            self.close_session_file()
+            if self.__video is not None:
+                self.__video.stop_prefetching()
             self.__quit()
 
     def open_video_file(self) -> None:
         """Asks for confirmation if a video is already loaded, then opens \
-a file explorer to ask the user for a video file, then loads the video and updates \
-the application's state."""
+a file explorer to ask the user for a video file, then starts loading the video."""
         message = "Si vous chargez une nouvelle vidéo, vous perdrez les modifications non enregistrées. Êtes vous sûr de vouloir charger une nouvelle vidéo ?"
         if self.__video is None or messagebox.askokcancel("Ouvrir une vidéo", message):  # type: ignore
             filename = filedialog.askopenfilename()
             if Path(str(filename)).is_file():
-                try:
-                    self.__video = Video(filename)
-                    self.__points = [None] * self.__video.frame_count
-                    self.__paused = True
-                    self.reconfigure_view()
-                    self.__view.set_canvas_size(self.__video.width, self.__video.height)
-                    self.__view.winfo_toplevel().geometry("")
-                    self.next_frame()
-                except ValueError as e:
-                    messagebox.showerror(  # pyright: ignore reportUnknownVariableType
-                        title="Erreur", message=str(e)
-                    )
+                self.load_video(filename)
+
+    def load_video(self, filename: str) -> None:
+        """Loads a video in the background, the current video stays usable \
+until the new one is ready.
+
+        Args:
+            filename (str): The path of the video
+        """
+        from models.videoloader import VideoLoader
+
+        self.cancel_loading()
+        self.__loader = VideoLoader(
+            filename, self.__view.menu.verify_frames.get(), self.__profiler
+        )
+        self.__loader.start()
+        self.poll_loading()
+
+    def cancel_loading(self) -> None:
+        """Stops loading a video."""
+        self.__pending_session = None
+        if self.__loader is not None:
+            self.__loader.cancel()
+            self.__loader = None
+            self.__view.show_task("")
+
+    def poll_loading(self) -> None:
+        """Shows the progress of the loading, then the video once it is loaded."""
+        loader = self.__loader
+        if loader is None:
+            return
+
+        if loader.running:
+            self.__view.show_task(
+                f"{LOADING_LABELS[loader.phase]} : {loader.progress:.0%} (Échap pour annuler)"
+            )
+            self.__view.after(LOADING_POLL_MS, self.poll_loading)
+            return
+
+        self.__loader = None
+        self.__view.show_task("")
+        if loader.video is not None:
+            self.set_video(loader.video, loader.content_hash)
+        else:
+            self.__pending_session = None
+
+        if loader.error is not None:
+            messagebox.showerror(  # pyright: ignore reportUnknownVariableType
+                title="Erreur", message=loader.error
+            )
+
+    def set_video(self, video: "Video", content_hash: Optional[str]) -> None:
+        """Replaces the current video and resets the application's state.
+
+        Args:
+            video (Video): The loaded video
+            content_hash (Optional[str]): The content hash of the video, \
+or None if it is unknown
+        """
+        try:
+            self.cancel_tracking()
+            self.cancel_proxy()
+            self.cancel_thumbnails()
+            self.close_session_file()
+            if self.__video is not None:
+                self.__video.stop_prefetching()
+            self.__video = video
+            self.__video.start_prefetching()
+            self.__clock = PlaybackClock(
+                self.__video.frame_duration_ms,
+                self.__view.controls.selected_speed,
+            )
+            self.__session = TrackingSession(
+                self.__video.frame_count, self.__video.timestamps_ms
+            )
+            self.update_objects_menu()
+            self.update_reference_frame()
+            self.__paused = True
+            self.__backwards = False
+            self.reconfigure_view()
+            self.__video.set_display_scale(self.fitting_display_scale())
+            self.__view.menu.display_scale.set(self.__video.display_scale)
+            self.__view.set_canvas_size(
+                self.__video.display_width, self.__video.display_height
+            )
+            self.__view.winfo_toplevel().geometry("")
+            self.__video_hash = content_hash
+            self.start_session_file()
+            self.prepare_proxy()
+            self.start_thumbnails()
+        except ValueError as e:
+            messagebox.showerror(  # pyright: ignore reportUnknownVariableType
+                title="Erreur", message=str(e)
+            )
 
     def save_to_file(self) -> None:
         """Saves points to a file chosen by the user."""
         filename = filedialog.asksaveasfilename(
             confirmoverwrite=True,
             defaultextension=".csv",
+            filetypes=[
+                ("CSV", "*.csv"),
+                ("CSV compressé", "*.csv.gz"),
+                ("Trajectoire binaire", "*.vtrk"),
+            ],
         )
 
         if filename:
             try:
-                point_list, time_list = self.transformed_values()
-                self.__filerepo.export_to_csv(time_list, point_list, filename)
+                binary = str(filename).endswith(".vtrk")
+                if (
+                    binary
+                    and self.__video is not None
+                    and self.__origin is not None
+                    and self.__scale is not None
+                ):
+                    if len(self.__session) > 1:
+                        raise ValueError(
+                            "Le format binaire ne contient qu'un objet, "
+                            "enregistrez plusieurs objets en CSV"
+                        )
+
+                    point_list, time_list = self.transformed_values()
+                    self.__filerepo.export_to_binary(
+                        time_list,
+                        point_list,
+                        filename,
+                        self.__origin,
+                        self.__scale,
+                        1000 / self.__video.frame_duration_ms,
+                        self.__filerepo.content_hash(self.__video.filename),
+                    )
+                else:
+                    _, times, columns = self.__session.table(
+                        self.__mass, *self.smoothing()
+                    )
+                    self.__filerepo.export_table_to_csv(times, columns, filename)
             except ValueError as error:
                 messagebox.showerror("Erreur", str(error))  # type: ignore
 
@@ -86,36 +270,69 @@ the application's state."""
         if self.__video is None:
             return False
 
+        start = self.__profiler.start()
         frame = self.__video.get_frame()
+        self.__profiler.stop("get_frame", start, self.__video.current_frame - 1)
+        return self.show_frame(frame)
+
+    def show_frame(self, frame: Optional[bytes]) -> bool:
+        """Shows a frame read from the video, with the last acquired points.
+
+        Args:
+            frame (Optional[bytes]): The frame as PPM data, or None if it \
+could not be read
+
+        Returns:
+            bool: True if the operation was a success
+        """
+        if self.__video is None:
+            return False
+
         if frame is None:
             self.__paused = True
+            self.reconfigure_controls()
             return False
 
+        frame_index = self.__video.current_frame - 1
+        start = self.__profiler.start()
         self.__view.update_frame(
             frame,
             self.__video.current_frame,
             self.__video.frame_count,
         )
+        self.__profiler.stop("display", start, frame_index)
+        self.__view.timeline.set_position(frame_index)
 
-        self.__view.controls.reconfigure(
-            self.__paused,
-            self.__video.current_frame == self.__video.frame_count,
-            self.__video.current_frame != 1,
-        )
+        self.reconfigure_controls()
 
         show_points = self.__current_mode in (
             EditingMode.VIEWING,
             EditingMode.ACQUIRING,
+            EditingMode.TRACKING,
         )
 
+        start = self.__profiler.start()
+        self.__view.clear_overlay()
         if show_points:
-            for point_index in range(
-                max(self.__video.current_frame - SHOWN_POINTS - 1, 0),
-                self.__video.current_frame,
-            ):
-                point = self.__points[point_index]
-                if point is not None:
-                    self.__view.show_point(point)
+            end = self.__video.current_frame
+            trail_start = max(end - TRAIL_POINTS - 1, 0)
+            scale = self.__video.display_scale
+            for tracked in self.__session:
+                points = tracked.points
+                valid = points.valid[trail_start:end]
+                self.__view.show_trail(
+                    points.x[trail_start:end][valid] * scale,
+                    points.y[trail_start:end][valid] * scale,
+                    tracked.color,
+                )
+
+                for point_index in range(max(end - SHOWN_POINTS - 1, 0), end):
+                    point = points[point_index]
+                    if point is not None:
+                        self.__view.show_point(
+                            self.__video.to_display(point), tracked.color
+                        )
+        self.__profiler.stop("overlay", start, frame_index)
 
         return True
 
@@ -140,9 +357,7 @@ the application's state."""
         if self.__video is None:
             return False
 
-        self.__video.go_back()
-        self.__video.go_back()
-        return self.next_frame()
+        return self.show_frame(self.__video.get_previous_frame())
 
     def last_frame(self) -> bool:
         """Shows the previous frame.
@@ -157,29 +372,78 @@ the application's state."""
         return self.next_frame()
 
     def play_video(self) -> None:
-        """Plays the video normally."""
-        if self.__paused or self.__video is None:
+        """Plays the video normally, or backwards. Frames are scheduled from \
+the time playback started, and frames that are late are dropped."""
+        if self.__paused or self.__video is None or self.__clock is None:
             return
 
-        before = int(perf_counter() * 1000)
-        self.next_frame()
-        after = int(perf_counter() * 1000)
+        # the index of the frame currently shown
+        shown = self.__video.current_frame - 1
+        direction = -1 if self.__backwards else 1
+        due = self.__clock.due_frame()
+        if (due - shown) * direction > 0:
+            if self.__backwards:
+                if shown <= 0:
+                    self.__paused = True
+                    self.reconfigure_controls()
+                    return
 
-        elapsed = after - before
-        delay = max(self.__video.frame_duration_ms - elapsed, 0)
-        self.__view.after(int(delay), self.play_video)
+                target = max(due, 0)
+                dropped = shown - target - 1
+                self.__video.go_to(target + 2)
+                shown_next = self.previous_frame()
+            else:
+                target = min(due, self.__video.frame_count - 1)
+                dropped = target - shown - 1
+                if dropped > 0:
+                    self.__video.skip_frames(dropped)
+                shown_next = self.next_frame()
+
+            if not shown_next:
+                return
+
+            self.__clock.count(max(dropped, 0))
+            self.__view.controls.show_stats(
+                self.__clock.fps, self.__clock.dropped_frames
+            )
+            shown = self.__video.current_frame - 1
+
+        delay = self.__clock.delay_ms(shown + direction)
+        self.__view.after(max(int(delay), 1), self.play_video)
 
-    def toggle_playback(self) -> None:
-        """Toggles playback of the video."""
+    def on_speed_changed(self) -> None:
+        """Changes the playback speed to the one selected by the user."""
+        if self.__clock is not None:
+            self.__clock.set_speed(self.__view.controls.selected_speed)
+
+    def toggle_playback(self, backwards: bool = False) -> None:
+        """Toggles playback of the video. If the video is played in the \
+other direction, the direction is changed instead.
+
+        Args:
+            backwards (bool, optional): Whether the playback direction \
+is backwards. Defaults to False.
+        """
         if self.__video is not None:
-            self.__paused = not self.__paused
-            if not self.__paused:
+            was_paused = self.__paused
+            if self.__paused or self.__backwards == backwards:
+                self.__paused = not self.__paused
+            self.__backwards = backwards
+
+            if was_paused and not self.__paused and self.__clock is not None:
+                self.__clock.start(self.__video.current_frame - 1, backwards)
                 self.play_video()
 
+            self.reconfigure_controls()
+
+    def reconfigure_controls(self) -> None:
+        """Reconfigures the video controls to match the current state."""
+        if self.__video is not None:
             self.__view.controls.reconfigure(
                 self.__paused,
                 self.__video.current_frame == self.__video.frame_count,
-                self.__video.current_frame != 1,
+                self.__video.current_frame > 1,
+                self.__backwards,
             )
 
     def reconfigure_view(self) -> None:
@@ -193,7 +457,11 @@ repacking the widgets, reconfiguring the menu, and updating the canvas's size"""
         self.__view.menu.file_menu.entryconfigure(0, command=self.open_video_file)
         self.__view.menu.file_menu.entryconfigure(1, command=self.toggle_playback)
         self.__view.menu.file_menu.entryconfigure(2, command=self.save_to_file)
-        self.__view.menu.file_menu.entryconfigure(4, command=self.clean_quit)
+        self.__view.menu.file_menu.entryconfigure(3, command=self.on_toggle_proxy)
+        self.__view.menu.file_menu.entryconfigure(5, command=self.export_trace)
+        self.__view.menu.file_menu.entryconfigure(6, command=self.open_session)
+        self.__view.menu.file_menu.entryconfigure(7, command=self.save_session_as)
+        self.__view.menu.file_menu.entryconfigure(9, command=self.clean_quit)
 
         self.__view.menu.acquisition_menu.entryconfigure(
             0,
@@ -207,38 +475,72 @@ repacking the widgets, reconfiguring the menu, and updating the canvas's size"""
             2,
             command=lambda: self.set_mode(EditingMode.DEFINING_SCALE),
         )
+        self.__view.menu.acquisition_menu.entryconfigure(
+            3,
+            command=self.on_toggle_tracking,
+        )
+        self.__view.menu.acquisition_menu.entryconfigure(5, command=self.add_object)
 
         self.__view.menu.show_menu.entryconfigure(
             0,
             command=lambda: self.__view.display_graph(  # type: ignore
-                AxesDisplay.Y_TO_TIME, *self.transformed_values()
+                AxesDisplay.Y_TO_TIME, self.object_values()
             ),
         )
         self.__view.menu.show_menu.entryconfigure(
             1,
             command=lambda: self.__view.display_graph(  # type: ignore
-                AxesDisplay.X_TO_TIME, *self.transformed_values()
+                AxesDisplay.X_TO_TIME, self.object_values()
             ),
         )
         self.__view.menu.show_menu.entryconfigure(
             2,
             command=lambda: self.__view.display_graph(  # type: ignore
-                AxesDisplay.Y_TO_X, *self.transformed_values()
+                AxesDisplay.Y_TO_X, self.object_values()
             ),
         )
         self.__view.menu.show_menu.entryconfigure(
             3,
-            command=lambda: self.__view.display_values(*self.transformed_values()),
+            command=self.show_values,
+        )
+        self.__view.menu.show_menu.entryconfigure(
+            5,
+            command=lambda: self.__view.display_kinematics_graph(  # type: ignore
+                AxesDisplay.SPEED_TO_TIME, self.object_kinematics()
+            ),
         )
+        self.__view.menu.show_menu.entryconfigure(
+            6,
+            command=lambda: self.__view.display_kinematics_graph(  # type: ignore
+                AxesDisplay.ACCELERATION_TO_TIME, self.object_kinematics()
+            ),
+        )
+        self.__view.menu.show_menu.entryconfigure(7, command=self.show_energy_graph)
+        self.__view.menu.show_menu.entryconfigure(
+            8, command=self.schedule_graph_refresh
+        )
+        self.__view.menu.show_menu.entryconfigure(12, command=self.refresh_profile)
+        for index in range(len(DISPLAY_SCALES)):
+            self.__view.menu.display_scale_menu.entryconfigure(
+                index, command=self.on_display_scale_changed
+            )
 
         self.__view.controls.start_button.config(command=self.first_frame)
         self.__view.controls.previous_button.config(command=self.previous_frame)
+        self.__view.controls.reverse_button.config(
+            command=lambda: self.toggle_playback(backwards=True)
+        )
         self.__view.controls.play_button.config(command=self.toggle_playback)
         self.__view.controls.next_button.config(command=self.next_frame)
         self.__view.controls.end_button.config(command=self.last_frame)
+        self.__view.timeline.set_commands(self.on_scrub, self.on_seek)
+        self.__view.controls.speed_box.bind(
+            "<<ComboboxSelected>>", lambda _: self.on_speed_changed()
+        )
 
         # NOTE: the handlers have to be added in this order
         # if not, canvas_click_scale can be triggered after canvas_click_origin for the same click
+        self.__view.canvas.bind("<Button-1>", self.canvas_click_tracking, "+")  # type: ignore
         self.__view.canvas.bind("<Button-1>", self.canvas_click_acquiring, "+")  # type: ignore
         self.__view.canvas.bind("<Button-1>", self.canvas_click_scale, "+")  # type: ignore
         self.__view.canvas.bind("<Button-1>", self.canvas_click_origin, "+")  # type: ignore
@@ -246,8 +548,12 @@ repacking the widgets, reconfiguring the menu, and updating the canvas's size"""
 
         self.__view.winfo_toplevel().bind(
             "<Escape>",
-            lambda _: self.stop_acquisition(),
+            lambda _: self.on_escape(),
+        )
+        self.__view.menu.active_object.trace_add(
+            "write", lambda *_: self.on_object_selected()
         )
+        self.__view.winfo_toplevel().bind("<Tab>", lambda _: self.next_object())
         self.__view.winfo_toplevel().bind(
             "<Control-o>",
             lambda _: self.open_video_file(),
@@ -263,13 +569,24 @@ repacking the widgets, reconfiguring the menu, and updating the canvas's size"""
         Args:
             mode (EditingMode): The new editing mode
         """
+        if mode != EditingMode.TRACKING:
+            self.cancel_tracking()
+
         self.__current_mode = mode
         self.reconfigure_view()
         self.__view.clear_overlay()
 
+    def on_escape(self) -> None:
+        """Cancels the loading of a video if there is one, else stops \
+the acquisition."""
+        if self.__loader is not None:
+            self.cancel_loading()
+        else:
+            self.stop_acquisition()
+
     def stop_acquisition(self) -> None:
-        """Goes back to viewing mode if the app is in acquisition mode."""
-        if self.__current_mode == EditingMode.ACQUIRING:
+        """Goes back to viewing mode if the app is in acquisition or tracking mode."""
+        if self.__current_mode in (EditingMode.ACQUIRING, EditingMode.TRACKING):
             self.set_mode(EditingMode.VIEWING)
 
     def on_toggle_acquisition(self) -> None:
@@ -279,6 +596,296 @@ repacking the widgets, reconfiguring the menu, and updating the canvas's size"""
         elif self.__current_mode == EditingMode.ACQUIRING:
             self.set_mode(EditingMode.VIEWING)
 
+    def on_toggle_tracking(self) -> None:
+        """Switches between viewing and tracking mode."""
+        if self.__current_mode == EditingMode.VIEWING:
+            self.set_mode(EditingMode.TRACKING)
+        elif self.__current_mode == EditingMode.TRACKING:
+            self.set_mode(EditingMode.VIEWING)
+
+    def cancel_tracking(self) -> None:
+        """Stops the tracking worker if it is running."""
+        if self.__tracking_worker is not None:
+            self.__tracking_worker.cancel()
+            self.__tracking_worker = None
+            self.__tracked_object = None
+
+    def update_objects_menu(self) -> None:
+        """Lists the objects of the session in the menu and checks the active one."""
+        self.__view.menu.set_objects(
+            self.__session.names, [tracked.color for tracked in self.__session]
+        )
+        self.__view.menu.active_object.set(self.__session.active.name)
+
+    def add_object(self) -> None:
+        """Adds an object to the session and makes it active, so that its \
+points can be acquired."""
+        tracked = self.__session.add()
+        self.update_objects_menu()
+        self.__view.menu.active_object.set(tracked.name)
+        # journal records refer to objects by position, the snapshot lists them
+        self.save_session()
+
+    def on_object_selected(self) -> None:
+        """Makes the object chosen in the menu active."""
+        name = self.__view.menu.active_object.get()
+        if name and name != self.__session.active.name:
+            try:
+                self.__session.select(name)
+            except KeyError:
+                return
+
+        if len(self.__session) > 1:
+            tracked = self.__session.active
+            self.__view.show_status(f"Objet actif : {tracked.name} ({tracked.color})")
+
+    def next_object(self) -> None:
+        """Makes the object after the active one active, in creation order."""
+        mode = self.__current_mode
+        if self.__video is None or mode not in (
+            EditingMode.VIEWING,
+            EditingMode.ACQUIRING,
+        ):
+            return
+
+        names = self.__session.names
+        position = names.index(self.__session.active.name)
+        self.__view.menu.active_object.set(names[(position + 1) % len(names)])
+
+    def poll_tracking(self) -> None:
+        """Stores the points found by the tracking worker and shows its progress. \
+When tracking stops, shows the last frame where the object was found so that \
+the user can select it again."""
+        worker = self.__tracking_worker
+        if worker is None or self.__video is None:
+            return
+
+        running = worker.running
+        tracked = self.__tracked_object or self.__session.active
+        while not worker.results.empty():
+            index, point = worker.results.get_nowait()
+            if index < len(tracked.points):
+                self.set_point(index, point, tracked)
+
+        if running:
+            self.__view.show_status(
+                f"Suivi en cours : image {worker.last_frame + 1}/{self.__video.frame_count} "
+                f"({worker.fps:.0f} images/s)"
+            )
+            self.__view.after(TRACKING_POLL_MS, self.poll_tracking)
+            return
+
+        self.__tracking_worker = None
+        self.__tracked_object = None
+        self.__view.clear_overlay()
+        lost_frame = worker.lost_frame
+        self.__video.go_to(worker.last_frame if lost_frame is None else lost_frame)
+        self.next_frame()
+        if lost_frame is not None:
+            self.__view.show_status(
+                f"Objet perdu à l'image {lost_frame + 1} "
+                f"({worker.fps:.0f} images/s) : cliquez à nouveau sur l'objet"
+            )
+        else:
+            self.__view.show_status(f"Suivi terminé ({worker.fps:.0f} images/s)")
+
+    def on_toggle_proxy(self) -> None:
+        """Starts creating the proxy of the video when the user enables \
+proxies, or stops creating or using it when they are disabled."""
+        if self.__view.menu.use_proxy.get():
+            self.prepare_proxy()
+            return
+
+        self.cancel_proxy()
+        if self.__video is not None and self.__video.proxy is not None:
+            if self.__video.stop_using_proxy():
+                # the current frame is decoded again from the video
+                self.__video.go_back()
+                self.next_frame()
+
+    def prepare_proxy(self) -> None:
+        """Uses the proxy of the video if it is in the cache, otherwise \
+starts creating it in the background."""
+        video = self.__video
+        content_hash = self.__video_hash
+        enabled = self.__view.menu.use_proxy.get()
+        if not enabled or video is None or video.proxy is not None:
+            return
+
+        if self.__proxy_worker is not None or content_hash is None:
+            return
+
+        try:
+            existing = self.__proxy_cache.lookup(content_hash)
+            if existing is not None:
+                video.use_proxy(str(existing))
+                return
+
+            self.__proxy_worker = ProxyWorker(
+                video.filename,
+                self.__proxy_cache.path_for(content_hash),
+                video.frame_count,
+            )
+        except OSError:
+            return
+
+        self.__proxy_worker.start()
+        self.poll_proxy()
+
+    def cancel_proxy(self) -> None:
+        """Stops creating the proxy if it is being created."""
+        if self.__proxy_worker is not None:
+            self.__proxy_worker.cancel()
+            self.__proxy_worker = None
+            self.__view.show_task("")
+
+    def poll_proxy(self) -> None:
+        """Shows the progress of the proxy and uses it once it is ready."""
+        worker = self.__proxy_worker
+        if worker is None or self.__video is None:
+            return
+
+        if worker.running:
+            self.__view.show_task(
+                f"Création de la copie allégée : {worker.progress:.0%}"
+            )
+            self.__view.after(PROXY_POLL_MS, self.poll_proxy)
+            return
+
+        self.__proxy_worker = None
+        self.__view.show_task("")
+        if worker.succeeded and self.__video.use_proxy(str(worker.destination)):
+            self.__proxy_cache.evict(keep=worker.destination)
+
+    def start_thumbnails(self) -> None:
+        """Shows the cached thumbnails of the video on the timeline and \
+starts rendering the missing ones in a process pool."""
+        self.cancel_thumbnails()
+        video = self.__video
+        if video is None or self.__video_hash is None:
+            return
+
+        width = video.display_width
+        self.__view.timeline.reset(video.frame_count, width)
+        thumbnail_width = max(round(video.width * THUMBNAIL_HEIGHT / video.height), 1)
+        frames = thumbnail_frames(video.frame_count, max(width // thumbnail_width, 1))
+
+        try:
+            self.__thumbnails = ThumbnailCache(self.__video_hash)
+            for frame_index in self.__thumbnails.frames:
+                self.__view.timeline.add_thumbnail(
+                    frame_index, self.__thumbnails.path(frame_index)
+                )
+
+            self.__thumbnail_generator = ThumbnailGenerator(
+                video.filename, self.__thumbnails, frames, os.cpu_count() or 1
+            )
+            self.__thumbnail_generator.start()
+        except OSError:
+            self.__thumbnail_generator = None
+            return
+
+        self.poll_thumbnails()
+
+    def cancel_thumbnails(self) -> None:
+        """Stops rendering thumbnails."""
+        if self.__thumbnail_generator is not None:
+            self.__thumbnail_generator.cancel()
+            self.__thumbnail_generator = None
+
+    def poll_thumbnails(self) -> None:
+        """Shows the thumbnails rendered since the last poll."""
+        generator = self.__thumbnail_generator
+        if generator is None:
+            return
+
+        running = generator.running
+        for frame_index, path in generator.collect():
+            self.__view.timeline.add_thumbnail(frame_index, path)
+
+        if running:
+            self.__view.after(THUMBNAILS_POLL_MS, self.poll_thumbnails)
+        else:
+            self.__thumbnail_generator = None
+            if self.__thumbnails is not None:
+                self.__thumbnails.evict()
+
+    def on_scrub(self, frame_index: int) -> None:
+        """Shows the cached thumbnail closest to the frame under the scrub head.
+
+        Args:
+            frame_index (int): The index (starting at 0) of the frame
+        """
+        if self.__video is None or self.__thumbnails is None:
+            return
+
+        self.__paused = True
+        self.reconfigure_controls()
+        self.__view.show_preview(frame_index, self.__video.frame_count)
+
+    def on_seek(self, frame_index: int) -> None:
+        """Shows the exact frame where the scrub head was released.
+
+        Args:
+            frame_index (int): The index (starting at 0) of the frame
+        """
+        if self.__video is not None:
+            self.__paused = True
+            self.__video.go_to(frame_index)
+            self.next_frame()
+
+    def refresh_profile(self) -> None:
+        """Shows the rolling percentiles of each stage of the frame \
+processing over the video while the option is checked."""
+        if not self.__view.menu.show_profile.get():
+            self.__view.show_profile("")
+            self.__profile_refreshing = False
+            return
+
+        self.__view.show_profile(self.__profiler.summary() or "...")
+        if not self.__profile_refreshing:
+            self.__profile_refreshing = True
+            self.__view.after(PROFILE_REFRESH_MS, self.__refresh_profile_later)
+
+    def __refresh_profile_later(self) -> None:
+        """Refreshes the timings shown over the video periodically."""
+        self.__profile_refreshing = False
+        self.refresh_profile()
+
+    def export_trace(self) -> None:
+        """Saves the timings of the session in the Chrome trace format."""
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("Trace Chrome", "*.json")],
+        )
+        if filename:
+            try:
+                self.__profiler.export_trace(filename)
+            except OSError as error:
+                messagebox.showerror("Erreur", str(error))  # type: ignore
+
+    def canvas_click_tracking(self, event: Event) -> None:  # type: ignore
+        """Handles clicks in the canvas when tracking: starts tracking the \
+clicked object from the current frame.
+
+        Args:
+            event (Event): The click event
+        """
+        tracking = self.__current_mode == EditingMode.TRACKING
+        if tracking and self.__video is not None and self.__tracking_worker is None:
+            from models.tracker import TrackingWorker
+
+            self.__paused = True
+            self.__tracked_object = self.__session.active
+            self.__tracking_worker = TrackingWorker(
+                self.__video.filename,
+                self.__video.current_frame - 1,
+                self.source_point(event),
+                frame_index=self.__video.frame_index,
+            )
+            self.__tracking_worker.start()
+            self.poll_tracking()
+
     def canvas_click_origin(self, event: Event) -> None:  # type: ignore
         """Handles clicks on the canvas when defining the origin.
 
@@ -286,7 +893,8 @@ repacking the widgets, reconfiguring the menu, and updating the canvas's size"""
             event (Event): The click event
         """
         if self.__current_mode == EditingMode.DEFINING_ORIGIN:
-            self.__origin = Point(event.x, event.y)
+            self.__origin = self.source_point(event)
+            self.update_reference_frame()
             if self.__scale is None:
                 self.set_mode(EditingMode.DEFINING_SCALE)
             else:
@@ -299,7 +907,7 @@ repacking the widgets, reconfiguring the menu, and updating the canvas's size"""
             event (Event): The click event
         """
         if self.__current_mode == EditingMode.DEFINING_SCALE:
-            clicked_point = Point(event.x, event.y)
+            clicked_point = self.source_point(event)
             if self.__scale_start is None:
                 self.__scale_start = clicked_point
             else:
@@ -308,6 +916,7 @@ repacking the widgets, reconfiguring the menu, and updating the canvas's size"""
                 real_distance = self.__view.ask_for_distance()
                 if real_distance is not None:
                     self.__scale = distance / real_distance
+                    self.update_reference_frame()
                     self.__scale_start = None
                     self.set_mode(EditingMode.VIEWING)
 
@@ -318,7 +927,7 @@ repacking the widgets, reconfiguring the menu, and updating the canvas's size"""
             event (Event): The click event
         """
         if self.__current_mode == EditingMode.ACQUIRING and self.__video is not None:
-            self.__points[self.__video.current_frame - 1] = Point(event.x, event.y)
+            self.set_point(self.__video.current_frame - 1, self.source_point(event))
             if not self.next_frame():
                 self.stop_acquisition()
 
@@ -331,37 +940,377 @@ repacking the widgets, reconfiguring the menu, and updating the canvas's size"""
         show_scale = self.__current_mode == EditingMode.DEFINING_SCALE
         if show_scale and self.__scale_start is not None:
             self.__view.clear_overlay()
-            self.__view.show_point(self.__scale_start)
-            mouse_position = Point(event.x, event.y)
+            self.__view.show_point(self.display_point(self.__scale_start))
+            mouse_position = self.source_point(event)
             self.__view.show_line(
-                self.__scale_start,
-                Coordinates.horiz_vert(self.__scale_start, mouse_position),
+                self.display_point(self.__scale_start),
+                self.display_point(
+                    Coordinates.horiz_vert(self.__scale_start, mouse_position)
+                ),
             )
 
-    def transformed_values(self) -> Tuple[List[Point], List[float]]:
-        """Returns the transformed points and their corresponding time in the video.
+    def source_point(self, event: Event) -> Point:  # type: ignore
+        """Returns the point of the video under the mouse, in video pixels \
+even if the frames are displayed smaller.
+
+        Args:
+            event (Event): A mouse event on the canvas
+
+        Returns:
+            Point: The point in the video
+        """
+        point = Point(event.x, event.y)
+        if self.__video is None:
+            return point
+
+        return self.__video.to_source(point)
+
+    def display_point(self, point: Point) -> Point:
+        """Returns where a point of the video is drawn on the canvas.
+
+        Args:
+            point (Point): The point in video pixels
 
         Returns:
-            Tuple[List[Point], List[float]]: A list of transformed points and a list \
-of times in milliseconds. The lists are empty if there is no video, origin or scale.
+            Point: The point in canvas pixels
+        """
+        if self.__video is None:
+            return point
+
+        return self.__video.to_display(point)
+
+    def fitting_display_scale(self) -> float:
+        """Returns the largest display scale at which the video fits on the screen.
+
+        Returns:
+            float: The display scale
+        """
+        if self.__video is None:
+            return 1.0
+
+        max_width, max_height = self.__view.max_canvas_size()
+        for scale in DISPLAY_SCALES:
+            width = self.__video.width * scale
+            height = self.__video.height * scale
+            if width <= max_width and height <= max_height:
+                return scale
+
+        return DISPLAY_SCALES[-1]
+
+    def on_display_scale_changed(self) -> None:
+        """Shows the frames at the display scale selected by the user."""
+        if self.__video is None:
+            return
+
+        self.__video.set_display_scale(self.__view.menu.display_scale.get())
+        self.__view.set_canvas_size(
+            self.__video.display_width, self.__video.display_height
+        )
+        self.__view.winfo_toplevel().geometry("")
+        self.start_thumbnails()
+
+        # the current frame is decoded again at the new size
+        self.__video.go_back()
+        self.next_frame()
+
+    def set_point(
+        self,
+        index: int,
+        point: Optional[Point],
+        tracked: Optional[TrackedObject] = None,
+    ) -> None:
+        """Sets the point of a frame and transforms it again.
+
+        Args:
+            index (int): The index (starting at 0) of the frame
+            point (Optional[Point]): The point, or None to remove it
+            tracked (Optional[TrackedObject], optional): The object of \
+the point, or None for the active object. Defaults to None.
         """
-        if self.__video is None or self.__origin is None or self.__scale is None:
-            return [], []  # allows us to unpack safely
-
-        time = [
-            i * self.__video.frame_duration_ms
-            for i, point in enumerate(self.__points)
-            if point is not None
-        ]
-
-        points = [
-            Coordinates.scaled(
-                Coordinates.relative_to_origin(self.__origin, point),
-                1 / self.__scale,
-                1 / self.__scale,
+        tracked = tracked or self.__session.active
+        tracked.set_point(index, point)
+        self.schedule_graph_refresh()
+
+        if self.__session_file is not None:
+            try:
+                position = self.__session.position(tracked.name)
+                if self.__session_file.append(position, index, point):
+                    self.save_session()
+            except OSError:
+                self.stop_autosave()
+
+    def update_reference_frame(self) -> None:
+        """Gives the current origin and scale to the transformed values cache, \
+which transforms every point again the next time they are needed."""
+        if self.__origin is None or self.__scale is None:
+            self.__session.set_reference_frame(None)
+        else:
+            self.__session.set_reference_frame(
+                ReferenceFrame(self.__origin, self.__scale)
             )
-            for point in self.__points
-            if point is not None
-        ]
+        self.schedule_graph_refresh()
+        self.save_session()
+
+    def transformed_values(self) -> Tuple[TrajectoryStore, np.ndarray]:
+        """Returns the transformed points of the active object and their \
+corresponding time in the video. Only the points changed since the last \
+call are transformed again.
+
+        Returns:
+            Tuple[TrajectoryStore, ndarray]: The transformed points and an array \
+of times in milliseconds. Both are empty if there is no video, origin or scale.
+        """
+        if self.__video is None:
+            return TrajectoryStore(), np.zeros(0)  # allows us to unpack safely
+
+        return self.__session.active.values()
+
+    def object_values(self) -> Dict[str, Tuple[TrajectoryStore, np.ndarray]]:
+        """Returns the transformed points and their times of every object \
+(see Controller.transformed_values).
+
+        Returns:
+            Dict[str, Tuple[TrajectoryStore, ndarray]]: The values of each \
+object, by name
+        """
+        if self.__video is None:
+            return {}
+
+        return {tracked.name: tracked.values() for tracked in self.__session}
+
+    def smoothing(self) -> Tuple[int, int]:
+        """Returns how the positions are smoothed before differentiating.
+
+        Returns:
+            Tuple[int, int]: The window of the Savitzky-Golay filter, 0 if \
+the user did not ask for smoothing, and its order
+        """
+        smoothing = bool(self.__view.menu.smoothing.get())
+        return SMOOTHING_WINDOW if smoothing else 0, SMOOTHING_ORDER
+
+    def object_kinematics(self) -> Dict[str, Kinematics]:
+        """Returns the velocity, acceleration and energy of every object, \
+smoothed if the user asked for it. Objects whose points did not change \
+are not computed again.
+
+        Returns:
+            Dict[str, Kinematics]: The kinematics of each object, by name
+        """
+        smoothing = self.smoothing()
+        return {
+            tracked.name: tracked.kinematics(*smoothing) for tracked in self.__session
+        }
+
+    def show_values(self) -> None:
+        """Shows the transformed values of every object in a table, clicking \
+a row shows its frame."""
+        frames, times, columns = self.__session.table(kinematics=False)
+        self.__view.display_values(times, columns, frames, self.on_seek)
+
+    def schedule_graph_refresh(self) -> None:
+        """Updates the shown graph soon, once for all the points changed \
+in the meantime (while tracking for example)."""
+        if not self.__graph_refresh_pending and self.__view.graph_mode is not None:
+            self.__graph_refresh_pending = True
+            self.__view.after(GRAPH_REFRESH_MS, self.refresh_graph)
+
+    def refresh_graph(self) -> None:
+        """Updates the points of the shown graph."""
+        self.__graph_refresh_pending = False
+        mode = self.__view.graph_mode
+        if mode is None:
+            return
+
+        if mode in (AxesDisplay.Y_TO_TIME, AxesDisplay.X_TO_TIME, AxesDisplay.Y_TO_X):
+            self.__view.display_graph(mode, self.object_values(), update=True)
+        else:
+            self.__view.display_kinematics_graph(
+                mode, self.object_kinematics(), self.__mass or 1.0, update=True
+            )
+
+    def show_energy_graph(self) -> None:
+        """Asks the user for the mass of the object, then shows its energies."""
+        mass = self.__view.ask_for_mass(self.__mass)
+        if mass is not None:
+            self.__mass = mass
+            self.save_session()
+            self.__view.display_kinematics_graph(
+                AxesDisplay.ENERGY_TO_TIME, self.object_kinematics(), mass
+            )
+
+    def snapshot(self) -> Optional[SessionSnapshot]:
+        """Returns the current state of the session, which shares the points \
+of the objects.
+
+        Returns:
+            Optional[SessionSnapshot]: The state, or None if there is no video
+        """
+        if self.__video is None:
+            return None
+
+        return SessionSnapshot(
+            os.path.abspath(self.__video.filename),
+            self.__video_hash,
+            self.__video.frame_count,
+            {tracked.name: tracked.points for tracked in self.__session},
+            self.__session.active.name,
+            self.__origin,
+            self.__scale,
+            self.__mass,
+        )
+
+    def save_session(self) -> None:
+        """Compacts the journal of the session file into a new snapshot."""
+        snapshot = self.snapshot()
+        if self.__session_file is None or snapshot is None:
+            return
+
+        try:
+            self.__session_file.save(snapshot)
+        except OSError:
+            self.stop_autosave()
+
+    def stop_autosave(self) -> None:
+        """Stops saving the session after the session file could not be written."""
+        session_file, self.__session_file = self.__session_file, None
+        if session_file is not None:
+            session_file.close()
+        self.__view.show_status("Enregistrement automatique de la session impossible")
+
+    def close_session_file(self) -> None:
+        """Compacts and closes the session file, which is kept to restore \
+the session later."""
+        self.save_session()
+        if self.__session_file is not None:
+            self.__session_file.close()
+            self.__session_file = None
+
+    def start_session_file(self) -> None:
+        """Restores the session being opened, or the session saved \
+automatically for the video if the user wants to, then shows the last frame \
+with a point, or the first frame. Edits are saved from now on."""
+        pending, self.__pending_session = self.__pending_session, None
+        session_file = None
+        snapshot = None
+        if pending is not None and pending[1].video_hash in (None, self.__video_hash):
+            session_file, snapshot = pending
+        elif pending is not None:
+            messagebox.showerror(  # pyright: ignore reportUnknownVariableType
+                title="Erreur",
+                message="La vidéo a changé depuis l'enregistrement de la session",
+            )
+
+        restored = True
+        if session_file is None and self.__video_hash is not None:
+            session_file = SessionFile(default_session_path(self.__video_hash))
+            message = "Une session a été enregistrée automatiquement pour cette vidéo. Voulez-vous la restaurer ?"
+            if session_file.exists() and messagebox.askyesno("Restaurer la session", message):  # type: ignore
+                try:
+                    snapshot = session_file.load()
+                except (OSError, ValueError) as error:
+                    messagebox.showerror("Erreur", str(error))  # type: ignore
+                    restored = False
+
+        last_frame = None
+        if snapshot is not None:
+            try:
+                last_frame = self.restore_session(snapshot)
+            except ValueError as error:
+                messagebox.showerror("Erreur", str(error))  # type: ignore
+                restored = False
+
+        if not restored and session_file is not None:
+            # the file is left as is so that it can still be restored, the new
+            # session is saved automatically elsewhere if possible
+            failed, session_file = session_file.path, None
+            if self.__video_hash is not None:
+                session_file = SessionFile(default_session_path(self.__video_hash))
+                if session_file.path == failed:
+                    session_file = None
+            if session_file is None:
+                self.__view.show_status(
+                    "Session non restaurée, enregistrement automatique désactivé"
+                )
+
+        self.__session_file = session_file
+        self.save_session()
+
+        if last_frame is not None and self.__video is not None:
+            self.__video.go_to(last_frame)
+        self.next_frame()
+
+    def restore_session(self, snapshot: SessionSnapshot) -> Optional[int]:
+        """Replaces the objects, the reference frame and the mass with \
+the ones of a saved session.
+
+        Args:
+            snapshot (SessionSnapshot): The saved session
+
+        Raises:
+            ValueError: The session does not match the frames of the video
+
+        Returns:
+            Optional[int]: The index of the last frame with a point, or None
+        """
+        if self.__video is None:
+            return None
+
+        self.__session = TrackingSession.from_snapshot(
+            snapshot, self.__video.frame_count, self.__video.timestamps_ms
+        )
+        self.__origin = snapshot.origin
+        self.__scale = snapshot.scale
+        self.__mass = snapshot.mass
+        self.update_objects_menu()
+        self.update_reference_frame()
+        if self.__origin is not None and self.__scale is not None:
+            self.set_mode(EditingMode.VIEWING)
+        elif self.__origin is not None:
+            self.set_mode(EditingMode.DEFINING_SCALE)
+
+        return snapshot.last_frame
+
+    def open_session(self) -> None:
+        """Asks the user for a session file, then loads its video and \
+restores the session once the video is loaded."""
+        message = "Si vous ouvrez une session, vous perdrez les modifications non enregistrées. Êtes vous sûr de vouloir ouvrir une session ?"
+        if self.__video is not None and not messagebox.askokcancel("Ouvrir une session", message):  # type: ignore
+            return
+
+        filename = filedialog.askopenfilename(
+            filetypes=[("Session", f"*{SESSION_EXTENSION}")]
+        )
+        if not filename:
+            return
+
+        session_file = SessionFile(filename)
+        try:
+            snapshot = session_file.load()
+        except (OSError, ValueError) as error:
+            messagebox.showerror("Erreur", str(error))  # type: ignore
+            return
+
+        if not Path(snapshot.video_path).is_file():
+            messagebox.showerror(  # pyright: ignore reportUnknownVariableType
+                title="Erreur",
+                message=f"Vidéo introuvable : {snapshot.video_path}",
+            )
+            return
+
+        self.load_video(snapshot.video_path)
+        self.__pending_session = (session_file, snapshot)
+
+    def save_session_as(self) -> None:
+        """Saves the session in a file chosen by the user, where it is saved \
+automatically from now on."""
+        filename = filedialog.asksaveasfilename(
+            confirmoverwrite=True,
+            defaultextension=SESSION_EXTENSION,
+            filetypes=[("Session", f"*{SESSION_EXTENSION}")],
+        )
+        if not filename:
+            return
 
-        return points, time
+        self.close_session_file()
+        self.__session_file = SessionFile(filename)
+        self.save_session()
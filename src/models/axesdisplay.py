@@ -7,3 +7,6 @@ class AxesDisplay(Enum):
     Y_TO_TIME = 0
     X_TO_TIME = 1
     Y_TO_X = 2
+    SPEED_TO_TIME = 3
+    ACCELERATION_TO_TIME = 4
+    ENERGY_TO_TIME = 5
@@ -1,10 +1,14 @@
 from math import sqrt
+from typing import Tuple
+
+import numpy as np
 
 from .point import Point
 
 
 class Coordinates:
-    """Operations on coordinates."""
+    """Operations on coordinates. The methods ending with _batch work on \
+arrays of coordinates at once."""
 
     @staticmethod
     def translated(point: Point, x_offset: float, y_offset: float) -> Point:
@@ -81,3 +85,68 @@ where as the y-axis used for the resulting point is pointing up.
             Point: The resulting point
         """
         return Point(point.x - origin.x, origin.y - point.y)
+
+    @staticmethod
+    def translated_batch(
+        x: np.ndarray, y: np.ndarray, x_offset: float, y_offset: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Translates points by a certain amount.
+
+        Args:
+            x (ndarray): The x coordinates of the points
+            y (ndarray): The y coordinates of the points
+            x_offset (float): The offset for the x coordinates
+            y_offset (float): The offset for the y coordinates
+
+        Returns:
+            Tuple[ndarray, ndarray]: The coordinates of the translated points
+        """
+        return x + x_offset, y + y_offset
+
+    @staticmethod
+    def scaled_batch(
+        x: np.ndarray, y: np.ndarray, x_factor: float, y_factor: float
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Scales points' coordinates by a certain amount.
+
+        Args:
+            x (ndarray): The x coordinates of the points
+            y (ndarray): The y coordinates of the points
+            x_factor (float): The factor for the x coordinates
+            y_factor (float): The factor for the y coordinates
+
+        Returns:
+            Tuple[ndarray, ndarray]: The coordinates of the scaled points
+        """
+        return x * x_factor, y * y_factor
+
+    @staticmethod
+    def distance_batch(point: Point, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Returns the distances between a point and other points.
+
+        Args:
+            point (Point)
+            x (ndarray): The x coordinates of the other points
+            y (ndarray): The y coordinates of the other points
+
+        Returns:
+            ndarray
+        """
+        return np.hypot(x - point.x, y - point.y)
+
+    @staticmethod
+    def relative_to_origin_batch(
+        origin: Point, x: np.ndarray, y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Transforms points using canvas coordinates to points with \
+coordinates relative to another point (see Coordinates.relative_to_origin).
+
+        Args:
+            origin (Point): The origin
+            x (ndarray): The x coordinates of the initial points
+            y (ndarray): The y coordinates of the initial points
+
+        Returns:
+            Tuple[ndarray, ndarray]: The coordinates of the resulting points
+        """
+        return x - origin.x, origin.y - y
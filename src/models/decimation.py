@@ -0,0 +1,185 @@
+from typing import Tuple
+
+import numpy as np
+
+
+def minmax(x: np.ndarray, y: np.ndarray, buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Decimates a series by keeping the lowest and highest value of each \
+bucket of consecutive values, which keeps the spikes of a time series. NaN \
+values are ignored, unless a whole bucket is NaN, so gaps stay visible.
+
+    Args:
+        x (ndarray): The abscissas
+        y (ndarray): The values, as many as the abscissas
+        buckets (int): The amount of buckets, at most two values are kept \
+for each of them
+
+    Returns:
+        Tuple[ndarray, ndarray]: The kept abscissas and values, in their \
+original order. The series itself if it is already small enough.
+    """
+    count = len(y)
+    if buckets < 1 or count <= 2 * buckets:
+        return x, y
+
+    starts = np.linspace(0, count, buckets + 1).astype(np.int64)[:-1]
+    bucket_of = np.repeat(np.arange(buckets), np.diff(np.append(starts, count)))
+    nan = np.isnan(y)
+    low = np.where(nan, np.inf, y)
+    high = np.where(nan, -np.inf, y)
+
+    def first_matches(values: np.ndarray, extremes: np.ndarray) -> np.ndarray:
+        """Returns the first position of the extreme of each bucket."""
+        matches = np.flatnonzero(values == extremes[bucket_of])
+        _, first = np.unique(bucket_of[matches], return_index=True)
+        return matches[first]
+
+    kept = np.union1d(
+        first_matches(low, np.minimum.reduceat(low, starts)),
+        first_matches(high, np.maximum.reduceat(high, starts)),
+    )
+    return x[kept], y[kept]
+
+
+def lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Decimates a series with the Largest Triangle Three Buckets algorithm: \
+the first and last points are kept, and in each bucket of consecutive points \
+in between, the point forming the largest triangle with the point kept in \
+the previous bucket and the mean of the next bucket. The shape of the series \
+is kept better than by taking every n-th point. Points are taken in order, \
+so the abscissas do not need to be sorted (for a trajectory y(x) for example).
+
+    Args:
+        x (ndarray): The abscissas, without NaN
+        y (ndarray): The values, as many as the abscissas, without NaN
+        threshold (int): The amount of kept points, at least 3
+
+    Returns:
+        Tuple[ndarray, ndarray]: The kept abscissas and values, in their \
+original order. The series itself if it is already small enough.
+    """
+    count = len(y)
+    if threshold < 3 or count <= threshold:
+        return x, y
+
+    # the first and last points are buckets of their own
+    edges = np.linspace(1, count - 1, threshold - 1).astype(np.int64)
+    kept = np.empty(threshold, dtype=np.int64)
+    kept[0] = 0
+    kept[-1] = count - 1
+
+    previous = 0
+    for bucket in range(threshold - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < len(edges) else count
+        next_x = x[end:next_end].mean()
+        next_y = y[end:next_end].mean()
+
+        # twice the area of the triangles, the factor does not change the maximum
+        areas = np.abs(
+            (x[previous] - next_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (next_y - y[previous])
+        )
+        previous = start + int(np.argmax(areas))
+        kept[bucket + 1] = previous
+
+    return x[kept], y[kept]
+
+
+class MinMaxDecimator:
+    """Decimates a series that changes over time like minmax, but only \
+decimates again the buckets from the first value that changed since the \
+last update, so that appending values does not decimate the whole series \
+again. Buckets have a fixed amount of values, doubled (and every bucket \
+decimated again) when there are too many of them, which happens less and \
+less often as the series grows.
+
+    Args:
+        buckets (int): The maximum amount of buckets, at most two values \
+are kept for each of them
+    """
+
+    def __init__(self, buckets: int) -> None:
+        self.__buckets = max(buckets, 1)
+        # the amount of values in each bucket
+        self.__size = 0
+        # copies of the last series, to find the first value that changed
+        self.__x = np.zeros(0)
+        self.__y = np.zeros(0)
+        self.__count = 0
+        # the position of the lowest and highest value of each bucket
+        self.__low = np.zeros(0, dtype=np.int64)
+        self.__high = np.zeros(0, dtype=np.int64)
+
+    def update(self, x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Decimates the new state of the series.
+
+        Args:
+            x (ndarray): The abscissas
+            y (ndarray): The values, as many as the abscissas
+
+        Returns:
+            Tuple[ndarray, ndarray]: The kept abscissas and values, in their \
+original order. The series itself if it is already small enough.
+        """
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        count = len(y)
+        start = self.__first_change(x, y)
+        self.__store(x, y, start)
+
+        # the smallest power of two giving few enough buckets
+        size = max(2, 1 << (-(-count // self.__buckets) - 1).bit_length())
+        if size != self.__size:
+            self.__size = size
+            start = 0
+        self.__decimate(start // size)
+
+        if count <= 2 * self.__buckets:
+            return x, y
+
+        kept = np.union1d(self.__low, self.__high)
+        return self.__x[kept], self.__y[kept]
+
+    def __first_change(self, x: np.ndarray, y: np.ndarray) -> int:
+        """Returns the position of the first value that is not the same \
+as in the last series. Values are compared bit by bit, so NaN values are \
+equal to themselves."""
+        common = min(len(y), self.__count)
+        changed = np.flatnonzero(
+            (x[:common].view(np.int64) != self.__x[:common].view(np.int64))
+            | (y[:common].view(np.int64) != self.__y[:common].view(np.int64))
+        )
+        return int(changed[0]) if len(changed) else common
+
+    def __store(self, x: np.ndarray, y: np.ndarray, start: int) -> None:
+        """Copies the values from a position on, the copies being enlarged \
+by doubling their capacity."""
+        count = len(y)
+        if count > len(self.__y):
+            capacity = max(count, 2 * len(self.__y))
+            enlarged_x, enlarged_y = np.empty(capacity), np.empty(capacity)
+            enlarged_x[:start] = self.__x[:start]
+            enlarged_y[:start] = self.__y[:start]
+            self.__x, self.__y = enlarged_x, enlarged_y
+
+        self.__x[start:count] = x[start:]
+        self.__y[start:count] = y[start:]
+        self.__count = count
+
+    def __decimate(self, first: int) -> None:
+        """Finds the extremes of the buckets from a bucket on, the last \
+bucket being completed with NaN values."""
+        size = self.__size
+        total = -(-self.__count // size)
+        values = np.full((total - first) * size, np.nan)
+        values[: self.__count - first * size] = self.__y[first * size : self.__count]
+        values = values.reshape(-1, size)
+        nan = np.isnan(values)
+        # fully NaN buckets keep their first value, so gaps stay visible
+        offsets = np.arange(first, total, dtype=np.int64) * size
+        low = offsets + np.argmin(np.where(nan, np.inf, values), axis=1)
+        high = offsets + np.argmax(np.where(nan, -np.inf, values), axis=1)
+
+        self.__low = np.concatenate((self.__low[:first], low))
+        self.__high = np.concatenate((self.__high[:first], high))
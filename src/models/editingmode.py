@@ -4,9 +4,11 @@ from enum import Enum
 class EditingMode(Enum):
     """Represents an application state. VIEWING is used \
 when the user is not defining the origin or scale and is \
-not acquiring."""
+not acquiring. TRACKING is used when points are acquired \
+automatically from an object selected by the user."""
 
     VIEWING = 0
     ACQUIRING = 1
     DEFINING_ORIGIN = 2
     DEFINING_SCALE = 3
+    TRACKING = 4
@@ -1,27 +1,56 @@
+import csv
+import gzip
+import hashlib
+import struct
+from collections.abc import Sized
+from itertools import chain, islice
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from .point import Point
+from .trajectoryheader import TrajectoryHeader
+from .trajectorystore import TrajectoryStore
+
+CHUNK_ROWS = 8192
+
+# magic, version, count, origin x and y, scale, fps, video hash
+BINARY_MAGIC = b"VTRK"
+BINARY_VERSION = 1
+BINARY_HEADER = struct.Struct("<4sHxxQdddd32s")
+# the columns start on a round offset so that they can be mapped efficiently
+BINARY_HEADER_SIZE = 128
+
+HASH_BLOCK_SIZE = 1024 * 1024
 
 
 class FileRepo:
-    """Provides methods to save acquired data in CSV files."""
+    """Provides methods to save acquired data in CSV or binary files and \
+to read points clicked outside of the application."""
 
     def transform_data_to_csv(
         self,
-        time: List[float],
-        points: List[Point],
+        time: Iterable[float],
+        points: Iterable[Point] | TrajectoryStore,
         sep: str = ",",
+        float_format: str = "",
+        columns: Optional[Dict[str, Sequence[float]]] = None,
     ) -> str:
         """
         Transforms data acquired by the user into a CSV-formatted string \
 with 3 columns named time, x and y.
 
         Args:
-            time (List[float]): A list of floats representing the time \
-elapsed since the start of the video (in seconds)
-            points (List[Point]): A list of points
+            time (Iterable[float]): The time elapsed since the start of the video \
+(in seconds) for each point
+            points (Iterable[Point] | TrajectoryStore): The points
             sep (str): The separator used ("," by default)
+            float_format (str, optional): The format specification of the values, \
+for example ".3f" (the shortest representation by default)
+            columns (Optional[Dict[str, Sequence[float]]], optional): Extra \
+columns written after y, with one value per written point. NaN values are \
+left empty. Defaults to None.
 
         Raises:
             ValueError: No points to transform
@@ -30,41 +59,477 @@ elapsed since the start of the video (in seconds)
         Returns:
             str: The CSV string representing the input data
         """
-        nb_points = len(points)
-        if nb_points == 0:
+        return "".join(
+            self.csv_chunks(time, points, sep, float_format, columns=columns)
+        )
+
+    def csv_chunks(
+        self,
+        time: Iterable[float],
+        points: Iterable[Point] | TrajectoryStore,
+        sep: str = ",",
+        float_format: str = "",
+        chunk_rows: int = CHUNK_ROWS,
+        columns: Optional[Dict[str, Sequence[float]]] = None,
+    ) -> Iterator[str]:
+        """
+        Transforms data acquired by the user into CSV-formatted strings \
+with 3 columns named time, x and y, a chunk of rows at a time. The first \
+chunk is the header.
+
+        NOTE: When the arguments have no length (generators for example), \
+different lengths are only detected once the shortest one is exhausted.
+
+        Args:
+            time (Iterable[float]): The time elapsed since the start of the video \
+(in seconds) for each point
+            points (Iterable[Point] | TrajectoryStore): The points. Frames without \
+a point are skipped if a store is given, along with their time.
+            sep (str, optional): The separator used ("," by default)
+            float_format (str, optional): The format specification of the values, \
+for example ".3f" (the shortest representation by default)
+            chunk_rows (int, optional): The amount of rows in a chunk. \
+Defaults to CHUNK_ROWS.
+            columns (Optional[Dict[str, Sequence[float]]], optional): Extra \
+columns written after y, with one value per written point. NaN values are \
+left empty. Defaults to None.
+
+        Raises:
+            ValueError: No points to transform
+            ValueError: 'time' and 'points' have different lengths
+            ValueError: The extra columns and the points have different lengths
+
+        Returns:
+            Iterator[str]: The chunks, which can be joined to get the CSV string
+        """
+        extra = {} if columns is None else columns
+        chunks = self.__column_chunks(time, points, chunk_rows)
+        first = next(chunks, None)
+        if first is None:
             raise ValueError("No points to transform")
 
-        if len(time) != nb_points:
+        chunks = chain([first], chunks)
+        names = ["temps", "x", "y"]
+        if extra:
+            names.extend(extra)
+            chunks = self.__extra_chunks(chunks, extra)
+
+        return self.__format_rows(names, chunks, sep, float_format)
+
+    def __column_chunks(
+        self,
+        time: Iterable[float],
+        points: Iterable[Point] | TrajectoryStore,
+        chunk_rows: int,
+    ) -> Iterator[Tuple[List[float], List[float], List[float]]]:
+        """Splits the time and the coordinates in chunks of rows.
+
+        Raises:
+            ValueError: No points to transform
+            ValueError: 'time' and 'points' have different lengths
+        """
+        self.__check_lengths(time, points)
+        if isinstance(points, TrajectoryStore):
+            times, x_values, y_values = self.__column_arrays(time, points)
+            for start in range(0, len(times), chunk_rows):
+                end = start + chunk_rows
+                yield (
+                    times[start:end].tolist(),
+                    x_values[start:end].tolist(),
+                    y_values[start:end].tolist(),
+                )
+            return
+
+        rows = zip(time, points, strict=True)
+        try:
+            chunk = list(islice(rows, chunk_rows))
+            while chunk:
+                yield (
+                    [instant for instant, _ in chunk],
+                    [point.x for _, point in chunk],
+                    [point.y for _, point in chunk],
+                )
+                chunk = list(islice(rows, chunk_rows))
+        except ValueError:
             raise ValueError("'time' and 'points' have different lengths")
 
-        csv = f"temps{sep}x{sep}y"
-        for instant, point in zip(time, points):
-            csv += f"\n{instant}{sep}{point.x}{sep}{point.y}"
+    def __check_lengths(
+        self, time: Iterable[float], points: Iterable[Point] | TrajectoryStore
+    ) -> None:
+        """Checks the lengths of the arguments, if they have one.
 
-        return csv
+        Raises:
+            ValueError: No points to transform
+            ValueError: 'time' and 'points' have different lengths
+        """
+        if isinstance(points, Sized) and isinstance(time, Sized):
+            if len(points) == 0:
+                raise ValueError("No points to transform")
+
+            if len(time) != len(points):
+                raise ValueError("'time' and 'points' have different lengths")
+
+    def __column_arrays(
+        self, time: Iterable[float], points: Iterable[Point] | TrajectoryStore
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Returns the time and the coordinates as arrays.
+
+        Raises:
+            ValueError: No points to transform
+            ValueError: 'time' and 'points' have different lengths
+        """
+        self.__check_lengths(time, points)
+        if isinstance(points, TrajectoryStore):
+            valid = points.valid
+            return np.asarray(time)[valid], points.x[valid], points.y[valid]
+
+        chunks = list(self.__column_chunks(time, points, CHUNK_ROWS))
+        return (
+            np.array([value for chunk in chunks for value in chunk[0]], dtype=float),
+            np.array([value for chunk in chunks for value in chunk[1]], dtype=float),
+            np.array([value for chunk in chunks for value in chunk[2]], dtype=float),
+        )
+
+    def __extra_chunks(
+        self,
+        columns: Iterator[Sequence[List[float]]],
+        extra: Dict[str, Sequence[float]],
+    ) -> Iterator[List[List[float]]]:
+        """Adds the matching part of extra columns to chunks of columns.
+
+        Raises:
+            ValueError: The extra columns and the points have different lengths
+        """
+        values = [np.asarray(column, dtype=np.float64) for column in extra.values()]
+        length = len(values[0])
+        if any(len(column) != length for column in values):
+            raise ValueError("The extra columns have different lengths")
+
+        start = 0
+        for chunk in columns:
+            end = start + len(chunk[0])
+            if end > length:
+                break
+
+            yield [*chunk, *(column[start:end].tolist() for column in values)]
+            start = end
+
+        if start != length:
+            raise ValueError("The extra columns and the points have different lengths")
+
+    def __format_rows(
+        self,
+        names: List[str],
+        columns: Iterable[Sequence[List[float]]],
+        sep: str,
+        float_format: str,
+    ) -> Iterator[str]:
+        """Formats chunks of columns as rows, after a header. NaN values \
+are left empty."""
+        row = "\n" + sep.join(f"{{:{float_format}}}" for _ in names)
+        yield sep.join(names)
+        for chunk in columns:
+            text = "".join(row.format(*values) for values in zip(*chunk))
+            # formatted numbers never contain "nan", so it only comes from NaN values
+            yield text.replace("nan", "") if "nan" in text else text
+
+    def __write_chunks(
+        self, chunks: Iterable[str], filepath: str | Path, compress: Optional[bool]
+    ) -> None:
+        """Writes CSV chunks to a text file, compressed with gzip if asked \
+or if its name ends with ".gz" when 'compress' is None."""
+        if compress is None:
+            compress = str(filepath).endswith(".gz")
+
+        if compress:
+            file = gzip.open(filepath, "wt", encoding="utf-8")
+        else:
+            file = open(filepath, "w", encoding="utf-8")
+
+        with file:
+            file.writelines(chunks)
 
     def export_to_csv(
         self,
-        time: List[float],
-        points: List[Point],
+        time: Iterable[float],
+        points: Iterable[Point] | TrajectoryStore,
         filepath: str | Path,
         sep: str = ",",
+        float_format: str = "",
+        compress: Optional[bool] = None,
+        columns: Optional[Dict[str, Sequence[float]]] = None,
     ) -> None:
         """
         Saves data acquired by the user in a CSV file with 3 columns \
-named time, x and y.
+named time, x and y. Rows are written a chunk at a time, so the whole \
+file is never held in memory.
 
         Args:
-            time (List[float]): A list of floats representing the time \
-elapsed since the start of the video (in seconds)
-            points (List[Point]): A list of points
+            time (Iterable[float]): The time elapsed since the start of the video \
+(in seconds) for each point
+            points (Iterable[Point] | TrajectoryStore): The points
             filepath (str | Path): The path of the file
             sep (str, optional): The separator used ("," by default)
+            float_format (str, optional): The format specification of the values, \
+for example ".3f" (the shortest representation by default)
+            compress (Optional[bool], optional): Whether the file is compressed \
+with gzip, or None to compress it if its name ends with ".gz". Defaults to None.
+            columns (Optional[Dict[str, Sequence[float]]], optional): Extra \
+columns written after y, with one value per written point. NaN values are \
+left empty. Defaults to None.
 
         Raises:
             ValueError: No points to transform
             ValueError: 'time' and 'points' have different lengths
+            ValueError: The extra columns and the points have different lengths
+        """
+        chunks = self.csv_chunks(time, points, sep, float_format, columns=columns)
+        self.__write_chunks(chunks, filepath, compress)
+
+    def table_chunks(
+        self,
+        time: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        sep: str = ",",
+        float_format: str = "",
+        chunk_rows: int = CHUNK_ROWS,
+    ) -> Iterator[str]:
         """
-        csv = self.transform_data_to_csv(time, points, sep)
-        with open(filepath, "w", encoding="utf-8") as file:
-            file.write(csv)
+        Transforms columns of values into CSV-formatted strings, a chunk \
+of rows at a time, after a header. The first column is named time, the \
+others keep their name, NaN values are left empty (frames where an object \
+has no point for example).
+
+        Args:
+            time (ndarray): The time of each row (in milliseconds)
+            columns (Dict[str, ndarray]): The values of each column, by name
+            sep (str, optional): The separator used ("," by default)
+            float_format (str, optional): The format specification of the values, \
+for example ".3f" (the shortest representation by default)
+            chunk_rows (int, optional): The amount of rows in a chunk. \
+Defaults to CHUNK_ROWS.
+
+        Raises:
+            ValueError: No points to transform
+            ValueError: The columns and the time have different lengths
+
+        Returns:
+            Iterator[str]: The chunks, which can be joined to get the CSV string
+        """
+        if len(time) == 0:
+            raise ValueError("No points to transform")
+
+        values = [np.asarray(time, dtype=np.float64)] + [
+            np.asarray(column, dtype=np.float64) for column in columns.values()
+        ]
+        if any(len(column) != len(time) for column in values):
+            raise ValueError("The columns and the time have different lengths")
+
+        chunks = (
+            [column[start : start + chunk_rows].tolist() for column in values]
+            for start in range(0, len(time), chunk_rows)
+        )
+        return self.__format_rows(["temps", *columns], chunks, sep, float_format)
+
+    def export_table_to_csv(
+        self,
+        time: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        filepath: str | Path,
+        sep: str = ",",
+        float_format: str = "",
+        compress: Optional[bool] = None,
+    ) -> None:
+        """
+        Saves columns of values in a CSV file, the values of several objects \
+side by side for example (see TrackingSession.table).
+
+        Args:
+            time (ndarray): The time of each row (in milliseconds)
+            columns (Dict[str, ndarray]): The values of each column, by name
+            filepath (str | Path): The path of the file
+            sep (str, optional): The separator used ("," by default)
+            float_format (str, optional): The format specification of the values, \
+for example ".3f" (the shortest representation by default)
+            compress (Optional[bool], optional): Whether the file is compressed \
+with gzip, or None to compress it if its name ends with ".gz". Defaults to None.
+
+        Raises:
+            ValueError: No points to transform
+            ValueError: The columns and the time have different lengths
+        """
+        chunks = self.table_chunks(time, columns, sep, float_format)
+        self.__write_chunks(chunks, filepath, compress)
+
+    def read_points_from_csv(
+        self,
+        filepath: str | Path,
+        frame_count: int,
+        sep: str = ",",
+    ) -> TrajectoryStore:
+        """
+        Reads points in canvas coordinates from a CSV file with 3 columns \
+named frame, x and y, where frame is the index of the frame (starting at 0).
+
+        Args:
+            filepath (str | Path): The path of the file
+            frame_count (int): The amount of frames in the video
+            sep (str, optional): The separator used ("," by default)
+
+        Raises:
+            ValueError: Missing columns
+            ValueError: Invalid frame index
+
+        Returns:
+            TrajectoryStore: The point of each frame
+        """
+        points = TrajectoryStore(frame_count)
+        with open(filepath, newline="", encoding="utf-8") as file:
+            reader = csv.DictReader(file, delimiter=sep)
+            if not {"frame", "x", "y"}.issubset(reader.fieldnames or []):
+                raise ValueError("Missing columns, expected frame, x and y")
+
+            for row in reader:
+                frame = int(row["frame"])
+                if not 0 <= frame < frame_count:
+                    raise ValueError(f"Invalid frame index: {frame}")
+
+                points[frame] = Point(float(row["x"]), float(row["y"]))
+
+        return points
+
+    def export_to_binary(
+        self,
+        time: Iterable[float],
+        points: Iterable[Point] | TrajectoryStore,
+        filepath: str | Path,
+        origin: Point,
+        scale: float,
+        fps: float,
+        video_hash: str,
+    ) -> None:
+        """
+        Saves data acquired by the user in a binary file: a header of \
+BINARY_HEADER_SIZE bytes followed by the time, x and y columns, stored \
+as little-endian 64-bit floats.
+
+        Args:
+            time (Iterable[float]): The time elapsed since the start of the video \
+for each point
+            points (Iterable[Point] | TrajectoryStore): The points. Frames without \
+a point are skipped if a store is given, along with their time.
+            filepath (str | Path): The path of the file
+            origin (Point): The origin of the reference frame (in canvas coordinates)
+            scale (float): The scale of the reference frame (in pixels per meter)
+            fps (float): The frame rate of the source video
+            video_hash (str): The content hash of the source video \
+(see FileRepo.content_hash)
+
+        Raises:
+            ValueError: No points to transform
+            ValueError: 'time' and 'points' have different lengths
+        """
+        columns = self.__column_arrays(time, points)
+        count = len(columns[0])
+        if count == 0:
+            raise ValueError("No points to transform")
+
+        header = BINARY_HEADER.pack(
+            BINARY_MAGIC,
+            BINARY_VERSION,
+            count,
+            origin.x,
+            origin.y,
+            scale,
+            fps,
+            bytes.fromhex(video_hash),
+        )
+
+        with open(filepath, "wb") as file:
+            file.write(header.ljust(BINARY_HEADER_SIZE, b"\0"))
+            for column in columns:
+                np.ascontiguousarray(column, dtype="<f8").tofile(file)
+
+    def read_binary(
+        self, filepath: str | Path
+    ) -> Tuple[TrajectoryHeader, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Opens a binary file created by FileRepo.export_to_binary. \
+The columns are memory-mapped, so nothing is parsed or loaded until it is used.
+
+        Args:
+            filepath (str | Path): The path of the file
+
+        Raises:
+            ValueError: Invalid trajectory file
+
+        Returns:
+            Tuple[TrajectoryHeader, ndarray, ndarray, ndarray]: The header and \
+read-only time, x and y columns
+        """
+        with open(filepath, "rb") as file:
+            data = file.read(BINARY_HEADER_SIZE)
+            size = file.seek(0, 2)
+
+        if len(data) < BINARY_HEADER_SIZE:
+            raise ValueError("Invalid trajectory file")
+
+        (
+            magic,
+            version,
+            count,
+            origin_x,
+            origin_y,
+            scale,
+            fps,
+            video_hash,
+        ) = BINARY_HEADER.unpack_from(data)
+        if (
+            magic != BINARY_MAGIC
+            or version != BINARY_VERSION
+            or size != BINARY_HEADER_SIZE + 3 * 8 * count
+        ):
+            raise ValueError("Invalid trajectory file")
+
+        header = TrajectoryHeader(
+            count, Point(origin_x, origin_y), scale, fps, video_hash.hex()
+        )
+        columns = np.memmap(
+            filepath,
+            dtype="<f8",
+            mode="r",
+            offset=BINARY_HEADER_SIZE,
+            shape=(3, count),
+        )
+
+        return header, columns[0], columns[1], columns[2]
+
+    def content_hash(self, filepath: str | Path) -> str:
+        """
+        Returns a hash identifying the content of a file, such as a video. \
+For large files, only the size and blocks at the start, the middle \
+and the end are hashed, so that multi-GB files are identified instantly.
+
+        Args:
+            filepath (str | Path): The path of the file
+
+        Returns:
+            str: The hexadecimal SHA-256 hash
+        """
+        digest = hashlib.sha256()
+        with open(filepath, "rb") as file:
+            size = file.seek(0, 2)
+            digest.update(size.to_bytes(8, "little"))
+            if size <= 3 * HASH_BLOCK_SIZE:
+                file.seek(0)
+                digest.update(file.read())
+            else:
+                for offset in (
+                    0,
+                    (size - HASH_BLOCK_SIZE) // 2,
+                    size - HASH_BLOCK_SIZE,
+                ):
+                    file.seek(offset)
+                    digest.update(file.read(HASH_BLOCK_SIZE))
+
+        return digest.hexdigest()
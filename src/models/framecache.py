@@ -0,0 +1,133 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Optional, Tuple
+
+
+class FrameCache:
+    """A thread-safe LRU cache of decoded frames, bounded by a number of \
+frames and optionally by a number of bytes."""
+
+    def __init__(self, max_frames: int, max_bytes: Optional[int] = None) -> None:
+        if max_frames < 1:
+            raise ValueError("'max_frames' must be at least 1")
+
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("'max_bytes' must be at least 1")
+
+        self.__max_frames = max_frames
+        self.__max_bytes = max_bytes
+
+        self.__frames: OrderedDict[int, Tuple[Any, int]] = OrderedDict()
+        self.__lock = Lock()
+        self.__size_bytes = 0
+        self.__hits = 0
+        self.__misses = 0
+
+    @property
+    def max_frames(self) -> int:
+        """The maximum amount of frames kept in the cache."""
+        return self.__max_frames
+
+    @property
+    def max_bytes(self) -> Optional[int]:
+        """The maximum amount of bytes kept in the cache, or None if unbounded."""
+        return self.__max_bytes
+
+    @property
+    def size_bytes(self) -> int:
+        """The amount of bytes currently used by the cached frames."""
+        return self.__size_bytes
+
+    @property
+    def hits(self) -> int:
+        """The amount of lookups that found their frame."""
+        return self.__hits
+
+    @property
+    def misses(self) -> int:
+        """The amount of lookups that did not find their frame."""
+        return self.__misses
+
+    def capacity(self, frame_size: int) -> int:
+        """Returns how many frames of a given size fit in the cache.
+
+        Args:
+            frame_size (int): The size of a frame (in bytes)
+
+        Returns:
+            int: The amount of frames (at least 1)
+        """
+        if self.__max_bytes is None or frame_size <= 0:
+            return self.__max_frames
+
+        return max(min(self.__max_frames, self.__max_bytes // frame_size), 1)
+
+    def get(self, index: int) -> Optional[Any]:
+        """Returns a cached frame and marks it as the most recently used. \
+The lookup is counted as a hit or a miss.
+
+        Args:
+            index (int): The index of the frame
+
+        Returns:
+            Optional[Any]: The frame, or None if it is not cached
+        """
+        with self.__lock:
+            entry = self.__frames.get(index)
+            if entry is None:
+                self.__misses += 1
+                return None
+
+            self.__hits += 1
+            self.__frames.move_to_end(index)
+            return entry[0]
+
+    def put(self, index: int, frame: Any, size: int = 0) -> None:
+        """Adds a frame to the cache, evicting the least recently used frames \
+if a limit is exceeded.
+
+        Args:
+            index (int): The index of the frame
+            frame (Any): The frame
+            size (int, optional): The size of the frame (in bytes). Defaults to 0.
+        """
+        with self.__lock:
+            previous = self.__frames.pop(index, None)
+            if previous is not None:
+                self.__size_bytes -= previous[1]
+
+            self.__frames[index] = (frame, size)
+            self.__size_bytes += size
+
+            while len(self.__frames) > 1 and (
+                len(self.__frames) > self.__max_frames
+                or (
+                    self.__max_bytes is not None
+                    and self.__size_bytes > self.__max_bytes
+                )
+            ):
+                _, (_, evicted_size) = self.__frames.popitem(last=False)
+                self.__size_bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Removes every frame from the cache. The counters are kept."""
+        with self.__lock:
+            self.__frames.clear()
+            self.__size_bytes = 0
+
+    def reset_stats(self) -> None:
+        """Resets the hit and miss counters."""
+        with self.__lock:
+            self.__hits = 0
+            self.__misses = 0
+
+    def __contains__(self, index: int) -> bool:
+        """Returns whether a frame is cached, without counting a hit or a miss \
+and without changing its position."""
+        with self.__lock:
+            return index in self.__frames
+
+    def __len__(self) -> int:
+        """Returns the amount of cached frames."""
+        with self.__lock:
+            return len(self.__frames)
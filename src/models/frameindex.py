@@ -0,0 +1,150 @@
+from array import array
+from bisect import bisect_right
+from threading import Event
+from typing import Callable, Iterable, Optional
+
+import cv2
+import numpy as np
+
+# how often the progress is reported and the cancellation checked
+PROGRESS_PACKETS = 64
+
+
+class FrameIndex:
+    """The keyframe positions and the presentation timestamps of every frame \
+of a video, used to seek precisely without decoding more than one GOP."""
+
+    def __init__(
+        self, keyframes: Iterable[int], timestamps_ms: Iterable[float]
+    ) -> None:
+        self.__timestamps = array("d", sorted(timestamps_ms))
+        if len(self.__timestamps) == 0:
+            raise ValueError("Nombre d'images invalide")
+
+        # seeking to the first frame is always possible
+        self.__keyframes = array("q", sorted(set(keyframes) | {0}))
+
+    @staticmethod
+    def build(
+        filename: str,
+        cancelled: Optional[Event] = None,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> "FrameIndex":
+        """Builds the index of a video by reading its packets without decoding them.
+
+        NOTE: Packets are read in decoding order, so timestamps are sorted \
+to get the presentation order.
+
+        Args:
+            filename (str): The path of the video file
+            cancelled (Optional[Event], optional): Stops indexing when set. \
+Defaults to None.
+            progress (Optional[Callable[[int], None]], optional): Called with \
+the amount of packets read so far, every PROGRESS_PACKETS packets. \
+Defaults to None.
+
+        Raises:
+            ValueError: The video cannot be read without decoding it
+            ValueError: Indexing was cancelled
+
+        Returns:
+            FrameIndex: The index of the video
+        """
+        capture = cv2.VideoCapture(filename)
+        try:
+            if not capture.isOpened() or not capture.set(cv2.CAP_PROP_FORMAT, -1):
+                raise ValueError("Impossible d'indexer la vidéo")
+
+            keyframes = array("q")
+            timestamps = array("d")
+            while capture.grab():
+                if capture.get(cv2.CAP_PROP_LRF_HAS_KEY_FRAME):
+                    keyframes.append(len(timestamps))
+                timestamps.append(capture.get(cv2.CAP_PROP_POS_MSEC))
+
+                if len(timestamps) % PROGRESS_PACKETS == 0:
+                    if cancelled is not None and cancelled.is_set():
+                        raise ValueError("Indexation annulée")
+                    if progress is not None:
+                        progress(len(timestamps))
+
+            return FrameIndex(keyframes, timestamps)
+        finally:
+            capture.release()
+
+    @property
+    def frame_count(self) -> int:
+        """The amount of frames found in the video."""
+        return len(self.__timestamps)
+
+    @property
+    def keyframe_count(self) -> int:
+        """The amount of keyframes found in the video."""
+        return len(self.__keyframes)
+
+    @property
+    def timestamps_ms(self) -> np.ndarray:
+        """The presentation timestamp of every frame (in milliseconds), \
+as a read-only view of the index."""
+        timestamps = np.frombuffer(self.__timestamps, dtype=np.float64)
+        timestamps.flags.writeable = False
+        return timestamps
+
+    def timestamp_ms(self, frame_index: int) -> float:
+        """Returns the presentation timestamp of a frame.
+
+        Args:
+            frame_index (int): The index (starting at 0) of the frame
+
+        Returns:
+            float: The timestamp (in milliseconds)
+        """
+        return self.__timestamps[frame_index]
+
+    def is_keyframe(self, frame_index: int) -> bool:
+        """Returns whether a frame is a keyframe.
+
+        Args:
+            frame_index (int): The index (starting at 0) of the frame
+
+        Returns:
+            bool: True if a decoder can start at this frame
+        """
+        return self.keyframe_before(frame_index) == frame_index
+
+    def keyframe_before(self, frame_index: int) -> int:
+        """Returns the last keyframe at or before a frame.
+
+        Args:
+            frame_index (int): The index (starting at 0) of the frame
+
+        Returns:
+            int: The index of the keyframe
+        """
+        return self.__keyframes[max(bisect_right(self.__keyframes, frame_index) - 1, 0)]
+
+    def seek(self, capture: cv2.VideoCapture, position: int, target: int) -> int:
+        """Moves a capture so that its next read returns a specific frame. \
+The capture jumps to the closest keyframe, unless it is already in the \
+same GOP before the target, then grabs frames without retrieving them.
+
+        Args:
+            capture (VideoCapture): The capture to move
+            position (int): The index of the next frame the capture would \
+read, or -1 if unknown
+            target (int): The index (starting at 0) of the frame to read next
+
+        Returns:
+            int: The amount of frames grabbed to reach the target
+        """
+        keyframe = self.keyframe_before(target)
+        if not keyframe <= position <= target:
+            capture.set(cv2.CAP_PROP_POS_FRAMES, keyframe)
+            position = keyframe
+
+        grabbed = 0
+        while position < target and capture.grab():
+            position += 1
+            grabbed += 1
+
+        return grabbed
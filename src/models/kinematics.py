@@ -0,0 +1,255 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .trajectorystore import TrajectoryStore
+
+GRAVITY = 9.81
+
+# a gap is a step between frames longer than this factor times the usual step
+GAP_FACTOR = 1.5
+
+
+def savgol_filter(values: np.ndarray, window: int, order: int) -> np.ndarray:
+    """Smooths evenly spaced values with a Savitzky-Golay filter: each value \
+is replaced by the value of the polynomial fitted by least squares on the \
+window around it. The first and last values use the polynomial of the first \
+and last windows.
+
+    Args:
+        values (ndarray): The values, at least as many as the window
+        window (int): The odd amount of values in a window
+        order (int): The degree of the polynomial, lower than the window
+
+    Raises:
+        ValueError: The window is not odd or not greater than the order
+
+    Returns:
+        ndarray: The smoothed values
+    """
+    if window % 2 == 0 or window <= order or order < 0:
+        raise ValueError("The window must be odd and greater than the order")
+
+    values = np.asarray(values, dtype=np.float64)
+    half = window // 2
+    if half == 0 or len(values) < window:
+        return values.copy()
+
+    # the rows of the pseudo-inverse give the polynomial coefficients of a window
+    fit = np.linalg.pinv(np.vander(np.arange(-half, half + 1), order + 1, True))
+
+    smoothed = np.empty_like(values)
+    smoothed[half:-half] = np.correlate(values, fit[0], mode="valid")
+    smoothed[:half] = np.vander(np.arange(-half, 0), order + 1, True) @ (
+        fit @ values[:window]
+    )
+    smoothed[-half:] = np.vander(np.arange(1, half + 1), order + 1, True) @ (
+        fit @ values[-window:]
+    )
+    return smoothed
+
+
+def segments(frames: np.ndarray) -> List[slice]:
+    """Splits sorted frame indices where more frames than usual are skipped, \
+which happens when frames have no point. Points acquired every few frames \
+stay in one segment. Frame indices are used instead of times, since time \
+steps vary with variable frame rate videos.
+
+    Args:
+        frames (ndarray): The sorted indices of the frames with a point
+
+    Returns:
+        List[slice]: The slices of each segment without gaps
+    """
+    if len(frames) == 0:
+        return []
+
+    steps = np.diff(frames)
+    max_step = GAP_FACTOR * float(np.median(steps)) if len(steps) else 0.0
+    bounds = np.concatenate(([0], np.flatnonzero(steps > max_step) + 1, [len(frames)]))
+    return [slice(start, end) for start, end in zip(bounds[:-1], bounds[1:])]
+
+
+class Kinematics:
+    """The velocity, acceleration and energy of a moving object, computed \
+from its transformed points with central differences.
+
+    NOTE: Derivatives are computed on each segment of consecutive frames \
+separately. They are NaN where a segment is too short (one point for the velocity, \
+less than three for the acceleration).
+    """
+
+    def __init__(
+        self,
+        points: TrajectoryStore,
+        times: np.ndarray,
+        smoothing_window: int = 0,
+        smoothing_order: int = 2,
+        frames: Optional[np.ndarray] = None,
+    ) -> None:
+        """Computes the kinematics of a trajectory.
+
+        Args:
+            points (TrajectoryStore): The transformed points (in meters). \
+Frames without a point are skipped.
+            times (ndarray): The time of each frame of the store (in milliseconds)
+            smoothing_window (int, optional): The window of the Savitzky-Golay \
+filter applied to the positions, or 0 to keep them as is. Defaults to 0.
+            smoothing_order (int, optional): The order of the Savitzky-Golay \
+filter. Defaults to 2.
+            frames (Optional[ndarray], optional): The index of the frame \
+of each point of the store, to find gaps in stores skipping frames without \
+a point (see TransformCache.values), or None if the store has a point for \
+each frame. Defaults to None.
+
+        Raises:
+            ValueError: 'times' or 'frames' and 'points' have different lengths
+        """
+        if len(times) != len(points):
+            raise ValueError("'times' and 'points' have different lengths")
+        if frames is not None and len(frames) != len(points):
+            raise ValueError("'frames' and 'points' have different lengths")
+
+        valid = points.valid
+        self.__frames = (
+            points.indices() if frames is None else np.asarray(frames)[valid]
+        )
+        self.__times = np.asarray(times, dtype=np.float64)[valid]
+        self.__x = points.x[valid].astype(np.float64)
+        self.__y = points.y[valid].astype(np.float64)
+
+        self.__vx = np.full(len(self.__times), np.nan)
+        self.__vy = np.full(len(self.__times), np.nan)
+        self.__ax = np.full(len(self.__times), np.nan)
+        self.__ay = np.full(len(self.__times), np.nan)
+
+        seconds = self.__times / 1000
+        for part in segments(self.__frames):
+            if smoothing_window > 0:
+                self.__x[part] = savgol_filter(
+                    self.__x[part], smoothing_window, smoothing_order
+                )
+                self.__y[part] = savgol_filter(
+                    self.__y[part], smoothing_window, smoothing_order
+                )
+
+            length = part.stop - part.start
+            if length < 2:
+                continue
+
+            edge_order = 2 if length > 2 else 1
+            t = seconds[part]
+            self.__vx[part] = np.gradient(self.__x[part], t, edge_order=edge_order)
+            self.__vy[part] = np.gradient(self.__y[part], t, edge_order=edge_order)
+            if length > 2:
+                self.__ax[part] = np.gradient(self.__vx[part], t, edge_order=2)
+                self.__ay[part] = np.gradient(self.__vy[part], t, edge_order=2)
+
+    @property
+    def times(self) -> np.ndarray:
+        """The time of each point (in milliseconds)."""
+        return self.__times
+
+    @property
+    def x(self) -> np.ndarray:
+        """The x coordinates, smoothed if requested (in meters)."""
+        return self.__x
+
+    @property
+    def y(self) -> np.ndarray:
+        """The y coordinates, smoothed if requested (in meters)."""
+        return self.__y
+
+    @property
+    def vx(self) -> np.ndarray:
+        """The horizontal velocity (in meters per second)."""
+        return self.__vx
+
+    @property
+    def vy(self) -> np.ndarray:
+        """The vertical velocity (in meters per second)."""
+        return self.__vy
+
+    @property
+    def speed(self) -> np.ndarray:
+        """The norm of the velocity (in meters per second)."""
+        return np.hypot(self.__vx, self.__vy)
+
+    @property
+    def ax(self) -> np.ndarray:
+        """The horizontal acceleration (in meters per second squared)."""
+        return self.__ax
+
+    @property
+    def ay(self) -> np.ndarray:
+        """The vertical acceleration (in meters per second squared)."""
+        return self.__ay
+
+    @property
+    def acceleration(self) -> np.ndarray:
+        """The norm of the acceleration (in meters per second squared)."""
+        return np.hypot(self.__ax, self.__ay)
+
+    def kinetic_energy(self, mass: float) -> np.ndarray:
+        """Returns the kinetic energy of the object.
+
+        Args:
+            mass (float): The mass of the object (in kilograms)
+
+        Returns:
+            ndarray: The energy (in joules)
+        """
+        return 0.5 * mass * (self.__vx**2 + self.__vy**2)
+
+    def potential_energy(self, mass: float, gravity: float = GRAVITY) -> np.ndarray:
+        """Returns the gravitational potential energy of the object, \
+relative to the origin.
+
+        Args:
+            mass (float): The mass of the object (in kilograms)
+            gravity (float, optional): The gravitational acceleration \
+(in meters per second squared). Defaults to GRAVITY.
+
+        Returns:
+            ndarray: The energy (in joules)
+        """
+        return mass * gravity * self.__y
+
+    def mechanical_energy(self, mass: float, gravity: float = GRAVITY) -> np.ndarray:
+        """Returns the sum of the kinetic and potential energies of the object.
+
+        Args:
+            mass (float): The mass of the object (in kilograms)
+            gravity (float, optional): The gravitational acceleration \
+(in meters per second squared). Defaults to GRAVITY.
+
+        Returns:
+            ndarray: The energy (in joules)
+        """
+        return self.kinetic_energy(mass) + self.potential_energy(mass, gravity)
+
+    def columns(self, mass: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Returns the computed values as named columns, to be exported \
+next to the points.
+
+        Args:
+            mass (Optional[float], optional): The mass of the object \
+(in kilograms), or None to leave out the energies. Defaults to None.
+
+        Returns:
+            Dict[str, ndarray]: The columns, with one value per point
+        """
+        columns = {
+            "vx": self.vx,
+            "vy": self.vy,
+            "v": self.speed,
+            "ax": self.ax,
+            "ay": self.ay,
+            "a": self.acceleration,
+        }
+        if mass is not None:
+            columns["Ec"] = self.kinetic_energy(mass)
+            columns["Epp"] = self.potential_energy(mass)
+            columns["Em"] = self.mechanical_energy(mass)
+
+        return columns
@@ -0,0 +1,10 @@
+from enum import Enum
+
+
+class LoadingPhase(Enum):
+    """Represents a step of the loading of a video."""
+
+    PROBING = 0
+    INDEXING = 1
+    VERIFYING = 2
+    OPENING = 3
@@ -0,0 +1,141 @@
+from math import ceil, floor
+from time import perf_counter
+from typing import Callable
+
+MIN_SPEED = 0.25
+MAX_SPEED = 8.0
+
+# a frame is due when its time is reached, up to rounding errors
+EPSILON = 1e-9
+
+
+class PlaybackClock:
+    """Tells which frame should be shown during playback, from the wall time \
+elapsed since playback started, so that delays do not accumulate. Frames that \
+are late are meant to be dropped, the clock counts them."""
+
+    def __init__(
+        self,
+        frame_duration_ms: float,
+        speed: float = 1.0,
+        clock: Callable[[], float] = perf_counter,
+    ) -> None:
+        """Creates a stopped clock.
+
+        Args:
+            frame_duration_ms (float): The duration of a frame (in milliseconds)
+            speed (float, optional): The playback speed, between MIN_SPEED \
+and MAX_SPEED. Defaults to 1.0.
+            clock (Callable[[], float], optional): Returns the current time \
+(in seconds). Defaults to perf_counter.
+
+        Raises:
+            ValueError: The speed is out of range
+        """
+        PlaybackClock.__check_speed(speed)
+        self.__frame_duration = frame_duration_ms
+        self.__speed = speed
+        self.__clock = clock
+
+        self.__start_time = clock()
+        self.__start_frame = 0
+        self.__direction = 1
+
+        # the counters are not reset when the speed changes
+        self.__stats_start = self.__start_time
+        self.__shown = 0
+        self.__dropped = 0
+
+    @staticmethod
+    def __check_speed(speed: float) -> None:
+        """Raises a ValueError if a speed is out of range."""
+        if not MIN_SPEED <= speed <= MAX_SPEED:
+            raise ValueError(f"Speed must be between {MIN_SPEED} and {MAX_SPEED}")
+
+    @property
+    def speed(self) -> float:
+        """The playback speed (1 for real time)."""
+        return self.__speed
+
+    @property
+    def shown_frames(self) -> int:
+        """The amount of frames shown since playback started."""
+        return self.__shown
+
+    @property
+    def dropped_frames(self) -> int:
+        """The amount of frames dropped since playback started."""
+        return self.__dropped
+
+    @property
+    def fps(self) -> float:
+        """The amount of frames actually shown per second of wall time."""
+        elapsed = self.__clock() - self.__stats_start
+        if elapsed <= 0:
+            return 0.0
+
+        return self.__shown / elapsed
+
+    def start(self, frame: int, backwards: bool = False) -> None:
+        """Starts playback from a frame and resets the counters.
+
+        Args:
+            frame (int): The index of the frame shown when playback starts
+            backwards (bool, optional): Whether the video is played backwards. \
+Defaults to False.
+        """
+        self.__start_time = self.__clock()
+        self.__start_frame = frame
+        self.__direction = -1 if backwards else 1
+        self.__stats_start = self.__start_time
+        self.__shown = 0
+        self.__dropped = 0
+
+    def set_speed(self, speed: float) -> None:
+        """Changes the playback speed without jumping to another frame.
+
+        Args:
+            speed (float): The new speed, between MIN_SPEED and MAX_SPEED
+
+        Raises:
+            ValueError: The speed is out of range
+        """
+        PlaybackClock.__check_speed(speed)
+        now = self.__clock()
+        played = (now - self.__start_time) * 1000 * self.__speed
+
+        # the schedule restarts from the current position in the video
+        self.__start_frame += self.__direction * played / self.__frame_duration
+        self.__start_time = now
+        self.__speed = speed
+
+    def due_frame(self) -> int:
+        """Returns the index of the frame that should be shown now."""
+        elapsed = (self.__clock() - self.__start_time) * 1000
+        played = elapsed * self.__speed / self.__frame_duration
+        if self.__direction < 0:
+            return ceil(self.__start_frame - played - EPSILON)
+
+        return floor(self.__start_frame + played + EPSILON)
+
+    def delay_ms(self, frame: int) -> float:
+        """Returns how long to wait before a frame should be shown.
+
+        Args:
+            frame (int): The index of the frame
+
+        Returns:
+            float: The delay (in milliseconds), negative if the frame is late
+        """
+        frames = (frame - self.__start_frame) * self.__direction
+        due = frames * self.__frame_duration / self.__speed
+        return due - (self.__clock() - self.__start_time) * 1000
+
+    def count(self, dropped: int = 0) -> None:
+        """Counts a shown frame and the frames dropped to reach it.
+
+        Args:
+            dropped (int, optional): The amount of dropped frames. Defaults to 0.
+        """
+        self.__shown += 1
+        self.__dropped += dropped
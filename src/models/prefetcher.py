@@ -0,0 +1,141 @@
+from threading import Condition, Thread
+from typing import Any, Callable, Optional
+
+import cv2
+
+from .framecache import FrameCache
+from .frameindex import FrameIndex
+from .profiler import Profiler
+
+
+class FramePrefetcher:
+    """Decodes frames ahead of a position in a background thread and stores \
+them in a frame cache.
+
+    NOTE: The worker uses its own video capture because OpenCV captures \
+cannot be shared between threads.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        cache: FrameCache,
+        convert: Callable[[Any], Any],
+        frame_count: int,
+        frame_size: int,
+        lookahead: int,
+        frame_index: Optional[FrameIndex] = None,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
+        self.__filename = filename
+        self.__cache = cache
+        self.__convert = convert
+        self.__frame_size = frame_size
+        self.__lookahead = max(lookahead, 1)
+        self.__profiler = profiler
+
+        # used to seek precisely, can be set once the index is built
+        self.frame_index = frame_index
+
+        # frames after this index could not be read, there is no need to try again
+        self.__end = frame_count
+
+        self.__condition = Condition()
+        self.__position = 0
+        self.__stopped = False
+        self.__thread: Optional[Thread] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is running."""
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self, position: int = 0) -> None:
+        """Starts the worker thread.
+
+        Args:
+            position (int, optional): The index of the first frame to decode. \
+Defaults to 0.
+        """
+        if self.running:
+            return
+
+        self.__position = position
+        self.__stopped = False
+        self.__thread = Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def stop(self) -> None:
+        """Stops the worker thread and waits for it to finish."""
+        with self.__condition:
+            self.__stopped = True
+            self.__condition.notify()
+
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def request(self, position: int) -> None:
+        """Tells the worker which frame will be needed next.
+
+        Args:
+            position (int): The index of the next frame
+        """
+        with self.__condition:
+            self.__position = position
+            self.__condition.notify()
+
+    def __next_missing(self) -> Optional[int]:
+        """Returns the index of the first frame in the lookahead window \
+that is not cached, or None if the window is complete."""
+        end = min(self.__position + self.__lookahead, self.__end)
+        for index in range(self.__position, end):
+            if index not in self.__cache:
+                return index
+
+        return None
+
+    def __run(self) -> None:
+        """Decodes missing frames until the worker is stopped."""
+        capture = cv2.VideoCapture(self.__filename)
+        capture_position = 0
+
+        while True:
+            with self.__condition:
+                index = self.__next_missing()
+                while index is None and not self.__stopped:
+                    self.__condition.wait()
+                    index = self.__next_missing()
+
+                if self.__stopped or index is None:
+                    break
+
+            try:
+                if capture_position != index:
+                    if self.frame_index is None:
+                        capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+                    else:
+                        self.frame_index.seek(capture, capture_position, index)
+                    capture_position = index
+
+                start = 0 if self.__profiler is None else self.__profiler.start()
+                ret, frame = capture.read()
+                if start:
+                    self.__profiler.stop("decode", start, index)  # type: ignore
+            except cv2.error:
+                ret, frame = False, None
+
+            if not ret:
+                with self.__condition:
+                    self.__end = min(self.__end, index)
+                capture_position = -1
+                continue
+
+            capture_position += 1
+            start = 0 if self.__profiler is None else self.__profiler.start()
+            data = self.__convert(frame)
+            if start:
+                self.__profiler.stop("convert", start, index)  # type: ignore
+            self.__cache.put(index, data, self.__frame_size)
+
+        capture.release()
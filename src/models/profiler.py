@@ -0,0 +1,179 @@
+import json
+import os
+from collections import deque
+from pathlib import Path
+from threading import current_thread, get_ident
+from time import perf_counter_ns
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# the amount of durations kept for each stage to compute the percentiles
+DEFAULT_WINDOW = 240
+
+# the amount of events kept for the trace, the oldest ones are dropped
+MAX_TRACE_EVENTS = 100_000
+
+DEFAULT_PERCENTILES = (50, 95, 99)
+
+
+class Profiler:
+    """Times the stages of the processing of each frame (decoding, color \
+conversion, display...) and keeps rolling percentiles of their durations, \
+as well as a trace of the session that can be exported.
+
+    NOTE: Timing a stage costs two calls to perf_counter_ns and two appends \
+to bounded deques, so the profiler can stay enabled. When it is disabled, \
+start returns 0 and stop returns immediately. The stages can be timed from \
+several threads.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        window: int = DEFAULT_WINDOW,
+        max_events: int = MAX_TRACE_EVENTS,
+    ) -> None:
+        """Creates a profiler without any timing.
+
+        Args:
+            enabled (bool, optional): Whether the stages are timed. Defaults to True.
+            window (int, optional): The amount of durations kept for each stage. \
+Defaults to DEFAULT_WINDOW.
+            max_events (int, optional): The amount of events kept for the trace. \
+Defaults to MAX_TRACE_EVENTS.
+
+        Raises:
+            ValueError: The window or the amount of events is lower than 1
+        """
+        if window < 1 or max_events < 1:
+            raise ValueError("'window' and 'max_events' must be at least 1")
+
+        self.enabled = enabled
+        self.__window = window
+        self.__origin = perf_counter_ns()
+        self.__durations: Dict[str, Deque[int]] = {}
+        # stage, start, duration, thread, frame
+        self.__events: Deque[Tuple[str, int, int, int, int]] = deque(maxlen=max_events)
+        self.__thread_names: Dict[int, str] = {}
+
+    def start(self) -> int:
+        """Returns the time at which a stage starts, to be given to stop.
+
+        Returns:
+            int: The time (in nanoseconds), or 0 if the profiler is disabled
+        """
+        return perf_counter_ns() if self.enabled else 0
+
+    def stop(self, stage: str, start: int, frame: int = -1) -> None:
+        """Records the duration of a stage, from its start to now.
+
+        Args:
+            stage (str): The name of the stage
+            start (int): The value returned by start, nothing is recorded if it is 0
+            frame (int, optional): The index of the frame being processed, \
+or -1 if it is unknown. Defaults to -1.
+        """
+        if not start:
+            return
+
+        duration = perf_counter_ns() - start
+        durations = self.__durations.get(stage)
+        if durations is None:
+            durations = self.__durations.setdefault(stage, deque(maxlen=self.__window))
+        durations.append(duration)
+
+        thread = get_ident()
+        if thread not in self.__thread_names:
+            self.__thread_names[thread] = current_thread().name
+        self.__events.append((stage, start, duration, thread, frame))
+
+    def stages(self) -> List[str]:
+        """Returns the names of the timed stages, in the order they were \
+first timed."""
+        return list(self.__durations)
+
+    def percentiles(
+        self, stage: str, percentiles: Sequence[float] = DEFAULT_PERCENTILES
+    ) -> Optional[np.ndarray]:
+        """Returns percentiles of the last durations of a stage.
+
+        Args:
+            stage (str): The name of the stage
+            percentiles (Sequence[float], optional): The percentiles, between \
+0 and 100. Defaults to DEFAULT_PERCENTILES.
+
+        Returns:
+            Optional[ndarray]: The durations (in milliseconds), or None if \
+the stage was never timed
+        """
+        durations = self.__durations.get(stage)
+        if not durations:
+            return None
+
+        return np.percentile(np.array(durations), percentiles) / 1e6
+
+    def summary(self) -> str:
+        """Returns the percentiles of every stage, one stage per line.
+
+        Returns:
+            str: The summary, empty if nothing was timed
+        """
+        names = ("p" + str(percentile) for percentile in DEFAULT_PERCENTILES)
+        lines = [f"{'':<10}" + "".join(f"{name:>8}" for name in names)]
+        for stage in self.stages():
+            values = self.percentiles(stage)
+            if values is not None:
+                lines.append(
+                    f"{stage:<10}" + "".join(f"{value:>8.2f}" for value in values)
+                )
+
+        return "\n".join(lines) if len(lines) > 1 else ""
+
+    def clear(self) -> None:
+        """Forgets every duration and every event."""
+        self.__durations.clear()
+        self.__events.clear()
+        self.__origin = perf_counter_ns()
+
+    def trace(self) -> Dict[str, Any]:
+        """Returns the recorded events in the Chrome trace format, which \
+can be opened with chrome://tracing or Perfetto.
+
+        Returns:
+            Dict[str, Any]: The trace
+        """
+        pid = os.getpid()
+        events: List[Dict[str, Any]] = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": pid,
+                "tid": thread,
+                "args": {"name": name},
+            }
+            for thread, name in list(self.__thread_names.items())
+        ]
+        for stage, start, duration, thread, frame in list(self.__events):
+            event: Dict[str, Any] = {
+                "name": stage,
+                "ph": "X",
+                "ts": (start - self.__origin) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": thread,
+            }
+            if frame >= 0:
+                event["args"] = {"frame": frame}
+            events.append(event)
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_trace(self, filename: str | Path) -> None:
+        """Writes the recorded events to a JSON file in the Chrome trace format.
+
+        Args:
+            filename (str | Path): The path of the file
+        """
+        with open(filename, "w", encoding="utf-8") as file:
+            json.dump(self.trace(), file)
@@ -0,0 +1,282 @@
+import os
+from pathlib import Path
+from threading import Event, Thread
+from typing import Callable, List, Optional
+
+PROXY_EXTENSION = ".avi"
+PROXY_FOURCC = "MJPG"
+PROXY_MAX_HEIGHT = 540
+DEFAULT_PROXY_CACHE_BYTES = 4 * 1024 * 1024 * 1024
+
+
+def user_cache_directory() -> Path:
+    """Returns the directory where the application caches data, in the \
+user's cache directory.
+
+    Returns:
+        Path: The directory
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home().joinpath(".cache")
+    return Path(base).joinpath("videotracker")
+
+
+def default_cache_directory() -> Path:
+    """Returns the directory where proxies are stored by default.
+
+    Returns:
+        Path: The directory
+    """
+    return user_cache_directory().joinpath("proxies")
+
+
+def transcode(
+    source: str | Path,
+    destination: str | Path,
+    max_height: int = PROXY_MAX_HEIGHT,
+    cancelled: Optional[Event] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> bool:
+    """Transcodes a video into an intra-only MJPEG video, smaller if needed, \
+so that any frame can be read without decoding other frames. The file \
+is written under a temporary name and only renamed once it is complete.
+
+    Args:
+        source (str | Path): The path of the video
+        destination (str | Path): The path of the proxy, ending with .avi
+        max_height (int, optional): The maximum height of the proxy \
+(in pixels). Defaults to PROXY_MAX_HEIGHT.
+        cancelled (Optional[Event], optional): Stops transcoding when set. \
+Defaults to None.
+        progress (Optional[Callable[[int], None]], optional): Called with \
+the amount of frames written so far. Defaults to None.
+
+    Returns:
+        bool: True if the proxy has the same frames as the video
+    """
+    # OpenCV is imported here so that the cache can be used before it is loaded
+    import cv2
+
+    capture = cv2.VideoCapture(str(source))
+    if not capture.isOpened():
+        return False
+
+    width = int(capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    scale = min(max_height / height, 1.0) if height > 0 else 1.0
+    size = (max(round(width * scale), 1), max(round(height * scale), 1))
+    expected = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+
+    destination = Path(destination)
+    # the extension is kept so that OpenCV picks the AVI container
+    partial = destination.with_name(f"{destination.stem}.part{destination.suffix}")
+    writer = cv2.VideoWriter(
+        str(partial),
+        cv2.VideoWriter_fourcc(*PROXY_FOURCC),
+        capture.get(cv2.CAP_PROP_FPS),
+        size,
+    )
+
+    written = 0
+    complete = False
+    try:
+        if not writer.isOpened():
+            return False
+
+        ret, frame = capture.read()
+        while ret:
+            if cancelled is not None and cancelled.is_set():
+                return False
+
+            if size != (width, height):
+                frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+            writer.write(frame)
+            written += 1
+            if progress is not None:
+                progress(written)
+
+            ret, frame = capture.read()
+
+        complete = written > 0 and written == expected
+    finally:
+        capture.release()
+        writer.release()
+        if not complete:
+            partial.unlink(missing_ok=True)
+
+    if complete:
+        os.replace(partial, destination)
+    return complete
+
+
+class ProxyCache:
+    """A directory of proxy videos named after the content hash of their \
+source video. The least recently used proxies are deleted when the total \
+size exceeds a limit."""
+
+    def __init__(
+        self,
+        directory: Optional[str | Path] = None,
+        max_bytes: int = DEFAULT_PROXY_CACHE_BYTES,
+    ) -> None:
+        if max_bytes < 1:
+            raise ValueError("'max_bytes' must be at least 1")
+
+        self.__directory = Path(
+            default_cache_directory() if directory is None else directory
+        )
+        self.__max_bytes = max_bytes
+
+    @property
+    def directory(self) -> Path:
+        """The directory where proxies are stored."""
+        return self.__directory
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum total size of the proxies (in bytes)."""
+        return self.__max_bytes
+
+    def path_for(self, content_hash: str) -> Path:
+        """Returns where the proxy of a video is stored, creating the \
+directory if needed.
+
+        Args:
+            content_hash (str): The content hash of the video (see FileRepo.content_hash)
+
+        Returns:
+            Path: The path of the proxy, which may not exist yet
+        """
+        self.__directory.mkdir(parents=True, exist_ok=True)
+        return self.__directory.joinpath(content_hash + PROXY_EXTENSION)
+
+    def lookup(self, content_hash: str) -> Optional[Path]:
+        """Returns the proxy of a video if it exists, and marks it as \
+the most recently used.
+
+        Args:
+            content_hash (str): The content hash of the video
+
+        Returns:
+            Optional[Path]: The path of the proxy, or None if there is none
+        """
+        path = self.__directory.joinpath(content_hash + PROXY_EXTENSION)
+        if not path.is_file():
+            return None
+
+        path.touch()
+        return path
+
+    def proxies(self) -> List[Path]:
+        """Returns the stored proxies, from the least recently used."""
+        if not self.__directory.is_dir():
+            return []
+
+        paths = [
+            path
+            for path in self.__directory.glob("*" + PROXY_EXTENSION)
+            if not path.stem.endswith(".part")
+        ]
+        return sorted(paths, key=lambda path: path.stat().st_mtime)
+
+    def size_bytes(self) -> int:
+        """Returns the total size of the stored proxies (in bytes)."""
+        return sum(path.stat().st_size for path in self.proxies())
+
+    def evict(self, keep: Optional[Path] = None) -> List[Path]:
+        """Deletes the least recently used proxies until the total size \
+is within the limit.
+
+        Args:
+            keep (Optional[Path], optional): A proxy that must not be deleted, \
+for example the one in use. Defaults to None.
+
+        Returns:
+            List[Path]: The deleted proxies
+        """
+        proxies = self.proxies()
+        total = sum(path.stat().st_size for path in proxies)
+        deleted: List[Path] = []
+        for path in proxies:
+            if total <= self.__max_bytes:
+                break
+
+            if keep is not None and path == Path(keep):
+                continue
+
+            total -= path.stat().st_size
+            path.unlink(missing_ok=True)
+            deleted.append(path)
+
+        return deleted
+
+
+class ProxyWorker:
+    """Transcodes the proxy of a video in a background thread."""
+
+    def __init__(
+        self,
+        source: str | Path,
+        destination: str | Path,
+        frame_count: int,
+        max_height: int = PROXY_MAX_HEIGHT,
+    ) -> None:
+        self.__source = source
+        self.__destination = Path(destination)
+        self.__frame_count = frame_count
+        self.__max_height = max_height
+
+        self.__cancelled = Event()
+        self.__thread: Optional[Thread] = None
+        self.__written = 0
+        self.__succeeded = False
+
+    @property
+    def destination(self) -> Path:
+        """The path of the proxy."""
+        return self.__destination
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is running."""
+        return self.__thread is not None and self.__thread.is_alive()
+
+    @property
+    def progress(self) -> float:
+        """The fraction of frames already transcoded, between 0 and 1."""
+        if self.__frame_count <= 0:
+            return 0.0
+
+        return min(self.__written / self.__frame_count, 1.0)
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the proxy was written completely."""
+        return self.__succeeded
+
+    def start(self) -> None:
+        """Starts the worker thread."""
+        if not self.running:
+            self.__cancelled.clear()
+            self.__thread = Thread(target=self.__run, daemon=True)
+            self.__thread.start()
+
+    def cancel(self) -> None:
+        """Stops transcoding and waits for the worker thread to finish."""
+        self.__cancelled.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self) -> None:
+        """Transcodes the video until it is done or the worker is cancelled."""
+        self.__succeeded = transcode(
+            self.__source,
+            self.__destination,
+            self.__max_height,
+            self.__cancelled,
+            self.__set_written,
+        )
+
+    def __set_written(self, written: int) -> None:
+        """Stores the amount of frames written so far."""
+        self.__written = written
@@ -0,0 +1,102 @@
+from typing import List, Tuple
+
+import numpy as np
+
+from .coordinates import Coordinates
+from .point import Point
+from .trajectorystore import TrajectoryStore
+
+# the duration of a frame, or the time of each frame (in milliseconds)
+FrameTimes = float | np.ndarray
+
+
+def frame_times(indices: np.ndarray, times_ms: FrameTimes) -> np.ndarray:
+    """Returns the times of some frames.
+
+    Args:
+        indices (ndarray): The indices (starting at 0) of the frames
+        times_ms (FrameTimes): The duration of a frame, for videos with \
+a constant frame rate, or the time of every frame (in milliseconds)
+
+    Returns:
+        ndarray: The time of each frame (in milliseconds)
+    """
+    if np.ndim(times_ms) == 0:
+        return indices * times_ms
+
+    return np.asarray(times_ms)[indices]
+
+
+class ReferenceFrame:
+    """Represents the reference frame defined by the user: an origin and \
+a scale used to convert canvas coordinates to real coordinates."""
+
+    def __init__(self, origin: Point, scale: float) -> None:
+        self.__origin = origin
+        self.__scale = scale
+
+    @property
+    def origin(self) -> Point:
+        """The origin of the reference frame (in canvas coordinates)."""
+        return self.__origin
+
+    @property
+    def scale(self) -> float:
+        """The scale of the reference frame (in pixels per meter)."""
+        return self.__scale
+
+    def transformed(self, point: Point) -> Point:
+        """Converts a point in canvas coordinates to real coordinates.
+
+        Args:
+            point (Point): The point in canvas coordinates
+
+        Returns:
+            Point: The point relative to the origin (in meters)
+        """
+        return Coordinates.scaled(
+            Coordinates.relative_to_origin(self.__origin, point),
+            1 / self.__scale,
+            1 / self.__scale,
+        )
+
+    def transformed_batch(
+        self, x: np.ndarray, y: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Converts points in canvas coordinates to real coordinates.
+
+        Args:
+            x (ndarray): The x coordinates of the points in canvas coordinates
+            y (ndarray): The y coordinates of the points in canvas coordinates
+
+        Returns:
+            Tuple[ndarray, ndarray]: The coordinates relative to the origin \
+(in meters)
+        """
+        x, y = Coordinates.relative_to_origin_batch(self.__origin, x, y)
+        return Coordinates.scaled_batch(x, y, 1 / self.__scale, 1 / self.__scale)
+
+    def transformed_values(
+        self,
+        points: TrajectoryStore | List[Point | None],
+        times_ms: FrameTimes,
+    ) -> Tuple[TrajectoryStore, np.ndarray]:
+        """Converts the points acquired on each frame of a video.
+
+        Args:
+            points (TrajectoryStore | List[Point | None]): The point of each frame \
+in canvas coordinates, or None if there is no point on a frame
+            times_ms (FrameTimes): The duration of a frame, or the time of \
+each frame (see Video.timestamps_ms)
+
+        Returns:
+            Tuple[TrajectoryStore, ndarray]: The transformed points and \
+their times in milliseconds, skipping frames without a point.
+        """
+        if not isinstance(points, TrajectoryStore):
+            points = TrajectoryStore.from_points(points)
+
+        indices = points.indices()
+        x, y = self.transformed_batch(points.x[indices], points.y[indices])
+
+        return TrajectoryStore.from_arrays(x, y), frame_times(indices, times_ms)
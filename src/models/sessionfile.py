@@ -0,0 +1,273 @@
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, List, Optional
+
+import numpy as np
+
+from .point import Point
+from .proxycache import user_cache_directory
+from .sessionsnapshot import SessionSnapshot
+from .trajectorystore import TrajectoryStore
+
+SESSION_EXTENSION = ".vtsession"
+JOURNAL_SUFFIX = ".journal"
+
+# magic, version, length of the metadata
+SESSION_MAGIC = b"VTSS"
+SESSION_VERSION = 1
+SESSION_HEADER = struct.Struct("<4sHxxQ")
+
+# object, frame, x and y, a removed point has a NaN x
+JOURNAL_RECORD = struct.Struct("<Iqdd")
+JOURNAL_DTYPE = np.dtype(
+    [("object", "<u4"), ("frame", "<i8"), ("x", "<f8"), ("y", "<f8")]
+)
+# the journal is compacted into the snapshot after this many records
+COMPACT_RECORDS = 4096
+
+
+def default_session_path(video_hash: str) -> Path:
+    """Returns where the session of a video is saved automatically, \
+in the user's cache directory.
+
+    Args:
+        video_hash (str): The content hash of the video \
+(see FileRepo.content_hash)
+
+    Returns:
+        Path: The path of the snapshot
+    """
+    return (
+        user_cache_directory()
+        .joinpath("sessions")
+        .joinpath(video_hash + SESSION_EXTENSION)
+    )
+
+
+class SessionFile:
+    """Saves a session as a snapshot and an append-only journal next to it. \
+Each point edit is appended to the journal as a fixed-size record, so saving \
+it does not depend on the amount of points, and the journal is compacted into \
+a new snapshot from time to time.
+
+    NOTE: The snapshot is written under a temporary name and renamed once \
+complete, then the journal is emptied. Records only set or remove points, so \
+replaying a journal that was already compacted (after a crash between \
+both steps) gives the same points.
+    """
+
+    def __init__(
+        self, path: str | Path, compact_records: int = COMPACT_RECORDS
+    ) -> None:
+        """Opens a session file, which is only read or written when asked.
+
+        Args:
+            path (str | Path): The path of the snapshot
+            compact_records (int, optional): The amount of journal records \
+after which compacting is due. Defaults to COMPACT_RECORDS.
+        """
+        self.__path = Path(path)
+        self.__compact_records = compact_records
+        self.__journal: Optional[BinaryIO] = None
+        self.__records = 0
+
+    @property
+    def path(self) -> Path:
+        """The path of the snapshot."""
+        return self.__path
+
+    @property
+    def journal_path(self) -> Path:
+        """The path of the journal."""
+        return self.__path.with_name(self.__path.name + JOURNAL_SUFFIX)
+
+    @property
+    def journal_records(self) -> int:
+        """The amount of records appended since the last snapshot."""
+        return self.__records
+
+    def exists(self) -> bool:
+        """Returns whether a snapshot was saved.
+
+        Returns:
+            bool: True if the snapshot exists
+        """
+        return self.__path.is_file()
+
+    def save(self, snapshot: SessionSnapshot) -> None:
+        """Replaces the snapshot and empties the journal.
+
+        Args:
+            snapshot (SessionSnapshot): The current state of the session
+
+        Raises:
+            OSError: The snapshot cannot be written
+        """
+        names = list(snapshot.objects)
+        indices = [points.indices() for points in snapshot.objects.values()]
+        metadata = {
+            "video_path": snapshot.video_path,
+            "video_hash": snapshot.video_hash,
+            "frame_count": snapshot.frame_count,
+            "origin": (
+                None
+                if snapshot.origin is None
+                else [snapshot.origin.x, snapshot.origin.y]
+            ),
+            "scale": snapshot.scale,
+            "mass": snapshot.mass,
+            "active": snapshot.active,
+            "objects": [
+                {"name": name, "count": len(frames)}
+                for name, frames in zip(names, indices)
+            ],
+        }
+        encoded = json.dumps(metadata).encode()
+
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        partial = self.__path.with_name(self.__path.name + ".part")
+        with open(partial, "wb") as file:
+            file.write(
+                SESSION_HEADER.pack(SESSION_MAGIC, SESSION_VERSION, len(encoded))
+            )
+            file.write(encoded)
+            for points, frames in zip(snapshot.objects.values(), indices):
+                frames.astype("<i8").tofile(file)
+                np.ascontiguousarray(points.x[frames], dtype="<f8").tofile(file)
+                np.ascontiguousarray(points.y[frames], dtype="<f8").tofile(file)
+        os.replace(partial, self.__path)
+
+        self.close()
+        self.journal_path.unlink(missing_ok=True)
+
+    def append(self, object_index: int, frame: int, point: Optional[Point]) -> bool:
+        """Appends a point edit to the journal.
+
+        Args:
+            object_index (int): The position of the object in the session
+            frame (int): The index (starting at 0) of the frame
+            point (Optional[Point]): The new point, or None if it was removed
+
+        Raises:
+            OSError: The journal cannot be written
+
+        Returns:
+            bool: True if the journal should be compacted (see SessionFile.save)
+        """
+        if self.__journal is None:
+            self.__journal = open(self.journal_path, "ab")
+
+        x, y = (np.nan, np.nan) if point is None else (point.x, point.y)
+        self.__journal.write(JOURNAL_RECORD.pack(object_index, frame, x, y))
+        # the record reaches the system right away, so it survives a crash
+        self.__journal.flush()
+
+        self.__records += 1
+        return self.__records >= self.__compact_records
+
+    def load(self) -> SessionSnapshot:
+        """Reads the snapshot and applies the edits of the journal.
+
+        Raises:
+            ValueError: The file is not a session file
+            OSError: The file cannot be read
+
+        Returns:
+            SessionSnapshot: The last saved state of the session
+        """
+        data = self.__path.read_bytes()
+        if len(data) < SESSION_HEADER.size:
+            raise ValueError("Invalid session file")
+
+        magic, version, length = SESSION_HEADER.unpack_from(data)
+        if magic != SESSION_MAGIC or version != SESSION_VERSION:
+            raise ValueError("Invalid session file")
+
+        offset = SESSION_HEADER.size + length
+        try:
+            metadata: Dict[str, Any] = json.loads(data[SESSION_HEADER.size : offset])
+            frame_count = int(metadata["frame_count"])
+            names: List[str] = [item["name"] for item in metadata["objects"]]
+            counts: List[int] = [int(item["count"]) for item in metadata["objects"]]
+            if not names:
+                raise ValueError("No objects")
+        except (ValueError, KeyError, TypeError):
+            raise ValueError("Invalid session file")
+
+        if offset + sum(counts) * 24 != len(data):
+            raise ValueError("Invalid session file")
+
+        columns = []
+        for count in counts:
+            frames = np.frombuffer(data, "<i8", count, offset)
+            x = np.frombuffer(data, "<f8", count, offset + count * 8)
+            y = np.frombuffer(data, "<f8", count, offset + count * 16)
+            offset += count * 24
+            if count > 0 and not 0 <= frames.min() <= frames.max() < frame_count:
+                raise ValueError("Invalid session file")
+
+            valid = np.zeros(frame_count, dtype=np.bool_)
+            full_x = np.zeros(frame_count)
+            full_y = np.zeros(frame_count)
+            valid[frames] = True
+            full_x[frames] = x
+            full_y[frames] = y
+            columns.append((full_x, full_y, valid))
+
+        self.__replay(columns)
+        origin = metadata.get("origin")
+        return SessionSnapshot(
+            metadata.get("video_path", ""),
+            metadata.get("video_hash"),
+            frame_count,
+            {
+                name: TrajectoryStore.from_arrays(*column)
+                for name, column in zip(names, columns)
+            },
+            metadata.get("active") or names[0],
+            None if origin is None else Point(*origin),
+            metadata.get("scale"),
+            metadata.get("mass"),
+        )
+
+    def __replay(self, columns: List[Any]) -> None:
+        """Applies the records of the journal to the columns of each object, \
+the last record of a frame wins. A record cut by a crash is ignored."""
+        try:
+            data = self.journal_path.read_bytes()
+        except FileNotFoundError:
+            return
+
+        complete = len(data) // JOURNAL_DTYPE.itemsize
+        records = np.frombuffer(data, JOURNAL_DTYPE, complete)
+        self.__records = complete
+        if complete == 0:
+            return
+
+        frame_count = len(columns[0][0]) if columns else 0
+        keys = records["object"].astype(np.int64) * (frame_count + 1) + records["frame"]
+        # the position of the last record of each object and frame
+        _, reversed_first = np.unique(keys[::-1], return_index=True)
+        records = records[complete - 1 - reversed_first]
+
+        for object_index, (x, y, valid) in enumerate(columns):
+            edits = records[
+                (records["object"] == object_index)
+                & (records["frame"] >= 0)
+                & (records["frame"] < frame_count)
+            ]
+            frames = edits["frame"]
+            removed = np.isnan(edits["x"])
+            valid[frames] = ~removed
+            x[frames[~removed]] = edits["x"][~removed]
+            y[frames[~removed]] = edits["y"][~removed]
+
+    def close(self) -> None:
+        """Closes the journal, it is opened again by the next edit."""
+        if self.__journal is not None:
+            self.__journal.close()
+            self.__journal = None
+
+        self.__records = 0
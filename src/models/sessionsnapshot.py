@@ -0,0 +1,84 @@
+from typing import Dict, Optional
+
+from .point import Point
+from .trajectorystore import TrajectoryStore
+
+
+class SessionSnapshot:
+    """Represents the state of a session at some point: the video, \
+the reference frame and the points of each object."""
+
+    def __init__(
+        self,
+        video_path: str,
+        video_hash: Optional[str],
+        frame_count: int,
+        objects: Dict[str, TrajectoryStore],
+        active: str,
+        origin: Optional[Point] = None,
+        scale: Optional[float] = None,
+        mass: Optional[float] = None,
+    ) -> None:
+        self.__video_path = video_path
+        self.__video_hash = video_hash
+        self.__frame_count = frame_count
+        self.__objects = objects
+        self.__active = active
+        self.__origin = origin
+        self.__scale = scale
+        self.__mass = mass
+
+    @property
+    def video_path(self) -> str:
+        """The path of the video."""
+        return self.__video_path
+
+    @property
+    def video_hash(self) -> Optional[str]:
+        """The content hash of the video (see FileRepo.content_hash), \
+or None if it is unknown."""
+        return self.__video_hash
+
+    @property
+    def frame_count(self) -> int:
+        """The amount of frames of the video."""
+        return self.__frame_count
+
+    @property
+    def objects(self) -> Dict[str, TrajectoryStore]:
+        """The point of each frame (in video pixels) of each object, \
+by name, in creation order."""
+        return self.__objects
+
+    @property
+    def active(self) -> str:
+        """The name of the active object."""
+        return self.__active
+
+    @property
+    def origin(self) -> Optional[Point]:
+        """The origin of the reference frame (in video pixels), or None \
+if it is not defined."""
+        return self.__origin
+
+    @property
+    def scale(self) -> Optional[float]:
+        """The scale of the reference frame (in pixels per meter), or None \
+if it is not defined."""
+        return self.__scale
+
+    @property
+    def mass(self) -> Optional[float]:
+        """The mass of the objects (in kilograms), or None if it was not asked."""
+        return self.__mass
+
+    @property
+    def last_frame(self) -> Optional[int]:
+        """The index (starting at 0) of the last frame where an object has \
+a point, or None if there are no points."""
+        last = [
+            int(indices[-1])
+            for indices in (points.indices() for points in self.__objects.values())
+            if len(indices) > 0
+        ]
+        return max(last) if last else None
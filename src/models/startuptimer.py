@@ -0,0 +1,81 @@
+from threading import Lock
+from time import perf_counter
+from typing import Callable, List, Optional, Tuple
+
+
+class StartupTimer:
+    """Records when each step of the startup of the application ends, \
+to track the time it takes for the window to appear."""
+
+    def __init__(
+        self,
+        start: Optional[float] = None,
+        clock: Callable[[], float] = perf_counter,
+    ) -> None:
+        """Creates a timer without any step.
+
+        Args:
+            start (Optional[float], optional): The time at which the startup \
+began, as returned by the clock, or None for now. Defaults to None.
+            clock (Callable[[], float], optional): Returns the current time \
+(in seconds). Defaults to perf_counter.
+        """
+        self.__clock = clock
+        self.__start = clock() if start is None else start
+        self.__steps: List[Tuple[str, float]] = []
+        # steps can end in background threads, like the warm-up of modules
+        self.__lock = Lock()
+
+    @property
+    def steps(self) -> List[Tuple[str, float]]:
+        """The name of each step and when it ended (in milliseconds since \
+the start), in the order they ended."""
+        with self.__lock:
+            return list(self.__steps)
+
+    def mark(self, step: str) -> float:
+        """Records that a step just ended.
+
+        Args:
+            step (str): The name of the step
+
+        Returns:
+            float: The time elapsed since the start (in milliseconds)
+        """
+        elapsed = (self.__clock() - self.__start) * 1000
+        with self.__lock:
+            self.__steps.append((step, elapsed))
+
+        return elapsed
+
+    def elapsed(self, step: str) -> Optional[float]:
+        """Returns when a step ended.
+
+        Args:
+            step (str): The name of the step
+
+        Returns:
+            Optional[float]: The time elapsed between the start and the end \
+of the step (in milliseconds), or None if it did not end yet
+        """
+        for name, elapsed in self.steps:
+            if name == step:
+                return elapsed
+
+        return None
+
+    def report(self) -> str:
+        """Returns when each step ended and how long it took, one step per line.
+
+        Returns:
+            str: The report
+        """
+        lines: List[str] = []
+        previous = 0.0
+        for name, elapsed in sorted(self.steps, key=lambda step: step[1]):
+            lines.append(
+                f"{name:<20}{elapsed:>10.1f} ms (+{elapsed - previous:.1f} ms)"
+            )
+            previous = elapsed
+
+        return "\n".join(lines)
@@ -0,0 +1,327 @@
+import os
+import shutil
+from bisect import bisect_left
+from concurrent.futures import Future
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from .proxycache import user_cache_directory
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+THUMBNAIL_HEIGHT = 48
+THUMBNAIL_EXTENSION = ".ppm"
+DEFAULT_THUMBNAIL_CACHE_BYTES = 256 * 1024 * 1024
+
+# frames closer than this are reached by grabbing instead of seeking
+MAX_GRABBED_FRAMES = 16
+
+
+def thumbnail_frames(frame_count: int, count: int) -> List[int]:
+    """Returns evenly spaced frames of a video, one for each thumbnail.
+
+    Args:
+        frame_count (int): The amount of frames in the video
+        count (int): The amount of thumbnails
+
+    Returns:
+        List[int]: The sorted indices of the frames, without duplicates
+    """
+    if frame_count <= 0 or count <= 0:
+        return []
+
+    return sorted({index * frame_count // count for index in range(count)})
+
+
+def split_ranges(frames: List[int], jobs: int) -> List[List[int]]:
+    """Splits sorted frames in contiguous ranges, one for each job.
+
+    Args:
+        frames (List[int]): The sorted frames
+        jobs (int): The amount of jobs
+
+    Returns:
+        List[List[int]]: The non-empty ranges
+    """
+    jobs = max(min(jobs, len(frames)), 1)
+    size, extra = divmod(len(frames), jobs)
+    ranges: List[List[int]] = []
+    start = 0
+    for job in range(jobs):
+        end = start + size + (1 if job < extra else 0)
+        if end > start:
+            ranges.append(frames[start:end])
+        start = end
+
+    return ranges
+
+
+def render_thumbnails(
+    filename: str, frames: List[int], directory: str, height: int = THUMBNAIL_HEIGHT
+) -> List[Tuple[int, str]]:
+    """Writes the thumbnails of some frames of a video, with a capture \
+of its own so that it can run in another process.
+
+    Args:
+        filename (str): The path of the video
+        frames (List[int]): The sorted frames
+        directory (str): The directory where the thumbnails are written
+        height (int, optional): The height of the thumbnails (in pixels). \
+Defaults to THUMBNAIL_HEIGHT.
+
+    Returns:
+        List[Tuple[int, str]]: The frame and the path of each written thumbnail
+    """
+    # OpenCV is imported here so that the timeline can be shown before it is loaded
+    import cv2
+
+    capture = cv2.VideoCapture(filename)
+    written: List[Tuple[int, str]] = []
+    position = -1
+    try:
+        for frame_index in frames:
+            if position < 0 or not 0 <= frame_index - position <= MAX_GRABBED_FRAMES:
+                capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+                position = frame_index
+
+            while position < frame_index and capture.grab():
+                position += 1
+
+            ret, frame = capture.read()
+            if not ret:
+                position = -1
+                continue
+            position += 1
+
+            width = max(round(frame.shape[1] * height / frame.shape[0]), 1)
+            thumbnail = cv2.resize(frame, (width, height), interpolation=cv2.INTER_AREA)
+            path = Path(directory).joinpath(f"{frame_index}{THUMBNAIL_EXTENSION}")
+            partial = path.with_name(f"{frame_index}.part{THUMBNAIL_EXTENSION}")
+            if cv2.imwrite(str(partial), thumbnail):
+                partial.replace(path)
+                written.append((frame_index, str(path)))
+    finally:
+        capture.release()
+
+    return written
+
+
+class ThumbnailCache:
+    """The thumbnails of a video stored on disk, in a directory named after \
+the content hash of the video. The thumbnails of the least recently used \
+videos are deleted when the total size exceeds a limit."""
+
+    def __init__(
+        self,
+        content_hash: str,
+        directory: Optional[str | Path] = None,
+        max_bytes: int = DEFAULT_THUMBNAIL_CACHE_BYTES,
+    ):
+        if max_bytes < 1:
+            raise ValueError("'max_bytes' must be at least 1")
+
+        self.__base = Path(
+            user_cache_directory().joinpath("thumbnails")
+            if directory is None
+            else directory
+        )
+        self.__directory = self.__base.joinpath(content_hash)
+        self.__max_bytes = max_bytes
+        self.__frames: List[int] = []
+        self.refresh()
+        if self.__directory.is_dir():
+            # marks the thumbnails of the video as the most recently used
+            os.utime(self.__directory)
+
+    @property
+    def directory(self) -> Path:
+        """The directory of the thumbnails of the video."""
+        return self.__directory
+
+    @property
+    def max_bytes(self) -> int:
+        """The maximum total size of the thumbnails of every video (in bytes)."""
+        return self.__max_bytes
+
+    @property
+    def frames(self) -> List[int]:
+        """The sorted frames that have a thumbnail."""
+        return self.__frames
+
+    def refresh(self) -> None:
+        """Reads which thumbnails exist on disk."""
+        frames: List[int] = []
+        if self.__directory.is_dir():
+            for path in self.__directory.glob("*" + THUMBNAIL_EXTENSION):
+                if path.stem.isdigit():
+                    frames.append(int(path.stem))
+
+        self.__frames = sorted(frames)
+
+    def add(self, frame_index: int) -> None:
+        """Records that the thumbnail of a frame was written.
+
+        Args:
+            frame_index (int): The index of the frame
+        """
+        position = bisect_left(self.__frames, frame_index)
+        if position == len(self.__frames) or self.__frames[position] != frame_index:
+            self.__frames.insert(position, frame_index)
+
+    def path(self, frame_index: int) -> Path:
+        """Returns the path of the thumbnail of a frame, which may not exist.
+
+        Args:
+            frame_index (int): The index of the frame
+
+        Returns:
+            Path: The path of the thumbnail
+        """
+        return self.__directory.joinpath(f"{frame_index}{THUMBNAIL_EXTENSION}")
+
+    def nearest(self, frame_index: int) -> Optional[Tuple[int, Path]]:
+        """Returns the cached thumbnail closest to a frame.
+
+        Args:
+            frame_index (int): The index of the frame
+
+        Returns:
+            Optional[Tuple[int, Path]]: The frame of the thumbnail and its path, \
+or None if there is no thumbnail
+        """
+        if not self.__frames:
+            return None
+
+        position = bisect_left(self.__frames, frame_index)
+        candidates = self.__frames[max(position - 1, 0) : position + 1]
+        nearest = min(candidates, key=lambda frame: abs(frame - frame_index))
+        return nearest, self.path(nearest)
+
+    def videos(self) -> List[Path]:
+        """Returns the thumbnail directories of every video, from the least \
+recently used."""
+        if not self.__base.is_dir():
+            return []
+
+        paths = [path for path in self.__base.iterdir() if path.is_dir()]
+        return sorted(paths, key=lambda path: path.stat().st_mtime)
+
+    def size_bytes(self) -> int:
+        """Returns the total size of the thumbnails of every video (in bytes)."""
+        return sum(ThumbnailCache.__directory_size(path) for path in self.videos())
+
+    def evict(self) -> List[Path]:
+        """Deletes the thumbnails of the least recently used videos until \
+the total size is within the limit. The thumbnails of this video are kept.
+
+        Returns:
+            List[Path]: The deleted directories
+        """
+        videos = self.videos()
+        sizes = [ThumbnailCache.__directory_size(path) for path in videos]
+        total = sum(sizes)
+        deleted: List[Path] = []
+        for path, size in zip(videos, sizes):
+            if total <= self.__max_bytes:
+                break
+
+            if path == self.__directory:
+                continue
+
+            total -= size
+            shutil.rmtree(path, ignore_errors=True)
+            deleted.append(path)
+
+        return deleted
+
+    @staticmethod
+    def __directory_size(directory: Path) -> int:
+        """Returns the total size of the files of a directory (in bytes)."""
+        return sum(
+            path.stat().st_size for path in directory.iterdir() if path.is_file()
+        )
+
+
+class ThumbnailGenerator:
+    """Renders the missing thumbnails of a video in a process pool, each \
+process rendering a disjoint range of frames."""
+
+    def __init__(
+        self,
+        filename: str,
+        cache: ThumbnailCache,
+        frames: List[int],
+        jobs: int,
+        height: int = THUMBNAIL_HEIGHT,
+    ) -> None:
+        self.__filename = filename
+        self.__cache = cache
+        self.__missing = [frame for frame in frames if not cache.path(frame).is_file()]
+        self.__jobs = max(jobs, 1)
+        self.__height = height
+
+        self.__executor: Optional["ProcessPoolExecutor"] = None
+        self.__futures: List[Future[List[Tuple[int, str]]]] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether some thumbnails are still being rendered."""
+        return any(not future.done() for future in self.__futures)
+
+    def start(self) -> None:
+        """Starts rendering the missing thumbnails."""
+        if self.__executor is not None or not self.__missing:
+            return
+
+        # imported here because loading multiprocessing slows down startup
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        self.__cache.directory.mkdir(parents=True, exist_ok=True)
+        ranges = split_ranges(self.__missing, self.__jobs)
+        # forking while other threads hold FFmpeg locks can deadlock the workers
+        self.__executor = ProcessPoolExecutor(
+            max_workers=len(ranges), mp_context=multiprocessing.get_context("spawn")
+        )
+        self.__futures = [
+            self.__executor.submit(
+                render_thumbnails,
+                self.__filename,
+                frames,
+                str(self.__cache.directory),
+                self.__height,
+            )
+            for frames in ranges
+        ]
+
+    def collect(self) -> List[Tuple[int, Path]]:
+        """Returns the thumbnails rendered since the last call, and adds \
+them to the cache.
+
+        Returns:
+            List[Tuple[int, Path]]: The frame and the path of each new thumbnail
+        """
+        rendered: List[Tuple[int, Path]] = []
+        pending: List[Future[List[Tuple[int, str]]]] = []
+        for future in self.__futures:
+            if not future.done():
+                pending.append(future)
+            elif not future.cancelled() and future.exception() is None:
+                for frame_index, path in future.result():
+                    self.__cache.add(frame_index)
+                    rendered.append((frame_index, Path(path)))
+
+        self.__futures = pending
+        if not pending and self.__executor is not None:
+            self.__executor.shutdown(wait=False)
+            self.__executor = None
+
+        return rendered
+
+    def cancel(self) -> None:
+        """Stops rendering. The thumbnails already written are kept."""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+            self.__executor = None
+        self.__futures = []
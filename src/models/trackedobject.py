@@ -0,0 +1,137 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .kinematics import Kinematics
+from .point import Point
+from .referenceframe import FrameTimes, ReferenceFrame
+from .trajectorystore import TrajectoryStore
+from .transformcache import TransformCache
+
+
+class TrackedObject:
+    """An object followed on the video, with its own points and the values \
+computed from them. Transformed values and kinematics are kept until one of \
+its points or the reference frame changes, so objects that did not change are \
+not computed again."""
+
+    def __init__(
+        self, name: str, color: str, frame_count: int, times_ms: FrameTimes
+    ) -> None:
+        """Creates an object without any point.
+
+        Args:
+            name (str): The name of the object, shown to the user
+            color (str): The color of its points, as a Tk color name
+            frame_count (int): The amount of frames of the video
+            times_ms (FrameTimes): The duration of a frame, or the time of \
+each frame (see Video.timestamps_ms)
+        """
+        self.__name = name
+        self.__color = color
+        self.__times = times_ms
+        self.__points = TrajectoryStore(frame_count)
+        self.__transform_cache = TransformCache(self.__points, times_ms)
+
+        # the last computed kinematics and the values they were computed from
+        self.__kinematics: Optional[Kinematics] = None
+        self.__kinematics_source: Optional[Tuple[object, int, int]] = None
+
+    @property
+    def name(self) -> str:
+        """The name of the object."""
+        return self.__name
+
+    @property
+    def color(self) -> str:
+        """The color of the points of the object."""
+        return self.__color
+
+    @property
+    def points(self) -> TrajectoryStore:
+        """The point of each frame, in video pixels."""
+        return self.__points
+
+    def set_point(self, index: int, point: Optional[Point]) -> None:
+        """Sets the point of a frame and transforms it again.
+
+        Args:
+            index (int): The index (starting at 0) of the frame
+            point (Optional[Point]): The point, or None to remove it
+        """
+        self.__points[index] = point
+        self.__transform_cache.update(index)
+
+    def replace_points(self, points: TrajectoryStore) -> None:
+        """Replaces every point of the object at once, when a session is \
+restored for example.
+
+        Args:
+            points (TrajectoryStore): The point of each frame, in video pixels
+
+        Raises:
+            ValueError: The store does not have a point for each frame
+        """
+        if len(points) != len(self.__points):
+            raise ValueError("The store does not match the frames of the video")
+
+        frame = self.__transform_cache.reference_frame
+        self.__points = points
+        self.__transform_cache = TransformCache(points, self.__times)
+        self.__transform_cache.set_reference_frame(frame)
+        self.__kinematics = None
+        self.__kinematics_source = None
+
+    def set_reference_frame(self, frame: Optional[ReferenceFrame]) -> None:
+        """Changes the reference frame, every point is transformed again \
+the next time values are needed.
+
+        Args:
+            frame (Optional[ReferenceFrame]): The new reference frame
+        """
+        self.__transform_cache.set_reference_frame(frame)
+
+    def values(self) -> Tuple[TrajectoryStore, np.ndarray]:
+        """Returns the transformed points and their times (see \
+TransformCache.values).
+
+        Returns:
+            Tuple[TrajectoryStore, ndarray]: The transformed points and \
+their times in milliseconds, skipping frames without a point
+        """
+        return self.__transform_cache.values()
+
+    def kinematics(
+        self, smoothing_window: int = 0, smoothing_order: int = 2
+    ) -> Kinematics:
+        """Returns the velocity, acceleration and energy of the object. \
+They are computed again only when the transformed values or the smoothing \
+change.
+
+        Args:
+            smoothing_window (int, optional): The window of the Savitzky-Golay \
+filter, or 0 for no smoothing. Defaults to 0.
+            smoothing_order (int, optional): The order of the Savitzky-Golay \
+filter. Defaults to 2.
+
+        Returns:
+            Kinematics: The kinematics of the transformed points
+        """
+        values = self.values()
+        source = (values, smoothing_window, smoothing_order)
+        cached = self.__kinematics_source
+        if (
+            self.__kinematics is None
+            or cached is None
+            or cached[0] is not values
+            or cached[1:] != source[1:]
+        ):
+            self.__kinematics = Kinematics(
+                *values,
+                smoothing_window=smoothing_window,
+                smoothing_order=smoothing_order,
+                frames=self.__points.indices(),
+            )
+            self.__kinematics_source = source
+
+        return self.__kinematics
@@ -0,0 +1,270 @@
+from math import isfinite
+from queue import Queue
+from threading import Event, Thread
+from time import perf_counter
+from typing import Iterator, Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .frameindex import FrameIndex
+from .point import Point
+
+
+class Tracker:
+    """Follows an object from frame to frame by looking for the area around \
+its first position in a search window around its last position."""
+
+    def __init__(
+        self,
+        template_radius: int = 16,
+        search_radius: int = 32,
+        min_confidence: float = 0.6,
+    ) -> None:
+        self.__template_radius = template_radius
+        self.__search_radius = search_radius
+        self.__min_confidence = min_confidence
+
+        self.__template: Optional[np.ndarray] = None
+        # the position of the tracked point in the template
+        self.__offset = Point(0, 0)
+        self.__position: Optional[Point] = None
+
+    @property
+    def min_confidence(self) -> float:
+        """The confidence under which the object is considered lost."""
+        return self.__min_confidence
+
+    @property
+    def position(self) -> Optional[Point]:
+        """The last known position of the object, or None if tracking did not start."""
+        return self.__position
+
+    @staticmethod
+    def __window(
+        frame: np.ndarray, center: Point, radius: int
+    ) -> Tuple[int, int, np.ndarray]:
+        """Returns the square area around a point, cropped to the frame.
+
+        Args:
+            frame (ndarray): The grayscale frame
+            center (Point): The center of the area
+            radius (int): The half size of the area
+
+        Returns:
+            Tuple[int, int, ndarray]: The coordinates of the top left corner \
+and the area
+        """
+        height, width = frame.shape[:2]
+        x = int(round(center.x))
+        y = int(round(center.y))
+        left = min(max(x - radius, 0), width)
+        top = min(max(y - radius, 0), height)
+        right = max(min(x + radius + 1, width), left)
+        bottom = max(min(y + radius + 1, height), top)
+
+        return left, top, frame[top:bottom, left:right]
+
+    def start(self, frame: np.ndarray, point: Point) -> None:
+        """Starts tracking the object at a point.
+
+        Args:
+            frame (ndarray): The BGR frame where the object was selected
+            point (Point): The position of the object
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        left, top, self.__template = Tracker.__window(
+            gray, point, self.__template_radius
+        )
+        self.__offset = Point(point.x - left, point.y - top)
+        self.__position = point
+
+    def update(self, frame: np.ndarray) -> Tuple[Point, float]:
+        """Finds the object in the next frame.
+
+        Args:
+            frame (ndarray): The BGR frame
+
+        Raises:
+            ValueError: Tracking did not start
+
+        Returns:
+            Tuple[Point, float]: The new position of the object and the \
+confidence of the match, between -1 and 1
+        """
+        if self.__template is None or self.__position is None:
+            raise ValueError("Tracking did not start")
+
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        left, top, window = Tracker.__window(
+            gray,
+            self.__position,
+            self.__template_radius + self.__search_radius,
+        )
+
+        template_height, template_width = self.__template.shape[:2]
+        window_height, window_width = window.shape[:2]
+        if (
+            template_height == 0
+            or template_width == 0
+            or window_height < template_height
+            or window_width < template_width
+        ):
+            return self.__position, 0.0
+
+        result = cv2.matchTemplate(window, self.__template, cv2.TM_CCOEFF_NORMED)
+        _, confidence, _, location = cv2.minMaxLoc(result)
+        if not isfinite(confidence):
+            return self.__position, 0.0
+
+        position = Point(
+            left + location[0] + self.__offset.x,
+            top + location[1] + self.__offset.y,
+        )
+        if confidence >= self.__min_confidence:
+            self.__position = position
+
+        return position, confidence
+
+
+def track(
+    filename: str,
+    start_frame: int,
+    point: Point,
+    tracker: Optional[Tracker] = None,
+    frame_index: Optional[FrameIndex] = None,
+) -> Iterator[Tuple[int, Point, float]]:
+    """Tracks an object in a video, starting from a point selected on a frame. \
+Stops after the first frame where the confidence is too low.
+
+    Args:
+        filename (str): The path of the video file
+        start_frame (int): The index (starting at 0) of the frame where the \
+object was selected
+        point (Point): The position of the object on that frame
+        tracker (Optional[Tracker], optional): The tracker to use, or None \
+for a tracker with the default settings. Defaults to None.
+        frame_index (Optional[FrameIndex], optional): The index of the video, \
+used to seek precisely. Defaults to None.
+
+    Yields:
+        Tuple[int, Point, float]: The index of a frame, the position of the \
+object and the confidence of the match (1 for the start frame)
+    """
+    if tracker is None:
+        tracker = Tracker()
+
+    capture = cv2.VideoCapture(filename)
+    try:
+        if frame_index is None:
+            capture.set(cv2.CAP_PROP_POS_FRAMES, start_frame)
+        else:
+            frame_index.seek(capture, 0, start_frame)
+
+        ret, frame = capture.read()
+        if not ret:
+            return
+
+        tracker.start(frame, point)
+        yield start_frame, point, 1.0
+
+        index = start_frame + 1
+        ret, frame = capture.read()
+        while ret:
+            position, confidence = tracker.update(frame)
+            yield index, position, confidence
+            if confidence < tracker.min_confidence:
+                return
+
+            index += 1
+            ret, frame = capture.read()
+    finally:
+        capture.release()
+
+
+class TrackingWorker:
+    """Tracks an object in a background thread. Tracked positions are \
+put in a queue so that they can be read from the UI thread."""
+
+    def __init__(
+        self,
+        filename: str,
+        start_frame: int,
+        point: Point,
+        tracker: Optional[Tracker] = None,
+        frame_index: Optional[FrameIndex] = None,
+    ) -> None:
+        self.__filename = filename
+        self.__start_frame = start_frame
+        self.__point = point
+        self.__tracker = Tracker() if tracker is None else tracker
+        self.__frame_index = frame_index
+
+        self.results: Queue[Tuple[int, Point]] = Queue()
+        self.__cancelled = Event()
+        self.__thread: Optional[Thread] = None
+
+        self.__tracked_frames = 0
+        self.__elapsed = 0.0
+        self.__lost_frame: Optional[int] = None
+        self.__last_frame = start_frame
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is running."""
+        return self.__thread is not None and self.__thread.is_alive()
+
+    @property
+    def fps(self) -> float:
+        """The amount of frames tracked per second."""
+        if self.__elapsed <= 0:
+            return 0.0
+
+        return self.__tracked_frames / self.__elapsed
+
+    @property
+    def last_frame(self) -> int:
+        """The index of the last frame where the object was found."""
+        return self.__last_frame
+
+    @property
+    def lost_frame(self) -> Optional[int]:
+        """The index of the frame where the object was lost, or None if \
+it was not lost (the end of the video was reached or tracking was cancelled)."""
+        return self.__lost_frame
+
+    def start(self) -> None:
+        """Starts the worker thread."""
+        if not self.running:
+            self.__cancelled.clear()
+            self.__thread = Thread(target=self.__run, daemon=True)
+            self.__thread.start()
+
+    def cancel(self) -> None:
+        """Stops tracking and waits for the worker thread to finish."""
+        self.__cancelled.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __run(self) -> None:
+        """Tracks the object until it is lost or the worker is cancelled."""
+        start = perf_counter()
+        for index, position, confidence in track(
+            self.__filename,
+            self.__start_frame,
+            self.__point,
+            self.__tracker,
+            self.__frame_index,
+        ):
+            if self.__cancelled.is_set():
+                break
+
+            if confidence < self.__tracker.min_confidence:
+                self.__lost_frame = index
+                break
+
+            self.results.put((index, position))
+            self.__last_frame = index
+            self.__tracked_frames += 1
+            self.__elapsed = perf_counter() - start
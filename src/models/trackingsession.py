@@ -0,0 +1,224 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from .referenceframe import FrameTimes, ReferenceFrame, frame_times
+from .sessionsnapshot import SessionSnapshot
+from .trackedobject import TrackedObject
+
+# the colors given to new objects, in order, the first one is used when there
+# is a single object
+OBJECT_COLORS = ("red", "blue", "green3", "orange", "magenta", "cyan", "yellow")
+
+
+class TrackingSession:
+    """The objects followed on a video, one of them being active: clicks and \
+automatic tracking set the points of the active object.
+
+    NOTE: Objects are stored by name and in a list, so that switching the \
+active object is a dictionary lookup and objects keep their creation order.
+    """
+
+    def __init__(
+        self,
+        frame_count: int = 0,
+        times_ms: FrameTimes = 0,
+        names: Optional[List[str]] = None,
+    ) -> None:
+        """Creates a session with objects without any point, the first \
+one being active.
+
+        Args:
+            frame_count (int, optional): The amount of frames of the video. \
+Defaults to 0.
+            times_ms (FrameTimes, optional): The duration of a frame, or \
+the time of each frame (see Video.timestamps_ms). Defaults to 0.
+            names (Optional[List[str]], optional): The name of each object, \
+or None for a single object with a default name. Defaults to None.
+
+        Raises:
+            ValueError: Several objects have the same name
+        """
+        self.__frame_count = frame_count
+        self.__times = times_ms
+        self.__reference_frame: Optional[ReferenceFrame] = None
+
+        self.__objects: List[TrackedObject] = []
+        self.__by_name: Dict[str, TrackedObject] = {}
+        # the position of each object, which identifies it in session journals
+        self.__positions: Dict[str, int] = {}
+        for name in names or [None]:
+            self.add(name)
+        self.__active = self.__objects[0]
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: SessionSnapshot, frame_count: int, times_ms: FrameTimes
+    ) -> "TrackingSession":
+        """Creates a session with the objects and points of a saved session, \
+its active object being active.
+
+        Args:
+            snapshot (SessionSnapshot): The saved session
+            frame_count (int): The amount of frames of the video
+            times_ms (FrameTimes): The duration of a frame, or the time of \
+each frame (see Video.timestamps_ms)
+
+        Raises:
+            ValueError: The session does not match the frames of the video
+
+        Returns:
+            TrackingSession: The restored session
+        """
+        if snapshot.frame_count != frame_count:
+            raise ValueError("La session ne correspond pas aux images de la vidéo")
+
+        session = cls(frame_count, times_ms, list(snapshot.objects))
+        for name, points in snapshot.objects.items():
+            session[name].replace_points(points)
+        if snapshot.active in snapshot.objects:
+            session.select(snapshot.active)
+        return session
+
+    @property
+    def active(self) -> TrackedObject:
+        """The object whose points are being set."""
+        return self.__active
+
+    @property
+    def names(self) -> List[str]:
+        """The name of each object, in creation order."""
+        return [tracked.name for tracked in self.__objects]
+
+    def __len__(self) -> int:
+        return len(self.__objects)
+
+    def __iter__(self) -> Iterator[TrackedObject]:
+        return iter(self.__objects)
+
+    def __getitem__(self, name: str) -> TrackedObject:
+        return self.__by_name[name]
+
+    def add(self, name: Optional[str] = None) -> TrackedObject:
+        """Adds an object without any point. It does not become active.
+
+        Args:
+            name (Optional[str], optional): The name of the object, or None \
+for "Objet" followed by a number. Defaults to None.
+
+        Raises:
+            ValueError: An object already has this name
+
+        Returns:
+            TrackedObject: The new object
+        """
+        if name is None:
+            number = len(self.__objects) + 1
+            while f"Objet {number}" in self.__by_name:
+                number += 1
+            name = f"Objet {number}"
+        elif name in self.__by_name:
+            raise ValueError(f"Un objet s'appelle déjà {name}")
+
+        tracked = TrackedObject(
+            name,
+            OBJECT_COLORS[len(self.__objects) % len(OBJECT_COLORS)],
+            self.__frame_count,
+            self.__times,
+        )
+        tracked.set_reference_frame(self.__reference_frame)
+        self.__positions[name] = len(self.__objects)
+        self.__objects.append(tracked)
+        self.__by_name[name] = tracked
+        return tracked
+
+    def position(self, name: str) -> int:
+        """Returns the position of an object in creation order.
+
+        Args:
+            name (str): The name of the object
+
+        Raises:
+            KeyError: No object has this name
+
+        Returns:
+            int: The position, starting at 0
+        """
+        return self.__positions[name]
+
+    def select(self, name: str) -> TrackedObject:
+        """Makes an object active.
+
+        Args:
+            name (str): The name of the object
+
+        Raises:
+            KeyError: No object has this name
+
+        Returns:
+            TrackedObject: The active object
+        """
+        self.__active = self.__by_name[name]
+        return self.__active
+
+    def set_reference_frame(self, frame: Optional[ReferenceFrame]) -> None:
+        """Changes the reference frame of every object.
+
+        Args:
+            frame (Optional[ReferenceFrame]): The new reference frame
+        """
+        self.__reference_frame = frame
+        for tracked in self.__objects:
+            tracked.set_reference_frame(frame)
+
+    def table(
+        self,
+        mass: Optional[float] = None,
+        smoothing_window: int = 0,
+        smoothing_order: int = 2,
+        kinematics: bool = True,
+    ) -> Tuple[np.ndarray, np.ndarray, Dict[str, np.ndarray]]:
+        """Returns the values of every object side by side, with one row \
+per frame where at least one object has a point. Columns are named after \
+the value, followed by the object when there are several ones ("x (Objet 1)" \
+for example), and are NaN on the frames where their object has no point.
+
+        Args:
+            mass (Optional[float], optional): The mass of the objects \
+(in kilograms), or None to leave out the energies. Defaults to None.
+            smoothing_window (int, optional): The window of the Savitzky-Golay \
+filter applied before differentiating, or 0 for no smoothing. Defaults to 0.
+            smoothing_order (int, optional): The order of the Savitzky-Golay \
+filter. Defaults to 2.
+            kinematics (bool, optional): Whether the velocities, accelerations \
+and energies are added after the coordinates of each object. Defaults to True.
+
+        Returns:
+            Tuple[ndarray, ndarray, Dict[str, ndarray]]: The index of the frame \
+of each row, its time in milliseconds and the columns. Everything is empty \
+if there is no reference frame.
+        """
+        if self.__reference_frame is None:
+            return np.zeros(0, dtype=np.int64), np.zeros(0), {}
+
+        indices = [tracked.points.indices() for tracked in self.__objects]
+        frames = np.unique(np.concatenate(indices)).astype(np.int64)
+
+        columns: Dict[str, np.ndarray] = {}
+        for tracked, object_frames in zip(self.__objects, indices):
+            rows = np.searchsorted(frames, object_frames)
+            points, _ = tracked.values()
+            values = {"x": points.x, "y": points.y}
+            if kinematics:
+                values.update(
+                    tracked.kinematics(smoothing_window, smoothing_order).columns(mass)
+                )
+
+            for name, object_values in values.items():
+                column = np.full(len(frames), np.nan)
+                column[rows] = object_values
+                if len(self.__objects) > 1:
+                    name = f"{name} ({tracked.name})"
+                columns[name] = column
+
+        return frames, frame_times(frames, self.__times), columns
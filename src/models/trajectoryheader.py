@@ -0,0 +1,45 @@
+from .point import Point
+
+
+class TrajectoryHeader:
+    """Represents the header of a binary trajectory file: how the points \
+were acquired and how many there are."""
+
+    def __init__(
+        self,
+        count: int,
+        origin: Point,
+        scale: float,
+        fps: float,
+        video_hash: str,
+    ) -> None:
+        self.__count = count
+        self.__origin = origin
+        self.__scale = scale
+        self.__fps = fps
+        self.__video_hash = video_hash
+
+    @property
+    def count(self) -> int:
+        """The amount of points in the file."""
+        return self.__count
+
+    @property
+    def origin(self) -> Point:
+        """The origin of the reference frame (in canvas coordinates)."""
+        return self.__origin
+
+    @property
+    def scale(self) -> float:
+        """The scale of the reference frame (in pixels per meter)."""
+        return self.__scale
+
+    @property
+    def fps(self) -> float:
+        """The frame rate of the source video (in frames per second)."""
+        return self.__fps
+
+    @property
+    def video_hash(self) -> str:
+        """The content hash of the source video (hexadecimal SHA-256)."""
+        return self.__video_hash
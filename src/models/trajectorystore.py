@@ -0,0 +1,128 @@
+from typing import Iterator, Optional, Sequence
+
+import numpy as np
+
+from .point import Point
+
+
+class TrajectoryStore:
+    """Stores an optional point for each frame of a video in contiguous \
+arrays of x and y coordinates, with a mask telling which frames have a point.
+
+    NOTE: Indexing the store returns Point instances, the arrays are meant \
+for batch operations (see Coordinates).
+    """
+
+    def __init__(self, length: int = 0) -> None:
+        self.__x = np.zeros(length, dtype=np.float64)
+        self.__y = np.zeros(length, dtype=np.float64)
+        self.__valid = np.zeros(length, dtype=np.bool_)
+
+    @staticmethod
+    def from_arrays(
+        x: np.ndarray,
+        y: np.ndarray,
+        valid: Optional[np.ndarray] = None,
+    ) -> "TrajectoryStore":
+        """Creates a store from arrays of coordinates.
+
+        Args:
+            x (ndarray): The x coordinates
+            y (ndarray): The y coordinates
+            valid (Optional[ndarray], optional): Whether each frame has a point, \
+or None if every frame has one. Defaults to None.
+
+        Raises:
+            ValueError: The arrays have different lengths
+
+        Returns:
+            TrajectoryStore: The new store, which owns copies of the arrays
+        """
+        length = len(x)
+        if len(y) != length or (valid is not None and len(valid) != length):
+            raise ValueError("The arrays have different lengths")
+
+        store = TrajectoryStore(length)
+        store.__x[:] = x
+        store.__y[:] = y
+        store.__valid[:] = True if valid is None else valid
+        return store
+
+    @staticmethod
+    def from_points(points: Sequence[Point | None]) -> "TrajectoryStore":
+        """Creates a store from a list of optional points.
+
+        Args:
+            points (Sequence[Point | None]): The point of each frame, or None \
+if there is no point on a frame
+
+        Returns:
+            TrajectoryStore: The new store
+        """
+        store = TrajectoryStore(len(points))
+        for index, point in enumerate(points):
+            store[index] = point
+        return store
+
+    @property
+    def x(self) -> np.ndarray:
+        """A read-only view of the x coordinates. Frames without a point \
+have an undefined value."""
+        view = self.__x.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def y(self) -> np.ndarray:
+        """A read-only view of the y coordinates. Frames without a point \
+have an undefined value."""
+        view = self.__y.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def valid(self) -> np.ndarray:
+        """A read-only view of the mask telling which frames have a point."""
+        view = self.__valid.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def count(self) -> int:
+        """The amount of frames that have a point."""
+        return int(np.count_nonzero(self.__valid))
+
+    def indices(self) -> np.ndarray:
+        """Returns the indices of the frames that have a point."""
+        return np.flatnonzero(self.__valid)
+
+    def compressed(self) -> "TrajectoryStore":
+        """Returns a store containing only the frames that have a point."""
+        return TrajectoryStore.from_arrays(
+            self.__x[self.__valid], self.__y[self.__valid]
+        )
+
+    def __len__(self) -> int:
+        """Returns the amount of frames."""
+        return len(self.__valid)
+
+    def __getitem__(self, index: int) -> Point | None:
+        """Returns the point of a frame, or None if there is no point on it."""
+        if not self.__valid[index]:
+            return None
+
+        return Point(float(self.__x[index]), float(self.__y[index]))
+
+    def __setitem__(self, index: int, point: Point | None) -> None:
+        """Sets the point of a frame, or removes it if None is given."""
+        if point is None:
+            self.__valid[index] = False
+        else:
+            self.__x[index] = point.x
+            self.__y[index] = point.y
+            self.__valid[index] = True
+
+    def __iter__(self) -> Iterator[Point | None]:
+        """Iterates over the point of each frame."""
+        for index in range(len(self)):
+            yield self[index]
@@ -0,0 +1,86 @@
+from typing import Optional, Tuple
+
+import numpy as np
+
+from .referenceframe import FrameTimes, ReferenceFrame, frame_times
+from .trajectorystore import TrajectoryStore
+
+
+class TransformCache:
+    """Keeps the points of a trajectory transformed to a reference frame. \
+Changing a point only transforms that point again, changing the reference \
+frame invalidates everything."""
+
+    def __init__(self, points: TrajectoryStore, times_ms: FrameTimes) -> None:
+        """Creates a cache without reference frame.
+
+        Args:
+            points (TrajectoryStore): The point of each frame, in canvas \
+coordinates, updated in place by the caller
+            times_ms (FrameTimes): The duration of a frame, or the time of \
+each frame (see Video.timestamps_ms)
+        """
+        self.__points = points
+        self.__times = times_ms
+        self.__frame: Optional[ReferenceFrame] = None
+
+        # the transformed point of each frame, None until it is needed
+        self.__transformed: Optional[TrajectoryStore] = None
+        # the last result of TransformCache.values, None when a point changed
+        self.__values: Optional[Tuple[TrajectoryStore, np.ndarray]] = None
+
+    @property
+    def reference_frame(self) -> Optional[ReferenceFrame]:
+        """The reference frame, or None if it is not defined yet."""
+        return self.__frame
+
+    def set_reference_frame(self, frame: Optional[ReferenceFrame]) -> None:
+        """Changes the reference frame and invalidates every transformed point.
+
+        Args:
+            frame (Optional[ReferenceFrame]): The new reference frame
+        """
+        self.__frame = frame
+        self.__transformed = None
+        self.__values = None
+
+    def update(self, index: int) -> None:
+        """Transforms the point of a frame again after it changed.
+
+        Args:
+            index (int): The index of the frame
+        """
+        self.__values = None
+        if self.__transformed is None or self.__frame is None:
+            return
+
+        point = self.__points[index]
+        self.__transformed[index] = (
+            None if point is None else self.__frame.transformed(point)
+        )
+
+    def values(self) -> Tuple[TrajectoryStore, np.ndarray]:
+        """Returns the transformed points and their times, computing only \
+what changed since the last call.
+
+        Returns:
+            Tuple[TrajectoryStore, ndarray]: The transformed points and \
+their times in milliseconds, skipping frames without a point. Both are \
+empty if there is no reference frame.
+        """
+        if self.__frame is None:
+            return TrajectoryStore(), np.zeros(0)
+
+        if self.__values is None:
+            if self.__transformed is None:
+                x, y = self.__frame.transformed_batch(self.__points.x, self.__points.y)
+                self.__transformed = TrajectoryStore.from_arrays(
+                    x, y, self.__points.valid
+                )
+
+            self.__values = (
+                self.__transformed.compressed(),
+                frame_times(self.__transformed.indices(), self.__times),
+            )
+
+        return self.__values
@@ -1,11 +1,36 @@
+from functools import partial
+from typing import Optional, Tuple
+
 import cv2
-from PIL import Image
+import numpy as np
+
+from .framecache import FrameCache
+from .frameindex import FrameIndex
+from .point import Point
+from .prefetcher import FramePrefetcher
+from .profiler import Profiler
+
+DEFAULT_CACHE_FRAMES = 120
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
 
 
 class Video:
     """Represents a video."""
 
-    def __init__(self, filename: str):
+    def __init__(
+        self,
+        filename: str,
+        frame_index: Optional[FrameIndex] = None,
+        display_scale: float = 1.0,
+        profiler: Optional[Profiler] = None,
+        frame_count: Optional[int] = None,
+    ):
+        self.__filename = filename
+        # times the decoding and the conversion of frames, in every thread
+        self.__profiler = profiler
+        self.__cache: Optional[FrameCache] = None
+        self.__prefetcher: Optional[FramePrefetcher] = None
+
         self.__capture = cv2.VideoCapture(filename)
         if not self.__capture.isOpened():
             raise ValueError("Impossible de charger la vidéo")
@@ -13,11 +38,50 @@ class Video:
         self.__width = int(self.__capture.get(cv2.CAP_PROP_FRAME_WIDTH))
         self.__height = int(self.__capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
         self.__frame_duration = 1000 / self.__capture.get(cv2.CAP_PROP_FPS)
-        self.__frame_count = int(self.__capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        # the container's frame count is only an estimate for some files
+        self.__frame_count = (
+            int(self.__capture.get(cv2.CAP_PROP_FRAME_COUNT))
+            if frame_count is None
+            else frame_count
+        )
 
         if self.frame_count <= 1:
             raise ValueError("Nombre d'images invalide")
 
+        # frames are downsampled once, right after being decoded
+        self.__display_scale = 1.0
+        self.__display_size = (self.__width, self.__height)
+        self.__set_display_size(display_scale)
+        self.__cache_limits: Tuple[int, Optional[int]] = (
+            DEFAULT_CACHE_FRAMES,
+            DEFAULT_CACHE_BYTES,
+        )
+
+        # the index of the next frame returned by get_frame, which can differ from
+        # the position of the capture when frames are served from the cache
+        self.__position = 0
+        self.__capture_position = 0
+
+        # built on the first seek if not given, None if the video cannot be indexed
+        self.__index = frame_index
+        self.__index_built = frame_index is not None
+        self.__last_seek_grabbed = 0
+        # the time of each frame, computed from the index when first needed
+        self.__timestamps: Optional[np.ndarray] = None
+
+        # an intra-only copy of the video used to decode frames, see use_proxy
+        self.__proxy: Optional[str] = None
+
+    @property
+    def filename(self) -> str:
+        """The path of the video file."""
+        return self.__filename
+
+    @property
+    def profiler(self) -> Optional[Profiler]:
+        """The profiler timing the decoding and the conversion of frames."""
+        return self.__profiler
+
     @property
     def width(self) -> int:
         """The width of the video (in pixels)."""
@@ -28,6 +92,22 @@ class Video:
         """The height of the video (in pixels)."""
         return self.__height
 
+    @property
+    def display_scale(self) -> float:
+        """The size of the displayed frames relative to the video (1 for \
+full resolution)."""
+        return self.__display_scale
+
+    @property
+    def display_width(self) -> int:
+        """The width of the displayed frames (in pixels)."""
+        return self.__display_size[0]
+
+    @property
+    def display_height(self) -> int:
+        """The height of the displayed frames (in pixels)."""
+        return self.__display_size[1]
+
     @property
     def frame_duration_ms(self) -> float:
         """The duration of a frame (in milliseconds)."""
@@ -41,7 +121,254 @@ class Video:
     @property
     def current_frame(self) -> int:
         """The index of the current frame (starting at 1)."""
-        return int(self.__capture.get(cv2.CAP_PROP_POS_FRAMES))
+        return self.__position
+
+    @property
+    def proxy(self) -> Optional[str]:
+        """The path of the proxy used to decode frames, or None if frames \
+are decoded from the video itself."""
+        return self.__proxy
+
+    @property
+    def frame_index(self) -> Optional[FrameIndex]:
+        """The keyframe and timestamp index of the video, or None if \
+it was not built yet or the video cannot be indexed."""
+        return self.__index
+
+    @property
+    def timestamps_ms(self) -> np.ndarray:
+        """The time of each frame since the first frame (in milliseconds). \
+Variable frame rate videos do not have a constant frame duration, so times \
+come from the presentation timestamps of the index, which is built without \
+decoding the video if needed. Frames missing from the index, or every frame \
+if the video cannot be indexed, are spaced by the average frame duration."""
+        if self.__timestamps is None:
+            timestamps = np.arange(self.__frame_count) * self.__frame_duration
+            frame_index = self.build_index()
+            if frame_index is not None:
+                indexed = frame_index.timestamps_ms[: self.__frame_count]
+                timestamps[: len(indexed)] = indexed - indexed[0]
+                timestamps[len(indexed) :] += timestamps[len(indexed) - 1] - (
+                    (len(indexed) - 1) * self.__frame_duration
+                )
+            timestamps.flags.writeable = False
+            self.__timestamps = timestamps
+
+        return self.__timestamps
+
+    def timestamp_ms(self, frame_index: int) -> float:
+        """Returns the time of a frame since the first frame \
+(see Video.timestamps_ms).
+
+        Args:
+            frame_index (int): The index (starting at 0) of the frame
+
+        Returns:
+            float: The time (in milliseconds)
+        """
+        return float(self.timestamps_ms[frame_index])
+
+    @property
+    def last_seek_grabbed_frames(self) -> int:
+        """The amount of frames the last seek had to decode to reach its target."""
+        return self.__last_seek_grabbed
+
+    @property
+    def prefetching(self) -> bool:
+        """Whether frames are decoded ahead in a background thread."""
+        return self.__prefetcher is not None
+
+    @property
+    def cache_hits(self) -> int:
+        """The amount of frames served from the frame cache."""
+        return 0 if self.__cache is None else self.__cache.hits
+
+    @property
+    def cache_misses(self) -> int:
+        """The amount of frames that had to be decoded on demand \
+while prefetching was enabled."""
+        return 0 if self.__cache is None else self.__cache.misses
+
+    def build_index(self) -> Optional[FrameIndex]:
+        """Builds the keyframe and timestamp index of the video if needed.
+
+        Returns:
+            Optional[FrameIndex]: The index, or None if the video cannot be indexed
+        """
+        if not self.__index_built:
+            self.__index_built = True
+            try:
+                self.__index = FrameIndex.build(self.__filename)
+            except (ValueError, cv2.error):
+                self.__index = None
+
+            if self.__prefetcher is not None and self.__proxy is None:
+                self.__prefetcher.frame_index = self.__index
+
+        return self.__index
+
+    def start_prefetching(
+        self,
+        max_frames: int = DEFAULT_CACHE_FRAMES,
+        max_bytes: Optional[int] = DEFAULT_CACHE_BYTES,
+    ) -> None:
+        """Starts decoding frames ahead of the current frame in a background \
+thread. Decoded frames are kept in a LRU cache so that they can be \
+shown again without decoding them.
+
+        Args:
+            max_frames (int, optional): The maximum amount of cached frames. \
+Defaults to DEFAULT_CACHE_FRAMES.
+            max_bytes (Optional[int], optional): The maximum size of the cache \
+(in bytes), or None for no limit. Defaults to DEFAULT_CACHE_BYTES.
+        """
+        self.stop_prefetching()
+
+        self.__cache_limits = (max_frames, max_bytes)
+        frame_size = self.__frame_size()
+        self.__cache = FrameCache(max_frames, max_bytes)
+
+        # half of the cache is kept for frames behind the current one
+        lookahead = self.__cache.capacity(frame_size) // 2
+        self.__prefetcher = FramePrefetcher(
+            self.__filename if self.__proxy is None else self.__proxy,
+            self.__cache,
+            partial(Video.to_ppm, size=self.__display_size),
+            self.__frame_count,
+            frame_size,
+            lookahead,
+            self.__index if self.__proxy is None else None,
+            self.__profiler,
+        )
+        self.__prefetcher.start(self.__position)
+
+    def stop_prefetching(self) -> None:
+        """Stops the background thread and empties the frame cache."""
+        if self.__prefetcher is not None:
+            self.__prefetcher.stop()
+            self.__prefetcher = None
+
+        self.__cache = None
+
+    def use_proxy(self, filename: str) -> bool:
+        """Decodes frames from a proxy of the video from now on, for example \
+an intra-only copy where any frame can be read quickly. Frames are still \
+displayed at the size of the video, and points still refer to the video.
+
+        Args:
+            filename (str): The path of the proxy, which must have as many \
+frames as the video
+
+        Returns:
+            bool: True if the proxy is used
+        """
+        capture = cv2.VideoCapture(filename)
+        frame_count = int(capture.get(cv2.CAP_PROP_FRAME_COUNT))
+        if not capture.isOpened() or frame_count != self.__frame_count:
+            capture.release()
+            return False
+
+        prefetching = self.prefetching
+        self.stop_prefetching()
+
+        self.__capture.release()
+        self.__capture = capture
+        self.__capture_position = 0
+        self.__proxy = filename
+
+        if prefetching:
+            self.start_prefetching(*self.__cache_limits)
+
+        return True
+
+    def stop_using_proxy(self) -> bool:
+        """Decodes frames from the video again instead of its proxy, \
+so that they are displayed at full quality. Cached frames are dropped.
+
+        Returns:
+            bool: True if frames are decoded from the video
+        """
+        if self.__proxy is None:
+            return True
+
+        capture = cv2.VideoCapture(self.__filename)
+        if not capture.isOpened():
+            capture.release()
+            return False
+
+        prefetching = self.prefetching
+        self.stop_prefetching()
+
+        self.__capture.release()
+        self.__capture = capture
+        self.__capture_position = 0
+        self.__proxy = None
+
+        if prefetching:
+            self.start_prefetching(*self.__cache_limits)
+
+        return True
+
+    def set_display_scale(self, scale: float) -> None:
+        """Changes the size of the displayed frames. Cached frames are dropped.
+
+        Args:
+            scale (float): The size of the displayed frames relative to \
+the video, greater than 0 and at most 1
+
+        Raises:
+            ValueError: The scale is out of range
+        """
+        if scale == self.__display_scale:
+            return
+
+        prefetching = self.prefetching
+        self.stop_prefetching()
+        self.__set_display_size(scale)
+        if prefetching:
+            self.start_prefetching(*self.__cache_limits)
+
+    def __set_display_size(self, scale: float) -> None:
+        """Computes the size of the displayed frames.
+
+        Raises:
+            ValueError: The scale is out of range
+        """
+        if not 0 < scale <= 1:
+            raise ValueError("'scale' must be greater than 0 and at most 1")
+
+        self.__display_scale = scale
+        self.__display_size = (
+            max(round(self.__width * scale), 1),
+            max(round(self.__height * scale), 1),
+        )
+
+    def __frame_size(self) -> int:
+        """Returns the size of a displayed frame (in bytes)."""
+        return self.__display_size[0] * self.__display_size[1] * 3
+
+    def to_display(self, point: Point) -> Point:
+        """Converts a point from video pixels to displayed pixels.
+
+        Args:
+            point (Point): The point in the video
+
+        Returns:
+            Point: The point on the displayed frame
+        """
+        return Point(point.x * self.__display_scale, point.y * self.__display_scale)
+
+    def to_source(self, point: Point) -> Point:
+        """Converts a point from displayed pixels to video pixels, so that \
+points keep the precision of the video.
+
+        Args:
+            point (Point): The point on the displayed frame
+
+        Returns:
+            Point: The point in the video
+        """
+        return Point(point.x / self.__display_scale, point.y / self.__display_scale)
 
     def go_to(self, frame_index: int) -> bool:
         """Goes to a specific frame.
@@ -53,11 +380,40 @@ class Video:
             bool: True if the operation was a success
         """
         if 0 <= frame_index <= self.frame_count:
-            self.__capture.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+            self.__position = frame_index
+            if self.__prefetcher is not None:
+                self.__prefetcher.request(frame_index)
             return True
 
         return False
 
+    def skip_frames(self, count: int) -> bool:
+        """Skips frames after the current frame without decoding them: \
+the capture grabs them if it is at the current frame, otherwise the next \
+read seeks.
+
+        Args:
+            count (int): The amount of frames to skip
+
+        Returns:
+            bool: True if the operation was a success
+        """
+        target = self.__position + count
+        if count < 0 or target > self.frame_count:
+            return False
+
+        if self.__capture_position == self.__position:
+            try:
+                while self.__capture_position < target and self.__capture.grab():
+                    self.__capture_position += 1
+            except:
+                self.__capture_position = -1
+
+            if self.__capture_position != target:
+                self.__capture_position = -1
+
+        return self.go_to(target)
+
     def go_back(self) -> bool:
         """Goes back one frame.
 
@@ -66,22 +422,209 @@ class Video:
         """
         return self.go_to(self.current_frame - 1)
 
-    def get_frame(self) -> Image.Image | None:
+    def get_frame(self) -> bytes | None:
         """Reads and returns the current frame from the video.
 
         Returns:
-            Image | None: The current frame, or None if the operation \
-failed (end of video was reached or there was an error)
+            bytes | None: The current frame as PPM data (see Video.to_ppm), \
+or None if the operation failed (end of video was reached or there was an error)
         """
+        index = self.__position
+        frame = None if self.__cache is None else self.__cache.get(index)
+
+        if frame is None:
+            frame = self.__decode(index)
+            if frame is None:
+                return None
+
+            if self.__cache is not None:
+                self.__cache.put(index, frame, len(frame))
+
+        self.__position = index + 1
+        if self.__prefetcher is not None:
+            self.__prefetcher.request(self.__position)
+
+        return frame
+
+    def get_previous_frame(self) -> bytes | None:
+        """Reads and returns the frame before the last returned frame.
+
+        NOTE: When the frame is not cached, the frames between its keyframe \
+and itself are decoded once and cached (as many as half the cache can hold), \
+so that the next steps backwards do not decode anything.
+
+        Returns:
+            bytes | None: The previous frame as PPM data, or None if the \
+operation failed (start of video was reached or there was an error)
+        """
+        target = self.__position - 2
+        if target < 0:
+            return None
+
+        if self.__cache is not None and target not in self.__cache:
+            self.__decode_window(target)
+
+        self.__position = target
+        return self.get_frame()
+
+    def __decode_window(self, target: int) -> None:
+        """Decodes the frames before a frame, up to its keyframe, into the cache.
+
+        Args:
+            target (int): The index of the last frame of the window
+        """
+        if self.__cache is None:
+            return
+
+        frame_size = self.__frame_size()
+        window = max(self.__cache.capacity(frame_size) // 2, 1)
+        start = target - window + 1
+        if self.__proxy is not None:
+            # every frame of the proxy can be decoded on its own
+            start = target
+        else:
+            frame_index = self.build_index()
+            if frame_index is not None:
+                start = max(frame_index.keyframe_before(target), start)
+        start = max(start, 0)
+
         try:
-            ret, frame = self.__capture.read()
+            if self.__capture_position != start:
+                self.__seek(start)
+
+            for index in range(start, target + 1):
+                if index in self.__cache:
+                    ret = self.__capture.grab()
+                else:
+                    ret, frame = self.__read(index)
+                    if ret:
+                        self.__cache.put(
+                            index, self.__convert(frame, index), frame_size
+                        )
+
+                if not ret:
+                    self.__capture_position = -1
+                    return
+
+                self.__capture_position += 1
+        except:
+            self.__capture_position = -1
+
+    def __decode(self, index: int) -> bytes | None:
+        """Decodes a frame with the capture of the main thread.
+
+        Args:
+            index (int): The index of the frame
+
+        Returns:
+            bytes | None: The frame as PPM data, or None if it could not be read
+        """
+        try:
+            if self.__capture_position != index:
+                self.__seek(index)
+
+            ret, frame = self.__read(index)
             if ret:
-                return Image.fromarray(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+                self.__capture_position += 1
+                return self.__convert(frame, index)
 
+            self.__capture_position = -1
             return None
         except:
+            self.__capture_position = -1
             return None
 
+    def __read(self, index: int) -> Tuple[bool, cv2.typing.MatLike]:
+        """Decodes the next frame with the capture of the main thread.
+
+        Args:
+            index (int): The index of the frame, for the profiler
+
+        Returns:
+            Tuple[bool, MatLike]: Whether the frame could be read, and the frame
+        """
+        if self.__profiler is None:
+            return self.__capture.read()
+
+        start = self.__profiler.start()
+        result = self.__capture.read()
+        self.__profiler.stop("decode", start, index)
+        return result
+
+    def __convert(self, frame: cv2.typing.MatLike, index: int) -> bytes:
+        """Converts a decoded frame to PPM data at the display size.
+
+        Args:
+            frame (MatLike): The decoded frame
+            index (int): The index of the frame, for the profiler
+
+        Returns:
+            bytes: The PPM data
+        """
+        if self.__profiler is None:
+            return Video.to_ppm(frame, self.__display_size)
+
+        start = self.__profiler.start()
+        data = Video.to_ppm(frame, self.__display_size)
+        self.__profiler.stop("convert", start, index)
+        return data
+
+    def __seek(self, index: int) -> None:
+        """Moves the capture of the main thread so that its next read \
+returns a specific frame.
+
+        Args:
+            index (int): The index of the frame
+        """
+        frame_index = None if self.__proxy is not None else self.build_index()
+        if frame_index is None:
+            self.__capture.set(cv2.CAP_PROP_POS_FRAMES, index)
+            self.__last_seek_grabbed = 0
+        else:
+            self.__last_seek_grabbed = frame_index.seek(
+                self.__capture,
+                self.__capture_position,
+                index,
+            )
+
+        self.__capture_position = index
+
+    @staticmethod
+    def to_ppm(
+        frame: cv2.typing.MatLike, size: Optional[Tuple[int, int]] = None
+    ) -> bytes:
+        """Converts a frame decoded by OpenCV to PPM data, which Tk photo \
+images can load without going through PIL. The channels are swapped while \
+the pixels are copied after the header, grayscale frames are copied as is \
+(as PGM data). The buffer is copied once into bytes, since Tk does not \
+accept a bytearray.
+
+        Args:
+            frame (MatLike): The BGR or grayscale frame
+            size (Optional[Tuple[int, int]], optional): The width and height \
+of the resulting image, or None to keep the size of the frame. Defaults to None.
+
+        Returns:
+            bytes: The PPM data
+        """
+        if size is not None and size != (frame.shape[1], frame.shape[0]):
+            frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+
+        height, width = frame.shape[:2]
+        gray = len(frame.shape) == 2
+        header = f"{'P5' if gray else 'P6'}\n{width} {height}\n255\n".encode()
+
+        data = bytearray(len(header) + width * height * (1 if gray else 3))
+        data[: len(header)] = header
+        pixels = np.frombuffer(data, np.uint8, offset=len(header))
+        if gray:
+            pixels[:] = np.asarray(frame).reshape(-1)
+        else:
+            cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=pixels.reshape(height, width, 3))
+
+        return bytes(data)
+
     def __del__(self) -> None:
         """Releases the video source when an instance is destroyed."""
+        self.stop_prefetching()
         self.__capture.release()
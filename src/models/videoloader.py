@@ -0,0 +1,192 @@
+from threading import Event, Thread
+from typing import Callable, Optional
+
+import cv2
+
+from .filerepo import FileRepo
+from .frameindex import PROGRESS_PACKETS, FrameIndex
+from .loadingphase import LoadingPhase
+from .profiler import Profiler
+from .video import Video
+
+
+def count_frames(
+    filename: str,
+    cancelled: Optional[Event] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Optional[int]:
+    """Counts the frames of a video that can actually be decoded, which can \
+differ from the frame count given by the container.
+
+    Args:
+        filename (str): The path of the video
+        cancelled (Optional[Event], optional): Stops counting when set. \
+Defaults to None.
+        progress (Optional[Callable[[int], None]], optional): Called with \
+the amount of frames counted so far. Defaults to None.
+
+    Returns:
+        Optional[int]: The amount of frames, or None if counting was cancelled
+    """
+    capture = cv2.VideoCapture(filename)
+    count = 0
+    try:
+        # frames are decoded but not converted to images
+        while capture.grab():
+            count += 1
+            if count % PROGRESS_PACKETS == 0:
+                if cancelled is not None and cancelled.is_set():
+                    return None
+                if progress is not None:
+                    progress(count)
+    finally:
+        capture.release()
+
+    return count
+
+
+class VideoLoader:
+    """Opens a video in a background thread, so that the interface stays \
+responsive while large files are read. The video is indexed (without \
+decoding it), its decodable frames are optionally counted, then it is \
+opened with the most accurate frame count available."""
+
+    def __init__(
+        self,
+        filename: str,
+        verify: bool = False,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
+        """Creates a loader, which does nothing until it is started.
+
+        Args:
+            filename (str): The path of the video
+            verify (bool, optional): Whether the decodable frames are counted, \
+which takes about as long as playing the video without displaying it. \
+Defaults to False.
+            profiler (Optional[Profiler], optional): Given to the video. \
+Defaults to None.
+        """
+        self.__filename = filename
+        self.__verify = verify
+        self.__profiler = profiler
+
+        self.__cancelled = Event()
+        self.__thread: Optional[Thread] = None
+        self.__phase = LoadingPhase.PROBING
+        self.__estimated_frames = 0
+        self.__done_frames = 0
+
+        self.__video: Optional[Video] = None
+        self.__content_hash: Optional[str] = None
+        self.__error: Optional[str] = None
+
+    @property
+    def filename(self) -> str:
+        """The path of the video."""
+        return self.__filename
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker thread is running."""
+        return self.__thread is not None and self.__thread.is_alive()
+
+    @property
+    def phase(self) -> LoadingPhase:
+        """The current step of the loading."""
+        return self.__phase
+
+    @property
+    def progress(self) -> float:
+        """The fraction of the current step already done, between 0 and 1, \
+estimated from the frame count given by the container."""
+        if self.__estimated_frames <= 0:
+            return 0.0
+
+        return min(self.__done_frames / self.__estimated_frames, 1.0)
+
+    @property
+    def video(self) -> Optional[Video]:
+        """The loaded video, or None until loading succeeded."""
+        return self.__video
+
+    @property
+    def content_hash(self) -> Optional[str]:
+        """The content hash of the video (see FileRepo.content_hash), or None \
+if it could not be computed."""
+        return self.__content_hash
+
+    @property
+    def error(self) -> Optional[str]:
+        """Why the video could not be loaded, or None."""
+        return self.__error
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether loading was cancelled."""
+        return self.__cancelled.is_set()
+
+    def start(self) -> None:
+        """Starts loading the video in the worker thread."""
+        if not self.running:
+            self.__cancelled.clear()
+            self.__thread = Thread(target=self.__run, daemon=True)
+            self.__thread.start()
+
+    def cancel(self) -> None:
+        """Stops loading and waits for the worker thread to finish."""
+        self.__cancelled.set()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def __set_done_frames(self, frames: int) -> None:
+        """Stores how many frames the current step went through."""
+        self.__done_frames = frames
+
+    def __run(self) -> None:
+        """Loads the video, unless the loader is cancelled."""
+        probe = cv2.VideoCapture(self.__filename)
+        opened = probe.isOpened()
+        self.__estimated_frames = int(probe.get(cv2.CAP_PROP_FRAME_COUNT))
+        probe.release()
+        if not opened:
+            self.__error = "Impossible de charger la vidéo"
+            return
+
+        try:
+            self.__content_hash = FileRepo().content_hash(self.__filename)
+        except OSError:
+            self.__content_hash = None
+
+        self.__phase = LoadingPhase.INDEXING
+        try:
+            frame_index: Optional[FrameIndex] = FrameIndex.build(
+                self.__filename, self.__cancelled, self.__set_done_frames
+            )
+        except (ValueError, cv2.error):
+            # the video is still usable without an index
+            frame_index = None
+        if self.cancelled:
+            return
+
+        frame_count = None if frame_index is None else frame_index.frame_count
+        if self.__verify:
+            self.__phase = LoadingPhase.VERIFYING
+            self.__done_frames = 0
+            frame_count = count_frames(
+                self.__filename, self.__cancelled, self.__set_done_frames
+            )
+            if frame_count is None:
+                return
+
+        self.__phase = LoadingPhase.OPENING
+        try:
+            self.__video = Video(
+                self.__filename,
+                frame_index,
+                profiler=self.__profiler,
+                frame_count=frame_count,
+            )
+        except ValueError as error:
+            self.__error = str(error)
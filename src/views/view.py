@@ -1,18 +1,27 @@
-from typing import Optional, List, no_type_check
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 import tkinter as tk
 from tkinter import ttk, simpledialog
-from PIL import ImageTk
-from PIL.Image import Image
-import matplotlib.pyplot as plt
+import numpy as np
 
 from models.point import Point
+from models.trajectorystore import TrajectoryStore
 from models.editingmode import EditingMode
 from models.axesdisplay import AxesDisplay
+from models.kinematics import Kinematics
 from views.widgets.menu import Menu
 from views.widgets.videocontrols import VideoControls
+from views.widgets.timeline import Timeline
+from views.widgets.valuetable import ValueTable
+
+if TYPE_CHECKING:
+    from views.widgets.graphpanel import GraphPanel, Series
 
 OVERLAY_TAG = "overlay"
+POINT_RADIUS = 5
+CANVAS_PADDING = 48
+# the height taken by the menu, the labels, the timeline and the video controls
+SCREEN_MARGIN = 320
 HELP_NO_VIDEO = "Importez une vidéo avec le menu Fichier > Charger une vidéo"
 HELP_ORIGIN = "Cliquez sur l'image pour définir l'origine du repère"
 HELP_SCALE = (
@@ -20,25 +29,43 @@ HELP_SCALE = (
 )
 HELP_ACQUIRING = """Cliquez sur la vidéo pour définir un point et passer à l'image suivante
 Vous pouvez aussi quitter le mode acquisition avec Échap ou en utilisant le menu"""
+HELP_TRACKING = """Cliquez sur l'objet à suivre, il sera repéré automatiquement sur les images suivantes
+Vous pouvez aussi quitter le suivi avec Échap ou en utilisant le menu"""
 HELP_VIEWING = "Commencez l'acquisition avec le menu Acquisition ou observez les valeurs avec le menu Affichage"
 
 
 class View(ttk.Frame):
     """The application's main view"""
 
-    def __init__(self, parent: tk.Tk) -> None:
+    def __init__(self, parent: ttk.PanedWindow) -> None:
         super().__init__(parent)
+        self.__panes = parent
 
         self.frame_label = ttk.Label(self)
         self.help_label = ttk.Label(self)
+        self.task_label = ttk.Label(self)
         self.canvas = tk.Canvas(self)
 
         self.menu = Menu()
-        parent.config(menu=self.menu)
+        self.winfo_toplevel().config(menu=self.menu)
+        self.timeline = Timeline(self)
         self.controls = VideoControls(self)
 
         # used for garbage collection and to redraw the same frame if needed
-        self.cached_frame: Optional[ImageTk.PhotoImage] = None
+        # a single photo image is reused for every frame
+        self.cached_frame: Optional[tk.PhotoImage] = None
+        self.__frame_item: Optional[int] = None
+
+        # overlay items are created once, then moved or hidden instead of deleted
+        self.__point_items: List[int] = []
+        self.__line_items: List[int] = []
+        self.__trail_items: List[int] = []
+        self.__shown_points = 0
+        self.__shown_lines = 0
+        self.__shown_trails = 0
+        self.__profile_item: Optional[int] = None
+        # created when the first graph is shown
+        self.__graph_panel: Optional["GraphPanel"] = None
 
     def pack_widgets(self, video_loaded: bool, current_mode: EditingMode) -> None:
         """Updates the view to show widgets matching the current app state.
@@ -47,20 +74,27 @@ class View(ttk.Frame):
             video_loaded (bool): Whether the video is loaded
             current_mode (Mode): The current editing mode
         """
+        self.task_label.pack_forget()
         self.frame_label.pack_forget()
         self.help_label.pack_forget()
         self.canvas.pack_forget()
+        self.timeline.pack_forget()
         self.controls.pack_forget()
 
+        # the loading of a video is shown there, even when no video is loaded yet
+        self.task_label.pack(padx=48, pady=(16, 0), anchor=tk.NW)
         if video_loaded:
-            self.frame_label.pack(padx=48, pady=(16, 0), anchor=tk.NE)
-            self.canvas.pack(padx=48, pady=(0, 16))
+            self.frame_label.pack(padx=48, anchor=tk.NE)
+            self.canvas.pack(padx=CANVAS_PADDING, pady=(0, 8))
+            self.timeline.pack(padx=CANVAS_PADDING, pady=(0, 16))
             if current_mode == EditingMode.DEFINING_ORIGIN:
                 self.help_label.config(text=HELP_ORIGIN)
             elif current_mode == EditingMode.DEFINING_SCALE:
                 self.help_label.config(text=HELP_SCALE)
             elif current_mode == EditingMode.ACQUIRING:
                 self.help_label.config(text=HELP_ACQUIRING)
+            elif current_mode == EditingMode.TRACKING:
+                self.help_label.config(text=HELP_TRACKING)
             elif current_mode == EditingMode.VIEWING:
                 self.help_label.config(text=HELP_VIEWING)
 
@@ -70,6 +104,43 @@ class View(ttk.Frame):
             self.help_label.config(text=HELP_NO_VIDEO)
             self.help_label.pack(expand=True)
 
+    def show_status(self, text: str) -> None:
+        """Replaces the help text with a status message.
+
+        Args:
+            text (str): The message
+        """
+        self.help_label.config(text=text)
+
+    def show_task(self, text: str) -> None:
+        """Shows the progress of a background task above the video, \
+or hides it if the text is empty.
+
+        Args:
+            text (str): The message
+        """
+        self.task_label.config(text=text)
+
+    def show_profile(self, text: str) -> None:
+        """Shows the timings of the frame processing over the video, \
+or hides them if the text is empty.
+
+        Args:
+            text (str): The timings, on several lines
+        """
+        if self.__profile_item is None:
+            if not text:
+                return
+
+            self.__profile_item = self.canvas.create_text(
+                8, 8, anchor=tk.NW, fill="yellow", font="TkFixedFont"
+            )
+
+        self.canvas.itemconfigure(
+            self.__profile_item, text=text, state=tk.NORMAL if text else tk.HIDDEN
+        )
+        self.canvas.tag_raise(self.__profile_item)
+
     def set_canvas_size(self, width: int, height: int) -> None:
         """Updates the canvas's size.
 
@@ -80,6 +151,18 @@ class View(ttk.Frame):
         self.canvas.config(width=width, height=height)
         self.canvas.update()
 
+    def max_canvas_size(self) -> Tuple[int, int]:
+        """Returns the largest canvas that leaves room for the rest of \
+the window on the screen.
+
+        Returns:
+            Tuple[int, int]: The width and height (in pixels)
+        """
+        return (
+            self.winfo_screenwidth() - 2 * CANVAS_PADDING,
+            self.winfo_screenheight() - SCREEN_MARGIN,
+        )
+
     def draw_cached_frame(self) -> bool:
         """Draws the last cached frame in the canvas.
 
@@ -89,28 +172,56 @@ class View(ttk.Frame):
         if self.cached_frame is None:
             return False
 
-        self.canvas.create_image(  # pyright: ignore reportUnknownVariableType
-            0,
-            0,
-            image=self.cached_frame,
-            anchor=tk.NW,
-        )
+        if self.__frame_item is None:
+            self.__frame_item = self.canvas.create_image(
+                0,
+                0,
+                image=self.cached_frame,
+                anchor=tk.NW,
+            )
+            # the frame stays below the overlay items created before it
+            self.canvas.tag_lower(self.__frame_item)
+        else:
+            self.canvas.itemconfigure(self.__frame_item, image=self.cached_frame)
 
         return True
 
-    def update_frame(self, frame: Image, index: int, total_frames: int) -> None:
+    def update_frame(self, frame: bytes, index: int, total_frames: int) -> None:
         """Shows a new frame and updates the frame counter.
 
         Args:
-            frame (Image): The frame to show
+            frame (bytes): The frame to show, as PPM data
             index (int): The index of the current frame
             total_frames (int): The number of frames in the video
         """
         self.frame_label.config(text=f"Frame {index}/{total_frames}")
 
-        self.cached_frame = ImageTk.PhotoImage(image=frame)
+        if self.cached_frame is None:
+            self.cached_frame = tk.PhotoImage(master=self)
+
+        # the photo image is updated in place, Tk reads the pixels directly
+        self.cached_frame.configure(data=frame, format="PPM")
         self.draw_cached_frame()
 
+    def show_preview(self, index: int, total_frames: int) -> None:
+        """Shows the thumbnail closest to a frame, enlarged, instead of \
+the frame until the next frame is shown. Used while scrubbing, before \
+the exact frame is decoded.
+
+        Args:
+            index (int): The index (starting at 0) of the frame
+            total_frames (int): The number of frames in the video
+        """
+        if self.__frame_item is None:
+            return
+
+        preview = self.timeline.preview(index, int(self.canvas.cget("height")))
+        if preview is None:
+            return
+
+        self.canvas.itemconfigure(self.__frame_item, image=preview)
+        self.frame_label.config(text=f"Frame {index + 1}/{total_frames}")
+
     def ask_for_distance(self) -> Optional[float]:
         """Asks the user for the real distance between two points.
 
@@ -122,88 +233,267 @@ class View(ttk.Frame):
             "Veuillez indiquer la distance réelle entre ces deux points (en mètres)",
         )
 
-    def show_point(self, point: Point) -> None:
-        """Draws a point on the canvas.
+    def ask_for_mass(self, initial: Optional[float] = None) -> Optional[float]:
+        """Asks the user for the mass of the tracked object.
+
+        Args:
+            initial (Optional[float], optional): The mass shown in the dialog. \
+Defaults to None.
+
+        Returns:
+            Optional[float]: The mass, or None if the user canceled the operation
+        """
+        return simpledialog.askfloat(
+            "Masse",
+            "Veuillez indiquer la masse de l'objet (en kilogrammes)",
+            initialvalue=initial,
+            minvalue=0,
+        )
+
+    def show_point(self, point: Point, color: str = "red") -> None:
+        """Draws a point on the canvas, reusing a hidden point if there is one.
 
         Args:
             point (Point): The point to draw
+            color (str, optional): The color of the point. Defaults to "red".
         """
-        self.canvas.create_oval(
-            point.x - 5,
-            point.y - 5,
-            point.x + 5,
-            point.y + 5,
-            fill="red",
-            tags=[OVERLAY_TAG],
+        coords = (
+            point.x - POINT_RADIUS,
+            point.y - POINT_RADIUS,
+            point.x + POINT_RADIUS,
+            point.y + POINT_RADIUS,
         )
+        if self.__shown_points < len(self.__point_items):
+            item = self.__point_items[self.__shown_points]
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfigure(item, state=tk.NORMAL, fill=color)
+            self.canvas.tag_raise(item)
+        else:
+            self.__point_items.append(
+                self.canvas.create_oval(*coords, fill=color, tags=[OVERLAY_TAG])
+            )
+
+        self.__shown_points += 1
 
     def show_line(self, start: Point, end: Point) -> None:
-        """Draws a line on the canvas.
+        """Draws a line on the canvas, reusing a hidden line if there is one.
 
         Args:
             start (Point): Where the line starts
             end (Point): Where the line stops
         """
-        self.canvas.create_line(
-            start.x,
-            start.y,
-            end.x,
-            end.y,
-            width=5,
-            fill="red",
-            tags=[OVERLAY_TAG],
-        )
+        coords = (start.x, start.y, end.x, end.y)
+        if self.__shown_lines < len(self.__line_items):
+            item = self.__line_items[self.__shown_lines]
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfigure(item, state=tk.NORMAL)
+            self.canvas.tag_raise(item)
+        else:
+            self.__line_items.append(
+                self.canvas.create_line(
+                    *coords, width=5, fill="red", tags=[OVERLAY_TAG]
+                )
+            )
 
-    def clear_overlay(self) -> None:
-        """Clears things previously drawn over the frame."""
-        self.canvas.delete(OVERLAY_TAG)
+        self.__shown_lines += 1
 
-    def display_values(self, points: List[Point], times: List[float]):
-        """Opens a window showing the acquired values.
+    def show_trail(
+        self, x_values: np.ndarray, y_values: np.ndarray, color: str = "red"
+    ) -> None:
+        """Draws the path of an object as a single polyline, so that its \
+length does not change the amount of canvas items. A hidden path is reused \
+if there is one.
 
         Args:
-            points (List[Point]): The defined points
-            times (List[float]): The corresponding time in the video for each point
+            x_values (ndarray): The x coordinates of the points of the path
+            y_values (ndarray): The y coordinates of the points of the path
+            color (str, optional): The color of the path. Defaults to "red".
         """
-        window = tk.Toplevel()
-        window.title("Valeurs")
-        table = ttk.Treeview(window, columns=("time", "x", "y"), show="headings")
+        if len(x_values) < 2:
+            return
+
+        coords = np.column_stack((x_values, y_values)).ravel().tolist()
+        if self.__shown_trails < len(self.__trail_items):
+            item = self.__trail_items[self.__shown_trails]
+            self.canvas.coords(item, *coords)
+            self.canvas.itemconfigure(item, state=tk.NORMAL, fill=color)
+        else:
+            item = self.canvas.create_line(
+                *coords, width=2, fill=color, tags=[OVERLAY_TAG]
+            )
+            self.__trail_items.append(item)
+        self.__shown_trails += 1
+
+        # the points are drawn over the paths
+        self.canvas.tag_lower(item, OVERLAY_TAG)
+        if self.__frame_item is not None:
+            self.canvas.tag_raise(item, self.__frame_item)
 
-        table.heading("time", text="Temps (en ms)")
-        table.heading("x", text="x (en m)")
-        table.heading("y", text="y (en m)")
+    def clear_overlay(self) -> None:
+        """Hides things previously drawn over the frame."""
+        self.canvas.itemconfigure(OVERLAY_TAG, state=tk.HIDDEN)
+        self.__shown_points = 0
+        self.__shown_lines = 0
+        self.__shown_trails = 0
+
+    def display_values(
+        self,
+        times: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        frames: Optional[np.ndarray] = None,
+        on_select: Optional[Callable[[int], Any]] = None,
+    ) -> None:
+        """Opens a window showing the acquired values. Only the visible rows \
+are created, so that the window opens quickly even with many points.
 
-        for point, time in zip(points, times):
-            table.insert("", tk.END, values=(time, point.x, point.y))
+        Args:
+            times (ndarray): The time in the video of each row
+            columns (Dict[str, ndarray]): The coordinates of the points \
+(in meters) by column name, "x" and "y" or one pair of columns per object
+            frames (Optional[ndarray], optional): The index of the frame of \
+each row. Defaults to None.
+            on_select (Optional[Callable[[int], Any]], optional): Called with \
+the frame of a row when it is clicked. Defaults to None.
+        """
+        window = tk.Toplevel()
+        window.title("Valeurs")
+        # tree view columns are identified by position, names can contain spaces
+        headings = {"time": "Temps (en ms)"}
+        data = {"time": times}
+        for position, (name, values) in enumerate(columns.items()):
+            headings[f"column{position}"] = (
+                f"{name} (en m)" if name in ("x", "y") else name
+            )
+            data[f"column{position}"] = values
+
+        table = ValueTable(window, headings)
+        table.set_data(data, frames)
+        if on_select is not None:
+            table.set_command(on_select)
 
         table.pack(expand=True, fill="both")
 
-    @no_type_check
-    def display_graph(self, mode: AxesDisplay, points: List[Point], times: List[float]):
-        """Opens a window showing a graph.
+    @property
+    def graph_mode(self) -> Optional[AxesDisplay]:
+        """The type of the graph shown in the graph panel, or None if \
+the panel is not shown."""
+        return None if self.__graph_panel is None else self.__graph_panel.key
+
+    def __graph(self) -> "GraphPanel":
+        """Returns the graph panel, created the first time it is needed."""
+        if self.__graph_panel is None:
+            # matplotlib takes long to import, it is only loaded when a graph is shown
+            from views.widgets.graphpanel import GraphPanel
+
+            self.__graph_panel = GraphPanel(self.__panes)
+
+        return self.__graph_panel
+
+    def __show_series(
+        self,
+        mode: AxesDisplay,
+        labels: Tuple[str, str, str],
+        series: "Series",
+        update: bool,
+    ) -> None:
+        """Shows new series in the graph panel, or only replaces the points \
+of the shown graph if its lines did not change."""
+        panel = self.__graph()
+        if update:
+            try:
+                panel.update_series(series)
+                return
+            except ValueError:
+                # an object was added since the graph was shown
+                pass
+
+        panel.show_series(mode, *labels, series, sorted_x=mode != AxesDisplay.Y_TO_X)
+
+    def display_graph(
+        self,
+        mode: AxesDisplay,
+        values: Dict[str, Tuple[TrajectoryStore, np.ndarray]],
+        update: bool = False,
+    ) -> None:
+        """Shows a graph of the points of each object in the graph panel.
 
         Args:
             mode (AxesDisplay): The type of graph to display
-            points (List[Point]): The defined points
-            times (List[float]): The corresponding time in the video for each point
+            values (Dict[str, Tuple[TrajectoryStore, ndarray]]): The defined \
+points of each object and the corresponding time in the video of each point, \
+by name of object
+            update (bool, optional): Whether the graph is already shown and \
+only its points changed. Defaults to False.
         """
-        x_values = [point.x for point in points]
-        y_values = [point.y for point in points]
         if mode == AxesDisplay.Y_TO_TIME:
-            plt.plot(times, y_values, marker="o")
-            plt.xlabel("temps")
-            plt.ylabel("axe Y")
-            plt.title("y(t)")
-            plt.show()
+            labels = ("y(t)", "temps", "axe Y")
+            coordinates = {
+                name: (times, points.y) for name, (points, times) in values.items()
+            }
         elif mode == AxesDisplay.X_TO_TIME:
-            plt.plot(times, x_values, marker="o")
-            plt.xlabel("temps")
-            plt.ylabel("axe X")
-            plt.title("x(t)")
-            plt.show()
+            labels = ("x(t)", "temps", "axe X")
+            coordinates = {
+                name: (times, points.x) for name, (points, times) in values.items()
+            }
         elif mode == AxesDisplay.Y_TO_X:
-            plt.plot(x_values, y_values, marker="o")
-            plt.xlabel("axe X")
-            plt.ylabel("axe Y")
-            plt.title("y(x)")
-            plt.show()
+            labels = ("y(x)", "axe X", "axe Y")
+            coordinates = {
+                name: (points.x, points.y) for name, (points, _) in values.items()
+            }
+        else:
+            return
+
+        if len(coordinates) == 1:
+            # a single line is named after the coordinate, like before objects
+            series = {labels[0][0]: next(iter(coordinates.values()))}
+        else:
+            series = coordinates
+        self.__show_series(mode, labels, series, update)
+
+    def display_kinematics_graph(
+        self,
+        mode: AxesDisplay,
+        kinematics: Dict[str, Kinematics],
+        mass: float = 1.0,
+        update: bool = False,
+    ) -> None:
+        """Shows a graph of values derived from the points of each object \
+in the graph panel.
+
+        Args:
+            mode (AxesDisplay): The type of graph to display
+            kinematics (Dict[str, Kinematics]): The kinematics of the \
+trajectory of each object, by name of object
+            mass (float, optional): The mass of the objects, used for energies \
+(in kilograms). Defaults to 1.0.
+            update (bool, optional): Whether the graph is already shown and \
+only its points changed. Defaults to False.
+        """
+        if mode == AxesDisplay.SPEED_TO_TIME:
+            labels = ("v(t)", "temps", "vitesse (en m/s)")
+        elif mode == AxesDisplay.ACCELERATION_TO_TIME:
+            labels = ("a(t)", "temps", "accélération (en m/s²)")
+        elif mode == AxesDisplay.ENERGY_TO_TIME:
+            labels = ("E(t)", "temps", "énergie (en J)")
+        else:
+            return
+
+        series: "Series" = {}
+        for name, values in kinematics.items():
+            times = values.times
+            if mode == AxesDisplay.SPEED_TO_TIME:
+                lines = {"v": values.speed, "vx": values.vx, "vy": values.vy}
+            elif mode == AxesDisplay.ACCELERATION_TO_TIME:
+                lines = {"a": values.acceleration, "ax": values.ax, "ay": values.ay}
+            else:
+                lines = {
+                    "Ec": values.kinetic_energy(mass),
+                    "Epp": values.potential_energy(mass),
+                    "Em": values.mechanical_energy(mass),
+                }
+
+            for label, line in lines.items():
+                key = label if len(kinematics) == 1 else f"{label} ({name})"
+                series[key] = (times, line)
+
+        self.__show_series(mode, labels, series, update)
@@ -0,0 +1,216 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+
+from models.decimation import MinMaxDecimator, lttb
+
+# series with more points are drawn without markers
+MAX_MARKERS = 500
+# the axes limits leave this much room around the data, so that new points
+# usually fit without redrawing the axes
+LIMITS_MARGIN = 0.1
+
+Series = Dict[str, Tuple[np.ndarray, np.ndarray]]
+
+
+class GraphPanel(ttk.Frame):
+    """A pane showing a graph drawn with matplotlib next to the video, \
+in the paned window given as parent. The pane is removed instead of \
+destroyed when closed, so that it can be shown again quickly, and its graph \
+can be updated without redrawing the axes.
+
+    NOTE: Series with more points than the axes are wide are decimated before \
+being drawn, with LTTB when the abscissas are not sorted (y(x) for example) \
+and by keeping the extremes of each pixel column otherwise. Only the latter \
+is updated from the first changed point, LTTB decimates the whole series again.
+    """
+
+    def __init__(self, parent: ttk.PanedWindow) -> None:
+        super().__init__(parent)
+        self.__panes = parent
+
+        ttk.Button(self, text="Fermer le graphique", command=self.hide).pack(
+            anchor=tk.NE
+        )
+
+        self.__figure = Figure(figsize=(6, 4), layout="constrained")
+        self.__axes = self.__figure.add_subplot()
+        self.__canvas = FigureCanvasTkAgg(self.__figure, master=self)
+        NavigationToolbar2Tk(self.__canvas, self).update()
+        self.__canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+
+        self.__key: Any = None
+        self.__lines: List[Line2D] = []
+        self.__sorted = True
+        # one decimator per line, for the width of the axes they were made for
+        self.__decimators: List[MinMaxDecimator] = []
+        self.__width = 0
+        self.__background: Any = None
+        self.__canvas.mpl_connect("draw_event", self.__on_draw)
+
+    @property
+    def key(self) -> Any:
+        """What the graph shows, as given to show_series, or None if the \
+pane is hidden."""
+        return self.__key if self.shown else None
+
+    @property
+    def shown(self) -> bool:
+        """Whether the pane is in the paned window."""
+        return str(self) in map(str, self.__panes.panes())
+
+    def show(self) -> None:
+        """Adds the pane next to the video, the window being enlarged to \
+make room for it."""
+        if not self.shown:
+            self.__panes.add(self, weight=1)
+            self.winfo_toplevel().geometry("")
+
+    def hide(self) -> None:
+        """Removes the pane, the graph being kept to be shown again."""
+        if self.shown:
+            self.__panes.forget(self)
+
+    def show_series(
+        self,
+        key: Any,
+        title: str,
+        xlabel: str,
+        ylabel: str,
+        series: Series,
+        sorted_x: bool = True,
+    ) -> None:
+        """Shows the pane with a new graph.
+
+        Args:
+            key (Any): What the graph shows, to know later which graph is shown
+            title (str): The title of the graph
+            xlabel (str): The label of the abscissa axis
+            ylabel (str): The label of the ordinate axis
+            series (Series): The abscissas and values of each line, by label
+            sorted_x (bool, optional): Whether the abscissas are sorted, \
+as in time series. Defaults to True.
+        """
+        self.__key = key
+        self.__sorted = sorted_x
+
+        self.__axes.clear()
+        self.__axes.set_title(title)
+        self.__axes.set_xlabel(xlabel)
+        self.__axes.set_ylabel(ylabel)
+        self.__lines = [
+            # animated lines are left out of the background, to be blitted over it
+            self.__axes.plot([], [], label=label, animated=True)[0]
+            for label in series
+        ]
+        # new lines need new decimators
+        self.__width = 0
+        if len(series) > 1:
+            self.__axes.legend(loc="upper right")
+
+        self.show()
+        self.__set_data(series)
+        self.__rescale()
+
+    def update_series(self, series: Series) -> None:
+        """Replaces the points of the lines of the current graph. Only the \
+lines are drawn again, unless the points do not fit in the axes anymore, \
+and only the points from the first changed one are decimated again.
+
+        Args:
+            series (Series): The abscissas and values of each line, in the \
+same order as when the graph was shown
+        """
+        if len(series) != len(self.__lines):
+            raise ValueError("The series do not match the lines of the graph")
+
+        self.__set_data(series)
+        if not self.__fits() or self.__background is None:
+            self.__rescale()
+            return
+
+        self.__canvas.restore_region(self.__background)
+        for line in self.__lines:
+            self.__axes.draw_artist(line)
+        self.__canvas.blit(self.__axes.bbox)
+
+    def __set_data(self, series: Series) -> None:
+        """Gives the decimated points of each series to its line."""
+        width = max(int(self.__axes.bbox.width), 1)
+        if width != self.__width:
+            self.__width = width
+            self.__decimators = [MinMaxDecimator(width // 2) for _ in self.__lines]
+
+        for line, decimator, (x, y) in zip(
+            self.__lines, self.__decimators, series.values()
+        ):
+            if self.__sorted:
+                x, y = decimator.update(x, y)
+            else:
+                x, y = lttb(x, y, width)
+            line.set_data(x, y)
+            line.set_marker("o" if len(x) <= MAX_MARKERS else "")
+
+    def __limits(self) -> Optional[Tuple[float, float, float, float]]:
+        """Returns the extent of the points of every line, or None if \
+there are no finite points."""
+        bounds = []
+        for line in self.__lines:
+            x = np.asarray(line.get_xdata(), dtype=np.float64)
+            y = np.asarray(line.get_ydata(), dtype=np.float64)
+            finite = np.isfinite(x) & np.isfinite(y)
+            if finite.any():
+                x, y = x[finite], y[finite]
+                bounds.append((x.min(), x.max(), y.min(), y.max()))
+
+        if not bounds:
+            return None
+
+        extents = np.array(bounds)
+        return (
+            extents[:, 0].min(),
+            extents[:, 1].max(),
+            extents[:, 2].min(),
+            extents[:, 3].max(),
+        )
+
+    def __fits(self) -> bool:
+        """Returns whether every point is inside the current axes limits."""
+        limits = self.__limits()
+        if limits is None:
+            return True
+
+        x_min, x_max = sorted(self.__axes.get_xlim())
+        y_min, y_max = sorted(self.__axes.get_ylim())
+        return (
+            x_min <= limits[0]
+            and limits[1] <= x_max
+            and y_min <= limits[2]
+            and limits[3] <= y_max
+        )
+
+    def __rescale(self) -> None:
+        """Sets the axes limits around the points, with a margin, and \
+redraws the whole graph."""
+        limits = self.__limits()
+        if limits is not None:
+            x_min, x_max, y_min, y_max = limits
+            x_margin = (x_max - x_min) * LIMITS_MARGIN or 1.0
+            y_margin = (y_max - y_min) * LIMITS_MARGIN or 1.0
+            self.__axes.set_xlim(x_min - x_margin, x_max + x_margin)
+            self.__axes.set_ylim(y_min - y_margin, y_max + y_margin)
+
+        self.__canvas.draw()
+
+    def __on_draw(self, _: Any) -> None:
+        """Keeps the graph without its lines after each full redraw, then \
+draws the lines over it."""
+        self.__background = self.__canvas.copy_from_bbox(self.__axes.bbox)
+        for line in self.__lines:
+            self.__axes.draw_artist(line)
+        self.__canvas.blit(self.__axes.bbox)
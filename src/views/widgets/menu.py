@@ -1,7 +1,11 @@
 import tkinter as tk
+from typing import List
 
 from models.editingmode import EditingMode
 
+# the sizes of the displayed frames relative to the video, from the largest
+DISPLAY_SCALES = (1.0, 0.5, 0.25)
+
 
 class Menu(tk.Menu):
     """The application's menu."""
@@ -17,6 +21,18 @@ class Menu(tk.Menu):
         )
         self.file_menu.add_command(label="Lire une vidéo")
         self.file_menu.add_command(label="Enregistrer sous")
+        self.use_proxy = tk.BooleanVar(value=False)
+        self.file_menu.add_checkbutton(
+            label="Naviguer avec une copie allégée de la vidéo", variable=self.use_proxy
+        )
+        self.verify_frames = tk.BooleanVar(value=False)
+        self.file_menu.add_checkbutton(
+            label="Compter exactement les images au chargement",
+            variable=self.verify_frames,
+        )
+        self.file_menu.add_command(label="Exporter une trace des performances")
+        self.file_menu.add_command(label="Ouvrir une session")
+        self.file_menu.add_command(label="Enregistrer la session sous")
         self.file_menu.add_separator()
         self.file_menu.add_command(label="Quitter", accelerator="Ctrl+Q")
 
@@ -27,6 +43,31 @@ class Menu(tk.Menu):
         self.show_menu.add_command(label="Afficher x(t)")
         self.show_menu.add_command(label="Afficher y(x)")
         self.show_menu.add_command(label="Afficher les valeurs")
+        self.show_menu.add_separator()
+        self.show_menu.add_command(label="Afficher la vitesse v(t)")
+        self.show_menu.add_command(label="Afficher l'accélération a(t)")
+        self.show_menu.add_command(label="Afficher les énergies E(t)")
+        self.smoothing = tk.BooleanVar(value=False)
+        self.show_menu.add_checkbutton(
+            label="Lisser les dérivées (Savitzky-Golay)", variable=self.smoothing
+        )
+        self.show_menu.add_separator()
+        self.display_scale = tk.DoubleVar(value=1.0)
+        self.display_scale_menu = tk.Menu(self.show_menu, tearoff=False)
+        self.show_menu.add_cascade(
+            label="Taille de la vidéo", menu=self.display_scale_menu
+        )
+        for scale in DISPLAY_SCALES:
+            self.display_scale_menu.add_radiobutton(
+                label="Taille réelle" if scale == 1 else f"1/{round(1 / scale)}",
+                variable=self.display_scale,
+                value=scale,
+            )
+        self.show_menu.add_separator()
+        self.show_profile = tk.BooleanVar(value=False)
+        self.show_menu.add_checkbutton(
+            label="Afficher les performances", variable=self.show_profile
+        )
 
         self.acquisition_menu = tk.Menu(self, tearoff=False)
         self.add_cascade(label="Acquisition", menu=self.acquisition_menu)
@@ -34,6 +75,32 @@ class Menu(tk.Menu):
         self.acquisition_menu.add_command(label="Commencer/Arrêter l'acquisition")
         self.acquisition_menu.add_command(label="Redefinir l'origine")
         self.acquisition_menu.add_command(label="Redefinir l'echelle")
+        self.acquisition_menu.add_command(
+            label="Commencer/Arrêter le suivi automatique"
+        )
+        self.acquisition_menu.add_separator()
+        self.acquisition_menu.add_command(label="Ajouter un objet")
+        self.active_object = tk.StringVar()
+        self.object_menu = tk.Menu(self.acquisition_menu, tearoff=False)
+        self.acquisition_menu.add_cascade(
+            label="Objet actif", accelerator="Tab", menu=self.object_menu
+        )
+
+    def set_objects(self, names: List[str], colors: List[str]) -> None:
+        """Lists the tracked objects in the menu choosing the active object.
+
+        Args:
+            names (List[str]): The name of each object
+            colors (List[str]): The color of each object, shown next to its name
+        """
+        self.object_menu.delete(0, tk.END)
+        for name, color in zip(names, colors):
+            self.object_menu.add_radiobutton(
+                label=name,
+                variable=self.active_object,
+                value=name,
+                selectcolor=color,
+            )
 
     def reconfigure(
         self,
@@ -58,15 +125,31 @@ class Menu(tk.Menu):
             and current_mode in (EditingMode.VIEWING, EditingMode.ACQUIRING)
             else "disabled"
         )
+        needs_video_and_tracking_or_viewing = (
+            "normal"
+            if video_loaded
+            and current_mode in (EditingMode.VIEWING, EditingMode.TRACKING)
+            else "disabled"
+        )
 
         self.file_menu.entryconfigure(1, state=needs_video)
         self.file_menu.entryconfigure(2, state=needs_video_and_viewing)
+        self.file_menu.entryconfigure(7, state=needs_video_and_viewing)
 
         self.show_menu.entryconfigure(0, state=needs_video_and_viewing)
         self.show_menu.entryconfigure(1, state=needs_video_and_viewing)
         self.show_menu.entryconfigure(2, state=needs_video_and_viewing)
         self.show_menu.entryconfigure(3, state=needs_video_and_viewing)
+        self.show_menu.entryconfigure(5, state=needs_video_and_viewing)
+        self.show_menu.entryconfigure(6, state=needs_video_and_viewing)
+        self.show_menu.entryconfigure(7, state=needs_video_and_viewing)
+        self.show_menu.entryconfigure(10, state=needs_video)
 
         self.acquisition_menu.entryconfigure(0, state=needs_video_and_not_defining)
         self.acquisition_menu.entryconfigure(1, state=needs_video_and_viewing)
         self.acquisition_menu.entryconfigure(2, state=needs_video_and_viewing)
+        self.acquisition_menu.entryconfigure(
+            3, state=needs_video_and_tracking_or_viewing
+        )
+        self.acquisition_menu.entryconfigure(5, state=needs_video_and_viewing)
+        self.acquisition_menu.entryconfigure(6, state=needs_video_and_not_defining)
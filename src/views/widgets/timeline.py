@@ -0,0 +1,155 @@
+import tkinter as tk
+from bisect import bisect_left, insort
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from models.thumbnails import THUMBNAIL_HEIGHT
+
+HEAD_WIDTH = 3
+
+
+class Timeline(tk.Canvas):
+    """A strip of thumbnails of the video with a scrub head that can be dragged."""
+
+    def __init__(self, parent: tk.Misc):
+        super().__init__(
+            parent,
+            height=THUMBNAIL_HEIGHT,
+            highlightthickness=0,
+            background="black",
+        )
+
+        self.__frame_count = 1
+        self.__dragging = False
+        self.__on_scrub: Optional[Callable[[int], Any]] = None
+        self.__on_seek: Optional[Callable[[int], Any]] = None
+
+        # kept so that the images are not garbage collected
+        self.__thumbnails: Dict[int, tk.PhotoImage] = {}
+        # the sorted frames of the thumbnails, to find the closest one
+        self.__frames: List[int] = []
+        # the enlarged thumbnails shown while scrubbing, by frame, with their height
+        self.__previews: Dict[int, Tuple[int, tk.PhotoImage]] = {}
+        self.__head = self.create_line(
+            0, 0, 0, THUMBNAIL_HEIGHT, width=HEAD_WIDTH, fill="red"
+        )
+
+        self.bind("<Button-1>", self.__drag)
+        self.bind("<B1-Motion>", self.__drag)
+        self.bind("<ButtonRelease-1>", self.__release)
+
+    def set_commands(
+        self, on_scrub: Callable[[int], Any], on_seek: Callable[[int], Any]
+    ) -> None:
+        """Sets what happens when the scrub head is moved.
+
+        Args:
+            on_scrub (Callable[[int], Any]): Called with the frame under the \
+head while it is dragged
+            on_seek (Callable[[int], Any]): Called with the frame under the \
+head when it is released
+        """
+        self.__on_scrub = on_scrub
+        self.__on_seek = on_seek
+
+    def reset(self, frame_count: int, width: int) -> None:
+        """Removes every thumbnail and resizes the timeline for a video.
+
+        Args:
+            frame_count (int): The amount of frames in the video
+            width (int): The width of the timeline (in pixels)
+        """
+        self.__frame_count = max(frame_count, 1)
+        self.delete("thumbnail")
+        self.__thumbnails.clear()
+        self.__frames.clear()
+        self.__previews.clear()
+        self.config(width=width)
+        self.coords(self.__head, 0, 0, 0, THUMBNAIL_HEIGHT)
+
+    def add_thumbnail(self, frame_index: int, path: Path) -> None:
+        """Shows the thumbnail of a frame at its place on the timeline.
+
+        Args:
+            frame_index (int): The index of the frame
+            path (Path): The path of the thumbnail
+        """
+        if frame_index in self.__thumbnails:
+            return
+
+        try:
+            photo = tk.PhotoImage(master=self, file=str(path))
+        except tk.TclError:
+            return
+
+        self.__thumbnails[frame_index] = photo
+        insort(self.__frames, frame_index)
+        self.create_image(
+            self.__x_of(frame_index), 0, image=photo, anchor=tk.NW, tags="thumbnail"
+        )
+        self.tag_raise(self.__head)
+
+    def preview(self, frame_index: int, height: int) -> Optional[tk.PhotoImage]:
+        """Returns the thumbnail closest to a frame, enlarged to about \
+a given height. Enlarged thumbnails are kept, so scrubbing does not read \
+or decode images.
+
+        Args:
+            frame_index (int): The index of the frame
+            height (int): The height of the frame area (in pixels)
+
+        Returns:
+            Optional[PhotoImage]: The enlarged thumbnail, or None if there \
+is no thumbnail
+        """
+        if not self.__frames:
+            return None
+
+        position = bisect_left(self.__frames, frame_index)
+        candidates = self.__frames[max(position - 1, 0) : position + 1]
+        nearest = min(candidates, key=lambda frame: abs(frame - frame_index))
+
+        cached = self.__previews.get(nearest)
+        if cached is None or cached[0] != height:
+            thumbnail = self.__thumbnails[nearest]
+            factor = height // max(thumbnail.height(), 1)
+            cached = (height, thumbnail.zoom(factor) if factor > 1 else thumbnail)
+            self.__previews[nearest] = cached
+
+        return cached[1]
+
+    def set_position(self, frame_index: int) -> None:
+        """Moves the scrub head to a frame, unless the user is dragging it.
+
+        Args:
+            frame_index (int): The index of the frame
+        """
+        if not self.__dragging:
+            x = self.__x_of(frame_index)
+            self.coords(self.__head, x, 0, x, THUMBNAIL_HEIGHT)
+
+    def __x_of(self, frame_index: int) -> float:
+        """Returns the position of a frame on the timeline."""
+        return frame_index * int(self.cget("width")) / self.__frame_count
+
+    def __frame_at(self, x: int) -> int:
+        """Returns the frame at a position on the timeline."""
+        width = max(int(self.cget("width")), 1)
+        frame_index = int(x * self.__frame_count / width)
+        return min(max(frame_index, 0), self.__frame_count - 1)
+
+    def __drag(self, event: tk.Event) -> None:  # type: ignore
+        """Moves the scrub head under the mouse."""
+        self.__dragging = True
+        x = min(max(event.x, 0), int(self.cget("width")))
+        self.coords(self.__head, x, 0, x, THUMBNAIL_HEIGHT)
+        if self.__on_scrub is not None:
+            self.__on_scrub(self.__frame_at(x))
+
+    def __release(self, event: tk.Event) -> None:  # type: ignore
+        """Seeks to the frame under the scrub head."""
+        self.__dragging = False
+        if self.__on_seek is not None:
+            self.__on_seek(
+                self.__frame_at(min(max(event.x, 0), int(self.cget("width"))))
+            )
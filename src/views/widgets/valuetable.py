@@ -0,0 +1,239 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+DEFAULT_ROW_HEIGHT = 20
+# the height of the headings, used to know how many rows fit in the table
+HEADING_HEIGHT = 24
+WHEEL_ROWS = 3
+
+
+class ValueTable(ttk.Frame):
+    """A table of columns of values, which can have millions of rows. Only \
+the visible rows exist in the tree view: they are reused and filled from the \
+columns when the table is scrolled, so opening, sorting and scrolling the \
+table do not depend on the amount of rows."""
+
+    def __init__(self, parent: tk.Misc, headings: Dict[str, str]) -> None:
+        """Creates an empty table.
+
+        Args:
+            parent (Misc): The parent widget
+            headings (Dict[str, str]): The text of the heading of each column, \
+by name
+        """
+        super().__init__(parent)
+
+        self.__names = list(headings)
+        self.__table = ttk.Treeview(
+            self, columns=self.__names, show="headings", selectmode="browse"
+        )
+        for name, text in headings.items():
+            self.__table.heading(name, text=text, command=lambda n=name: self.sort(n))
+        self.__scrollbar = ttk.Scrollbar(
+            self, orient=tk.VERTICAL, command=self.__on_scrollbar
+        )
+        self.__table.grid(row=0, column=0, sticky=tk.NSEW)
+        self.__scrollbar.grid(row=0, column=1, sticky=tk.NS)
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        row_height = ttk.Style().lookup("Treeview", "rowheight")
+        self.__row_height = int(row_height) if row_height else DEFAULT_ROW_HEIGHT
+
+        self.__columns: Dict[str, np.ndarray] = {}
+        self.__keys: Optional[np.ndarray] = None
+        # the row of the columns shown at each position of the table
+        self.__order = np.zeros(0, dtype=np.int64)
+        self.__sort_column: Optional[str] = None
+        self.__descending = False
+
+        self.__first = 0
+        self.__items: List[str] = []
+        self.__selected: Optional[int] = None
+        self.__on_select: Optional[Callable[[int], Any]] = None
+
+        self.__table.bind("<Configure>", self.__on_resize)
+        self.__table.bind("<ButtonRelease-1>", self.__on_click)
+        self.__table.bind("<Return>", lambda _: self.__select(self.__selected))
+        self.__table.bind("<MouseWheel>", self.__on_wheel)
+        self.__table.bind(
+            "<Button-4>", lambda _: self.scroll_to(self.__first - WHEEL_ROWS)
+        )
+        self.__table.bind(
+            "<Button-5>", lambda _: self.scroll_to(self.__first + WHEEL_ROWS)
+        )
+        self.__table.bind("<Up>", lambda _: self.__move_selection(-1))
+        self.__table.bind("<Down>", lambda _: self.__move_selection(1))
+        self.__table.bind(
+            "<Prior>", lambda _: self.__move_selection(-len(self.__items))
+        )
+        self.__table.bind("<Next>", lambda _: self.__move_selection(len(self.__items)))
+        self.__table.bind("<Home>", lambda _: self.__move_selection(-self.row_count))
+        self.__table.bind("<End>", lambda _: self.__move_selection(self.row_count))
+
+    @property
+    def row_count(self) -> int:
+        """The amount of rows of the table."""
+        return len(self.__order)
+
+    @property
+    def first_row(self) -> int:
+        """The position of the first visible row."""
+        return self.__first
+
+    def set_command(self, on_select: Callable[[int], Any]) -> None:
+        """Sets what happens when a row is clicked.
+
+        Args:
+            on_select (Callable[[int], Any]): Called with the key of the row
+        """
+        self.__on_select = on_select
+
+    def set_data(
+        self, columns: Dict[str, np.ndarray], keys: Optional[np.ndarray] = None
+    ) -> None:
+        """Shows new columns, without copying them.
+
+        Args:
+            columns (Dict[str, ndarray]): The values of each column, by name, \
+all with the same length
+            keys (Optional[ndarray], optional): What is given to the command \
+when each row is clicked (a frame index for example), or None to use the \
+index of the row. Defaults to None.
+
+        Raises:
+            ValueError: The columns or the keys have different lengths
+        """
+        lengths = {len(values) for values in columns.values()}
+        if keys is not None:
+            lengths.add(len(keys))
+        if len(lengths) > 1:
+            raise ValueError("The columns have different lengths")
+
+        self.__columns = {name: np.asarray(columns[name]) for name in self.__names}
+        self.__keys = keys
+        self.__order = np.arange(lengths.pop() if lengths else 0)
+        self.__selected = None
+        if self.__sort_column is not None:
+            self.sort(self.__sort_column, self.__descending)
+        else:
+            self.scroll_to(0)
+
+    def sort(self, name: str, descending: Optional[bool] = None) -> None:
+        """Sorts the rows by the values of a column, keeping the order of \
+equal values.
+
+        Args:
+            name (str): The name of the column
+            descending (Optional[bool], optional): Whether the largest values \
+come first, or None to reverse the order when the table is already sorted by \
+this column. Defaults to None.
+        """
+        if descending is None:
+            descending = self.__sort_column == name and not self.__descending
+
+        values = self.__columns.get(name)
+        if values is None:
+            return
+
+        order = np.argsort(-values if descending else values, kind="stable")
+        self.__order = order
+        self.__sort_column = name
+        self.__descending = descending
+        self.scroll_to(0)
+
+    def scroll_to(self, position: int) -> None:
+        """Scrolls the table so that a row is the first visible row, \
+or as close as possible.
+
+        Args:
+            position (int): The position of the row
+        """
+        self.__first = min(max(position, 0), max(self.row_count - len(self.__items), 0))
+        self.__render()
+
+    def __visible_rows(self) -> int:
+        """Returns how many rows fit in the table."""
+        height = self.__table.winfo_height()
+        if height <= 1:
+            return int(self.__table.cget("height"))
+
+        return max((height - HEADING_HEIGHT) // self.__row_height, 1)
+
+    def __render(self) -> None:
+        """Fills the items of the tree view with the visible rows."""
+        count = min(self.__visible_rows(), self.row_count)
+        while len(self.__items) < count:
+            self.__items.append(self.__table.insert("", tk.END))
+        while len(self.__items) > count:
+            self.__table.delete(self.__items.pop())
+        self.__first = min(self.__first, max(self.row_count - count, 0))
+
+        rows = self.__order[self.__first : self.__first + count]
+        values = [self.__columns[name][rows].tolist() for name in self.__names]
+        for item, row_values in zip(self.__items, zip(*values)):
+            self.__table.item(item, values=row_values)
+
+        selected = None
+        if self.__selected is not None:
+            offset = self.__selected - self.__first
+            if 0 <= offset < count:
+                selected = self.__items[offset]
+        self.__table.selection_set(() if selected is None else (selected,))
+
+        if self.row_count == 0:
+            self.__scrollbar.set(0, 1)
+        else:
+            self.__scrollbar.set(
+                self.__first / self.row_count, (self.__first + count) / self.row_count
+            )
+
+    def __select(self, position: Optional[int]) -> None:
+        """Selects a row and gives its key to the command."""
+        if position is None or not 0 <= position < self.row_count:
+            return
+
+        self.__selected = position
+        self.__render()
+        if self.__on_select is not None:
+            row = int(self.__order[position])
+            self.__on_select(row if self.__keys is None else int(self.__keys[row]))
+
+    def __move_selection(self, rows: int) -> str:
+        """Selects a row above or below the selected row and scrolls to it."""
+        current = self.__first if self.__selected is None else self.__selected
+        position = min(max(current + rows, 0), self.row_count - 1)
+        if position < self.__first:
+            self.__first = position
+        elif position >= self.__first + len(self.__items):
+            self.__first = position - len(self.__items) + 1
+        self.__select(position)
+        # the tree view must not move its own selection
+        return "break"
+
+    def __on_click(self, event: tk.Event) -> None:  # type: ignore
+        """Selects the clicked row."""
+        item = self.__table.identify_row(event.y)
+        if item in self.__items:
+            self.__select(self.__first + self.__items.index(item))
+
+    def __on_wheel(self, event: tk.Event) -> None:  # type: ignore
+        """Scrolls the table with the mouse wheel."""
+        self.scroll_to(self.__first - WHEEL_ROWS * (1 if event.delta > 0 else -1))
+
+    def __on_scrollbar(self, action: str, amount: str, unit: str = "") -> None:
+        """Scrolls the table with the scrollbar."""
+        if action == tk.MOVETO:
+            self.scroll_to(round(float(amount) * self.row_count))
+        elif unit == tk.PAGES:
+            self.scroll_to(self.__first + int(amount) * len(self.__items))
+        else:
+            self.scroll_to(self.__first + int(amount))
+
+    def __on_resize(self, _: Any) -> None:
+        """Shows as many rows as fit in the table."""
+        if self.__visible_rows() != len(self.__items):
+            self.__render()
@@ -1,5 +1,5 @@
 import os
-from tkinter import PhotoImage, ttk, LEFT
+from tkinter import PhotoImage, StringVar, ttk, LEFT
 
 ASSETS_DIRECTORY = os.path.abspath(
     os.path.join(
@@ -14,10 +14,13 @@ ASSETS_DIRECTORY = os.path.abspath(
 START_ICON_PATH = os.path.join(ASSETS_DIRECTORY, "backward-step-solid.png")
 PREVIOUS_ICON_PATH = os.path.join(ASSETS_DIRECTORY, "backward-fast-solid.png")
 PLAY_ICON_PATH = os.path.join(ASSETS_DIRECTORY, "play-solid.png")
+REVERSE_ICON_PATH = os.path.join(ASSETS_DIRECTORY, "play-reverse-solid.png")
 PAUSE_ICON_PATH = os.path.join(ASSETS_DIRECTORY, "pause-solid.png")
 NEXT_ICON_PATH = os.path.join(ASSETS_DIRECTORY, "forward-fast-solid.png")
 END_ICON_PATH = os.path.join(ASSETS_DIRECTORY, "forward-step-solid.png")
 
+SPEEDS = (0.25, 0.5, 1.0, 2.0, 4.0, 8.0)
+
 
 class VideoControls(ttk.Frame):
     """A group of buttons representing video controls."""
@@ -29,27 +32,70 @@ class VideoControls(ttk.Frame):
         self.__start_icon = PhotoImage(file=START_ICON_PATH)
         self.__previous_icon = PhotoImage(file=PREVIOUS_ICON_PATH)
         self.__play_icon = PhotoImage(file=PLAY_ICON_PATH)
+        self.__reverse_icon = PhotoImage(file=REVERSE_ICON_PATH)
         self.__pause_icon = PhotoImage(file=PAUSE_ICON_PATH)
         self.__next_icon = PhotoImage(file=NEXT_ICON_PATH)
         self.__end_icon = PhotoImage(file=END_ICON_PATH)
 
         self.start_button = ttk.Button(self, image=self.__start_icon)
         self.previous_button = ttk.Button(self, image=self.__previous_icon)
+        self.reverse_button = ttk.Button(self, image=self.__reverse_icon)
         self.play_button = ttk.Button(self, image=self.__play_icon)
         self.next_button = ttk.Button(self, image=self.__next_icon)
         self.end_button = ttk.Button(self, image=self.__end_icon)
 
         self.start_button.pack(side=LEFT)
         self.previous_button.pack(side=LEFT)
+        self.reverse_button.pack(side=LEFT)
         self.play_button.pack(side=LEFT)
         self.next_button.pack(side=LEFT)
         self.end_button.pack(side=LEFT)
 
+        self.speed = StringVar(value=VideoControls.speed_label(1.0))
+        self.speed_box = ttk.Combobox(
+            self,
+            textvariable=self.speed,
+            values=[VideoControls.speed_label(speed) for speed in SPEEDS],
+            state="readonly",
+            width=6,
+        )
+        self.speed_box.pack(side=LEFT, padx=(16, 0))
+
+        self.stats_label = ttk.Label(self, width=28)
+        self.stats_label.pack(side=LEFT, padx=(16, 0))
+
+    @staticmethod
+    def speed_label(speed: float) -> str:
+        """Returns the text shown for a playback speed.
+
+        Args:
+            speed (float): The speed
+
+        Returns:
+            str: The text, for example "×0.25"
+        """
+        return f"×{speed:g}"
+
+    @property
+    def selected_speed(self) -> float:
+        """The playback speed selected by the user."""
+        return float(self.speed.get().lstrip("×"))
+
+    def show_stats(self, fps: float, dropped: int) -> None:
+        """Shows how smoothly the video is played.
+
+        Args:
+            fps (float): The amount of frames shown per second
+            dropped (int): The amount of frames dropped since playback started
+        """
+        self.stats_label.config(text=f"{fps:.1f} images/s, {dropped} sautées")
+
     def reconfigure(
         self,
         paused: bool,
         reached_end: bool = False,
         can_go_back: bool = False,
+        backwards: bool = False,
     ) -> None:
         """Reconfigures buttons to match the current app state.
 
@@ -59,13 +105,24 @@ class VideoControls(ttk.Frame):
 video is reached. Defaults to False.
             can_go_back (bool, optional): Whether the video is not \
 currently on the first frame. Defaults to False.
+            backwards (bool, optional): Whether the video is played \
+backwards. Defaults to False.
         """
-        play_button_icon = self.__play_icon if paused else self.__pause_icon
+        playing_forward = not paused and not backwards
+        playing_backward = not paused and backwards
+        play_button_icon = self.__pause_icon if playing_forward else self.__play_icon
+        reverse_button_icon = (
+            self.__pause_icon if playing_backward else self.__reverse_icon
+        )
         left_buttons_state = "normal" if can_go_back else "disabled"
         right_buttons_state = "disabled" if reached_end else "normal"
 
         self.start_button.config(state=left_buttons_state)
         self.previous_button.config(state=left_buttons_state)
+        self.reverse_button.config(
+            image=reverse_button_icon,
+            state=left_buttons_state,
+        )
         self.play_button.config(
             image=play_button_icon,
             state=right_buttons_state,
@@ -0,0 +1,170 @@
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+from benchmarks.synthetic import disc_center, generate_video
+from src.batch import main, matching_path
+
+# the sample video is generated by each test case
+SAMPLE_WIDTH = 320
+SAMPLE_HEIGHT = 240
+SAMPLE_FRAME_COUNT = 200
+
+
+class testBatch(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sample_directory = tempfile.TemporaryDirectory()
+        cls.video_path = str(
+            generate_video(
+                Path(cls.sample_directory.name).joinpath("sample.mp4"),
+                SAMPLE_WIDTH,
+                SAMPLE_HEIGHT,
+                SAMPLE_FRAME_COUNT,
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.sample_directory.cleanup()
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.points = Path(self.directory.name).joinpath("points.csv")
+        self.points.write_text("frame,x,y\n0,320,240\n2,420,140\n")
+        self.output = Path(self.directory.name).joinpath("output.csv")
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_matching_path(self) -> None:
+        """Checks that files are matched by the name of the video when \
+several videos are processed."""
+        video = Path("videos/run1.mp4")
+        self.assertEqual(
+            matching_path(Path("points"), video, True), Path("points/run1.csv")
+        )
+        self.assertEqual(
+            matching_path(Path("points.csv"), video, False), Path("points.csv")
+        )
+
+    def test_single_video(self) -> None:
+        """Checks that the transformed points of a video are saved."""
+        status = main(
+            [
+                self.video_path,
+                "--origin",
+                "320",
+                "240",
+                "--scale",
+                "100",
+                "0.5",
+                "--points",
+                str(self.points),
+                "--output",
+                str(self.output),
+            ]
+        )
+
+        self.assertEqual(status, 0)
+        self.assertEqual(
+            self.output.read_text().splitlines(),
+            ["temps,x,y", "0.0,0.0,0.0", "80.0,0.5,0.5"],
+        )
+
+    def test_track(self) -> None:
+        """Checks that the points found by tracking an object are saved."""
+        x, y = disc_center(10, SAMPLE_FRAME_COUNT, SAMPLE_WIDTH, SAMPLE_HEIGHT)
+        status = main(
+            [
+                self.video_path,
+                "--origin",
+                str(x - 10),
+                str(y),
+                "--scale",
+                "100",
+                "1",
+                "--track",
+                str(x),
+                str(y),
+                "--track-from",
+                "10",
+                "--output",
+                str(self.output),
+            ]
+        )
+
+        self.assertEqual(status, 0)
+        lines = self.output.read_text().splitlines()
+        next_x, next_y = disc_center(
+            11, SAMPLE_FRAME_COUNT, SAMPLE_WIDTH, SAMPLE_HEIGHT
+        )
+        self.assertEqual(lines[:2], ["temps,x,y", "400.0,0.1,0.0"])
+        self.assertEqual(
+            [float(value) for value in lines[2].split(",")],
+            [440.0, (next_x - x + 10) / 100, (y - next_y) / 100],
+        )
+
+    def test_kinematics(self) -> None:
+        """Checks that the kinematics and energies are written after the points."""
+        status = main(
+            [
+                self.video_path,
+                "--origin",
+                "320",
+                "240",
+                "--scale",
+                "100",
+                "0.5",
+                "--points",
+                str(self.points),
+                "--output",
+                str(self.output),
+                "--kinematics",
+                "--mass",
+                "2",
+            ]
+        )
+
+        self.assertEqual(status, 0)
+        lines = self.output.read_text().splitlines()
+        self.assertEqual(lines[0], "temps,x,y,vx,vy,v,ax,ay,a,Ec,Epp,Em")
+        self.assertEqual(lines[1].split(",")[3:5], ["6.25", "6.25"])
+
+    def test_invalid_video(self) -> None:
+        """Checks that the exit status is 1 when a video cannot be loaded."""
+        status = main(
+            [
+                "invalidfile.mp4",
+                "--origin",
+                "0",
+                "0",
+                "--scale",
+                "1",
+                "1",
+                "--points",
+                str(self.points),
+                "--output",
+                str(self.output),
+            ]
+        )
+
+        self.assertEqual(status, 1)
+        self.assertFalse(self.output.exists())
+
+    def test_no_tkinter(self) -> None:
+        """Checks that the batch module does not import tkinter."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, src.batch; print('tkinter' in sys.modules)",
+            ],
+            cwd=Path(__file__).parent.parent,
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(result.stdout.strip(), "False")
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from src.models.point import Point
 from src.models.coordinates import Coordinates
 
@@ -39,3 +41,22 @@ class testCoordinates(unittest.TestCase):
         result = Coordinates.relative_to_origin(origin, self.point)
         self.assertEqual(result.x, 1.0)
         self.assertEqual(result.y, 0.0)
+
+    def test_batch(self):
+        x = np.array([3.0, 2.0])
+        y = np.array([1.5, 3.5])
+
+        result_x, result_y = Coordinates.translated_batch(x, y, 0.5, 0.8)
+        self.assertEqual(result_x.tolist(), [3.5, 2.5])
+        self.assertEqual(result_y.tolist(), [2.3, 4.3])
+
+        result_x, result_y = Coordinates.scaled_batch(x, y, 1.5, 2.0)
+        self.assertEqual(result_x.tolist(), [4.5, 3.0])
+        self.assertEqual(result_y.tolist(), [3.0, 7.0])
+
+        result_x, result_y = Coordinates.relative_to_origin_batch(Point(2.0, 1.5), x, y)
+        self.assertEqual(result_x.tolist(), [1.0, 0.0])
+        self.assertEqual(result_y.tolist(), [0.0, -2.0])
+
+        result = Coordinates.distance_batch(self.point_bis, x, y)
+        self.assertEqual(result.tolist(), [2.23606797749979, 0.0])
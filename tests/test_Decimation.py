@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+
+from src.models.decimation import MinMaxDecimator, lttb, minmax
+
+
+class testDecimation(unittest.TestCase):
+    def setUp(self) -> None:
+        rng = np.random.default_rng(0)
+        self.x = np.arange(10_000, dtype=np.float64)
+        self.y = np.sin(self.x / 500) + rng.normal(0, 0.1, len(self.x))
+
+    def test_small_series(self) -> None:
+        """Checks that series smaller than the target are kept as is."""
+        x, y = minmax(self.x[:10], self.y[:10], 5)
+        self.assertEqual(len(x), 10)
+        x, y = lttb(self.x[:10], self.y[:10], 10)
+        self.assertEqual(len(y), 10)
+
+    def test_minmax(self) -> None:
+        """Checks that the extremes are kept in order and that fully NaN \
+buckets stay as gaps."""
+        y = self.y.copy()
+        y[1000:3000] = np.nan
+        x, decimated = minmax(self.x, y, 100)
+
+        self.assertLessEqual(len(x), 200)
+        self.assertTrue(np.all(np.diff(x) > 0))
+        self.assertEqual(np.nanmax(decimated), np.nanmax(y))
+        self.assertEqual(np.nanmin(decimated), np.nanmin(y))
+        self.assertTrue(np.isnan(decimated).any())
+
+    def test_lttb(self) -> None:
+        """Checks that the first and last points are kept and that the \
+points stay in order, even when the abscissas are not sorted."""
+        x, y = lttb(self.x, self.y, 300)
+        self.assertEqual(len(x), 300)
+        self.assertEqual((x[0], x[-1]), (self.x[0], self.x[-1]))
+        self.assertTrue(np.all(np.diff(x) > 0))
+
+        angles = np.linspace(0, 20 * np.pi, 5000)
+        x, y = lttb(np.cos(angles), np.sin(angles), 200)
+        self.assertEqual(len(x), 200)
+        self.assertTrue(np.allclose(x**2 + y**2, 1))
+
+    def test_decimator(self) -> None:
+        """Checks that updating a decimator with a growing or edited series \
+gives the same points as decimating the whole series again."""
+        y = self.y.copy()
+        y[1000:3000] = np.nan
+        decimator = MinMaxDecimator(100)
+        for count in (50, 150, 1234, 1300, 5000, 10_000):
+            x, decimated = decimator.update(self.x[:count], y[:count])
+            expected = MinMaxDecimator(100).update(self.x[:count], y[:count])
+            np.testing.assert_array_equal(x, expected[0])
+            np.testing.assert_array_equal(decimated, expected[1])
+
+        self.assertLessEqual(len(x), 200)
+        self.assertTrue(np.all(np.diff(x) > 0))
+        self.assertEqual(np.nanmax(decimated), np.nanmax(y))
+        self.assertTrue(np.isnan(decimated).any())
+
+        y[5000] = 10
+        x, decimated = decimator.update(self.x, y)
+        self.assertIn(5000, x)
+        x, decimated = decimator.update(self.x[:8000], y[:8000])
+        expected = MinMaxDecimator(100).update(self.x[:8000], y[:8000])
+        np.testing.assert_array_equal(x, expected[0])
@@ -1,14 +1,20 @@
+import gzip
 import unittest
 import tempfile
 from pathlib import Path
 
+import numpy as np
+
 from src.models.filerepo import FileRepo
 from src.models.point import Point
+from src.models.trajectorystore import TrajectoryStore
 
 TMP = tempfile.gettempdir()
 
 CONTENT_FILEPATH = Path(TMP).joinpath("test_present.csv")
 PRESENT_FILEPATH = Path(TMP).joinpath("test_content.csv")
+GZIP_FILEPATH = Path(TMP).joinpath("test_content.csv.gz")
+BINARY_FILEPATH = Path(TMP).joinpath("test_content.vtrk")
 
 
 class testFileRepo(unittest.TestCase):
@@ -21,6 +27,8 @@ class testFileRepo(unittest.TestCase):
         """Remove created files after each test."""
         CONTENT_FILEPATH.unlink(True)
         PRESENT_FILEPATH.unlink(True)
+        GZIP_FILEPATH.unlink(True)
+        BINARY_FILEPATH.unlink(True)
 
     def test_transform(self) -> None:
         """Checks that the CSV data returned by FileRepo.transform_data_to_csv \
@@ -93,3 +101,170 @@ contains the correct data."""
                     "0.301,1,0",
                 ],
             )
+
+    def test_read_points(self) -> None:
+        """Checks that the points read from a CSV file are placed on their frame."""
+        with open(CONTENT_FILEPATH, "w") as csv:
+            csv.write("frame;x;y\n0;5;9\n3;7.5;2\n")
+
+        points = self.repo.read_points_from_csv(CONTENT_FILEPATH, 4, ";")
+        self.assertEqual(len(points), 4)
+        self.assertIsNone(points[1])
+        self.assertEqual((points[3].x, points[3].y), (7.5, 2))
+
+    def test_read_points_invalid_frame(self) -> None:
+        """Checks that the correct error is raised when a frame does not exist."""
+        with open(CONTENT_FILEPATH, "w") as csv:
+            csv.write("frame,x,y\n4,5,9\n")
+
+        with self.assertRaises(ValueError) as context:
+            self.repo.read_points_from_csv(CONTENT_FILEPATH, 4)
+
+        self.assertEqual(str(context.exception), "Invalid frame index: 4")
+
+    def test_chunks(self) -> None:
+        """Checks that chunks contain the header then groups of rows."""
+        chunks = list(
+            self.repo.csv_chunks(self.time_list, iter(self.point_list), chunk_rows=2)
+        )
+        self.assertEqual(chunks, ["temps,x,y", "\n0.243,5,9\n0.267,7,2", "\n0.301,1,0"])
+
+    def test_generators_different_len(self) -> None:
+        """Checks that different lengths are detected without knowing them upfront."""
+        with self.assertRaises(ValueError) as context:
+            self.repo.transform_data_to_csv(
+                (instant for instant in [0.5]), iter([Point(1, 0), Point(1, 2)])
+            )
+
+        self.assertEqual(
+            str(context.exception), "'time' and 'points' have different lengths"
+        )
+
+    def test_float_format(self) -> None:
+        """Checks that values can be formatted with a given precision."""
+        csv = self.repo.transform_data_to_csv(
+            self.time_list, self.point_list, float_format=".2f"
+        )
+        self.assertEqual(csv.splitlines()[1], "0.24,5.00,9.00")
+
+    def test_store(self) -> None:
+        """Checks that frames without a point are skipped when exporting a store."""
+        store = TrajectoryStore(3)
+        store[0] = Point(5, 9)
+        store[2] = Point(1, 0.5)
+        csv = self.repo.transform_data_to_csv(np.array([0, 40, 80]), store, ";")
+        self.assertEqual(csv.splitlines(), ["temps;x;y", "0;5.0;9.0", "80;1.0;0.5"])
+
+    def test_extra_columns(self) -> None:
+        """Checks that extra columns are written after y, NaN values being empty."""
+        csv = self.repo.transform_data_to_csv(
+            self.time_list,
+            self.point_list,
+            columns={"vx": np.array([np.nan, 1.5, 2.0])},
+        )
+        self.assertEqual(
+            csv.splitlines(),
+            ["temps,x,y,vx", "0.243,5,9,", "0.267,7,2,1.5", "0.301,1,0,2.0"],
+        )
+
+    def test_extra_columns_different_len(self) -> None:
+        """Checks that an error is raised when the extra columns do not have \
+one value per point."""
+        with self.assertRaises(ValueError):
+            self.repo.transform_data_to_csv(
+                self.time_list, self.point_list, columns={"vx": np.zeros(2)}
+            )
+
+    def test_gzip(self) -> None:
+        """Checks that files ending with .gz are compressed."""
+        self.repo.export_to_csv(self.time_list, self.point_list, GZIP_FILEPATH)
+
+        with gzip.open(GZIP_FILEPATH, "rt") as csv:
+            self.assertEqual(
+                csv.read().splitlines(),
+                ["temps,x,y", "0.243,5,9", "0.267,7,2", "0.301,1,0"],
+            )
+
+    def test_binary_round_trip(self) -> None:
+        """Checks that a binary file contains the header and the columns \
+that were written, and that the columns are memory-mapped."""
+        video_hash = "ab" * 32
+        self.repo.export_to_binary(
+            self.time_list,
+            self.point_list,
+            BINARY_FILEPATH,
+            Point(320, 240.5),
+            125.0,
+            25.0,
+            video_hash,
+        )
+
+        header, time, x, y = self.repo.read_binary(BINARY_FILEPATH)
+        self.assertEqual(header.count, 3)
+        self.assertEqual((header.origin.x, header.origin.y), (320, 240.5))
+        self.assertEqual(header.scale, 125.0)
+        self.assertEqual(header.fps, 25.0)
+        self.assertEqual(header.video_hash, video_hash)
+        self.assertEqual(time.tolist(), self.time_list)
+        self.assertEqual(x.tolist(), [5, 7, 1])
+        self.assertEqual(y.tolist(), [9, 2, 0])
+        self.assertIsInstance(time, np.memmap)
+        del time, x, y
+
+    def test_binary_store(self) -> None:
+        """Checks that frames without a point are skipped when writing a store."""
+        store = TrajectoryStore(3)
+        store[1] = Point(5, 9)
+        self.repo.export_to_binary(
+            np.array([0.0, 40.0, 80.0]),
+            store,
+            BINARY_FILEPATH,
+            Point(0, 0),
+            1.0,
+            25.0,
+            "00" * 32,
+        )
+
+        header, time, x, y = self.repo.read_binary(BINARY_FILEPATH)
+        self.assertEqual(header.count, 1)
+        self.assertEqual((time[0], x[0], y[0]), (40.0, 5.0, 9.0))
+        del time, x, y
+
+    def test_table(self) -> None:
+        """Checks that columns are written side by side, with NaN values \
+left empty, and that the file can be compressed."""
+        columns = {
+            "x (A)": np.array([1.0, np.nan]),
+            "x (B)": np.array([2.5, 3.0]),
+        }
+        self.assertEqual(
+            "".join(self.repo.table_chunks(np.array([0, 40]), columns, chunk_rows=1)),
+            "temps,x (A),x (B)\n0.0,1.0,2.5\n40.0,,3.0",
+        )
+
+        self.repo.export_table_to_csv(np.array([0, 40]), columns, GZIP_FILEPATH)
+        with gzip.open(GZIP_FILEPATH, "rt", encoding="utf-8") as file:
+            self.assertEqual(file.read().splitlines()[2], "40.0,,3.0")
+
+        with self.assertRaises(ValueError):
+            self.repo.table_chunks(np.array([0]), columns)
+
+    def test_binary_invalid(self) -> None:
+        """Checks that the correct error is raised when a file is not a \
+binary trajectory file."""
+        self.repo.export_to_csv(self.time_list, self.point_list, BINARY_FILEPATH)
+
+        with self.assertRaises(ValueError) as context:
+            self.repo.read_binary(BINARY_FILEPATH)
+
+        self.assertEqual(str(context.exception), "Invalid trajectory file")
+
+    def test_content_hash(self) -> None:
+        """Checks that the hash depends on the content of the file."""
+        self.repo.export_to_csv(self.time_list, self.point_list, CONTENT_FILEPATH)
+        first = self.repo.content_hash(CONTENT_FILEPATH)
+        self.assertEqual(first, self.repo.content_hash(CONTENT_FILEPATH))
+        self.assertEqual(len(first), 64)
+
+        self.repo.export_to_csv(self.time_list, self.point_list, CONTENT_FILEPATH, ";")
+        self.assertNotEqual(first, self.repo.content_hash(CONTENT_FILEPATH))
@@ -0,0 +1,60 @@
+import unittest
+
+from src.models.framecache import FrameCache
+
+
+class testFrameCache(unittest.TestCase):
+    def test_lru_eviction(self) -> None:
+        """Checks that the least recently used frame is evicted first."""
+        cache = FrameCache(max_frames=2)
+        cache.put(0, "a")
+        cache.put(1, "b")
+        cache.get(0)
+        cache.put(2, "c")
+
+        self.assertIn(0, cache)
+        self.assertNotIn(1, cache)
+        self.assertIn(2, cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_byte_limit(self) -> None:
+        """Checks that frames are evicted when the size limit is exceeded."""
+        cache = FrameCache(max_frames=10, max_bytes=250)
+        for index in range(5):
+            cache.put(index, index, 100)
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size_bytes, 200)
+        self.assertEqual(cache.capacity(100), 2)
+        self.assertEqual(cache.capacity(1000), 1)
+
+    def test_replace(self) -> None:
+        """Checks that putting a frame twice does not count its size twice."""
+        cache = FrameCache(max_frames=10, max_bytes=1000)
+        cache.put(0, "a", 100)
+        cache.put(0, "b", 100)
+
+        self.assertEqual(cache.size_bytes, 100)
+        self.assertEqual(cache.get(0), "b")
+
+    def test_stats(self) -> None:
+        """Checks that hits and misses are counted by FrameCache.get only."""
+        cache = FrameCache(max_frames=4)
+        cache.put(0, "a")
+
+        self.assertEqual(cache.get(0), "a")
+        self.assertIsNone(cache.get(1))
+        self.assertIn(0, cache)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(cache.misses, 1)
+
+        cache.reset_stats()
+        self.assertEqual(cache.hits, 0)
+        self.assertEqual(cache.misses, 0)
+
+    def test_invalid_limits(self) -> None:
+        """Checks that the correct error is raised when the limits are invalid."""
+        with self.assertRaises(ValueError) as context:
+            FrameCache(max_frames=0)
+
+        self.assertEqual(str(context.exception), "'max_frames' must be at least 1")
@@ -0,0 +1,106 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import cv2
+
+from benchmarks.synthetic import generate_video
+from src.models.frameindex import FrameIndex
+
+# the sample video is generated by each test case
+SAMPLE_WIDTH = 320
+SAMPLE_HEIGHT = 240
+SAMPLE_FRAME_COUNT = 200
+
+
+class FakeCapture:
+    """Records the calls made by FrameIndex.seek."""
+
+    def __init__(self) -> None:
+        self.sets = []
+        self.grabs = 0
+
+    def set(self, prop: int, value: float) -> bool:
+        self.sets.append((prop, value))
+        return True
+
+    def grab(self) -> bool:
+        self.grabs += 1
+        return True
+
+
+class testFrameIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sample_directory = tempfile.TemporaryDirectory()
+        cls.video_path = str(
+            generate_video(
+                Path(cls.sample_directory.name).joinpath("sample.mp4"),
+                SAMPLE_WIDTH,
+                SAMPLE_HEIGHT,
+                SAMPLE_FRAME_COUNT,
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.sample_directory.cleanup()
+
+    def setUp(self) -> None:
+        self.index = FrameIndex([0, 10, 20], [i * 40.0 for i in range(30)])
+
+    def test_keyframe_before(self) -> None:
+        """Checks that the closest previous keyframe is returned."""
+        self.assertEqual(self.index.keyframe_before(0), 0)
+        self.assertEqual(self.index.keyframe_before(9), 0)
+        self.assertEqual(self.index.keyframe_before(10), 10)
+        self.assertEqual(self.index.keyframe_before(29), 20)
+        self.assertTrue(self.index.is_keyframe(20))
+        self.assertFalse(self.index.is_keyframe(21))
+
+    def test_first_keyframe(self) -> None:
+        """Checks that the first frame is always considered a keyframe."""
+        index = FrameIndex([5], [0.0, 40.0, 80.0])
+        self.assertEqual(index.keyframe_before(2), 0)
+        self.assertEqual(index.keyframe_count, 2)
+
+    def test_timestamps_sorted(self) -> None:
+        """Checks that timestamps read in decoding order are sorted."""
+        index = FrameIndex([0], [0.0, 80.0, 40.0])
+        self.assertEqual(index.timestamp_ms(1), 40.0)
+        self.assertEqual(index.frame_count, 3)
+
+    def test_seek_from_keyframe(self) -> None:
+        """Checks that seeking to another GOP jumps to its keyframe then grabs."""
+        capture = FakeCapture()
+        grabbed = self.index.seek(capture, 3, 25)
+        self.assertEqual(capture.sets, [(cv2.CAP_PROP_POS_FRAMES, 20)])
+        self.assertEqual(grabbed, 5)
+
+    def test_seek_forward_same_gop(self) -> None:
+        """Checks that seeking forward in the same GOP only grabs frames."""
+        capture = FakeCapture()
+        grabbed = self.index.seek(capture, 22, 25)
+        self.assertEqual(capture.sets, [])
+        self.assertEqual(grabbed, 3)
+
+    def test_seek_backward(self) -> None:
+        """Checks that seeking backward jumps to the keyframe of the target."""
+        capture = FakeCapture()
+        grabbed = self.index.seek(capture, 15, 12)
+        self.assertEqual(capture.sets, [(cv2.CAP_PROP_POS_FRAMES, 10)])
+        self.assertEqual(grabbed, 2)
+
+    def test_no_frames(self) -> None:
+        """Checks that the correct error is raised when there are no frames."""
+        with self.assertRaises(ValueError) as context:
+            FrameIndex([], [])
+
+        self.assertEqual(str(context.exception), "Nombre d'images invalide")
+
+    def test_build(self) -> None:
+        """Checks that the index built from a video matches its properties."""
+        index = FrameIndex.build(self.video_path)
+        self.assertEqual(index.frame_count, SAMPLE_FRAME_COUNT)
+        self.assertEqual(index.timestamp_ms(0), 0)
+        self.assertEqual(index.timestamp_ms(10), 400)
@@ -0,0 +1,102 @@
+import unittest
+
+import numpy as np
+
+from src.models.kinematics import GRAVITY, Kinematics, savgol_filter, segments
+from src.models.trajectorystore import TrajectoryStore
+
+
+class testKinematics(unittest.TestCase):
+    def setUp(self) -> None:
+        # a ball thrown at 2 m/s horizontally and 5 m/s vertically
+        self.times = np.arange(20) * 40.0
+        seconds = self.times / 1000
+        self.points = TrajectoryStore.from_arrays(
+            2 * seconds, 5 * seconds - GRAVITY / 2 * seconds**2
+        )
+
+    def test_velocity(self) -> None:
+        """Checks that the velocity is the derivative of the position."""
+        kinematics = Kinematics(self.points, self.times)
+        seconds = self.times / 1000
+        np.testing.assert_allclose(kinematics.vx, 2)
+        np.testing.assert_allclose(kinematics.vy, 5 - GRAVITY * seconds)
+        np.testing.assert_allclose(kinematics.speed, np.hypot(2, kinematics.vy))
+
+    def test_acceleration(self) -> None:
+        """Checks that the acceleration is the derivative of the velocity."""
+        kinematics = Kinematics(self.points, self.times)
+        np.testing.assert_allclose(kinematics.ax, 0, atol=1e-9)
+        np.testing.assert_allclose(kinematics.ay, -GRAVITY)
+
+    def test_mechanical_energy(self) -> None:
+        """Checks that the mechanical energy of a free fall is constant."""
+        energy = Kinematics(self.points, self.times).mechanical_energy(0.5)
+        np.testing.assert_allclose(energy, energy[0])
+
+    def test_gaps(self) -> None:
+        """Checks that derivatives are not computed across frames without \
+a point, and are NaN on segments that are too short."""
+        store = TrajectoryStore.from_arrays(
+            np.arange(8.0), np.zeros(8), np.array([1, 1, 1, 0, 1, 0, 1, 1], bool)
+        )
+        kinematics = Kinematics(store, np.arange(8) * 1000.0)
+        self.assertEqual(kinematics.times.tolist(), [0, 1000, 2000, 4000, 6000, 7000])
+        np.testing.assert_allclose(kinematics.vx, [1, 1, 1, np.nan, 1, 1])
+        np.testing.assert_allclose(kinematics.ax, [0, 0, 0] + [np.nan] * 3)
+
+    def test_smoothing(self) -> None:
+        """Checks that smoothing removes noise without changing the trend."""
+        noise = np.random.default_rng(0).normal(0, 0.001, len(self.times))
+        noisy = TrajectoryStore.from_arrays(self.points.x + noise, self.points.y)
+        raw = Kinematics(noisy, self.times)
+        smoothed = Kinematics(noisy, self.times, smoothing_window=7)
+        self.assertLess(np.std(smoothed.vx - 2), np.std(raw.vx - 2))
+
+    def test_different_len(self) -> None:
+        """Checks that an error is raised when there is not one time per point."""
+        with self.assertRaises(ValueError):
+            Kinematics(self.points, self.times[:-1])
+
+    def test_columns(self) -> None:
+        """Checks that energies are only exported when a mass is given."""
+        kinematics = Kinematics(self.points, self.times)
+        self.assertEqual(list(kinematics.columns()), ["vx", "vy", "v", "ax", "ay", "a"])
+        self.assertIn("Em", kinematics.columns(1.0))
+
+    def test_savgol_polynomial(self) -> None:
+        """Checks that the filter keeps polynomials of its order unchanged."""
+        values = np.arange(10.0) ** 2
+        np.testing.assert_allclose(savgol_filter(values, 5, 2), values, atol=1e-9)
+
+    def test_savgol_invalid_window(self) -> None:
+        """Checks that an even window is refused."""
+        with self.assertRaises(ValueError):
+            savgol_filter(np.zeros(10), 4, 2)
+
+    def test_segments(self) -> None:
+        """Checks that frames are split where more frames than usual are missing."""
+        self.assertEqual(
+            segments(np.array([0, 1, 2, 4, 5, 6])), [slice(0, 3), slice(3, 6)]
+        )
+        self.assertEqual(segments(np.array([0, 2, 4, 6])), [slice(0, 4)])
+        self.assertEqual(segments(np.array([], dtype=np.int64)), [])
+
+    def test_variable_frame_rate(self) -> None:
+        """Checks that uneven time steps are not taken for gaps, and that \
+gaps are found from the frames of a store skipping frames without a point."""
+        steps = np.tile([1000 / 60, 1000 / 60, 1000 / 30], 21)
+        times = np.concatenate(([0.0], np.cumsum(steps)))
+        seconds = times / 1000
+        points = TrajectoryStore.from_arrays(2 * seconds, -GRAVITY / 2 * seconds**2)
+
+        kinematics = Kinematics(points, times)
+        np.testing.assert_allclose(kinematics.vx, 2)
+        np.testing.assert_allclose(kinematics.ay, -GRAVITY)
+        smoothed = Kinematics(points, times, smoothing_window=5)
+        self.assertTrue(np.isfinite(smoothed.ax).all())
+
+        frames = np.concatenate((np.arange(30), np.arange(40, 40 + len(times) - 30)))
+        kinematics = Kinematics(points, times, frames=frames)
+        self.assertTrue(np.isfinite(kinematics.vx).all())
+        np.testing.assert_allclose(kinematics.vx[[29, 30]], 2)
@@ -0,0 +1,71 @@
+import unittest
+
+from src.models.playbackclock import PlaybackClock
+
+
+class FakeTime:
+    """A clock that only moves when told to."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class testPlaybackClock(unittest.TestCase):
+    def setUp(self) -> None:
+        self.time = FakeTime()
+        self.clock = PlaybackClock(40, clock=self.time)
+        self.clock.start(10)
+
+    def test_due_frame(self) -> None:
+        """Checks that the due frame follows the wall time, whatever the \
+delays between calls."""
+        self.assertEqual(self.clock.due_frame(), 10)
+        self.time.now = 0.039
+        self.assertEqual(self.clock.due_frame(), 10)
+        self.time.now = 0.4
+        self.assertEqual(self.clock.due_frame(), 20)
+
+    def test_delay(self) -> None:
+        """Checks that delays are computed from the start of playback, \
+so that they do not drift."""
+        self.time.now = 0.015
+        self.assertAlmostEqual(self.clock.delay_ms(11), 25)
+        self.time.now = 0.1
+        self.assertAlmostEqual(self.clock.delay_ms(11), -60)
+
+    def test_backwards(self) -> None:
+        """Checks that frames are due in reverse order when playing backwards."""
+        self.clock.start(10, backwards=True)
+        self.time.now = 0.02
+        self.assertEqual(self.clock.due_frame(), 10)
+        self.time.now = 0.08
+        self.assertEqual(self.clock.due_frame(), 8)
+        self.assertAlmostEqual(self.clock.delay_ms(7), 40)
+
+    def test_speed(self) -> None:
+        """Checks that changing the speed keeps the current position."""
+        self.time.now = 0.4
+        self.clock.set_speed(4)
+        self.assertEqual(self.clock.due_frame(), 20)
+        self.time.now = 0.5
+        self.assertEqual(self.clock.due_frame(), 30)
+
+    def test_invalid_speed(self) -> None:
+        """Checks that speeds out of range are refused."""
+        with self.assertRaises(ValueError):
+            self.clock.set_speed(16)
+
+        with self.assertRaises(ValueError):
+            PlaybackClock(40, 0.1)
+
+    def test_counters(self) -> None:
+        """Checks that shown and dropped frames are counted."""
+        self.clock.count()
+        self.clock.count(3)
+        self.time.now = 0.5
+        self.assertEqual(self.clock.shown_frames, 2)
+        self.assertEqual(self.clock.dropped_frames, 3)
+        self.assertAlmostEqual(self.clock.fps, 4)
@@ -0,0 +1,92 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from benchmarks.synthetic import generate_video
+from src.models.profiler import Profiler
+from src.models.video import Video
+
+# the sample video is generated by each test case
+SAMPLE_WIDTH = 320
+SAMPLE_HEIGHT = 240
+SAMPLE_FRAME_COUNT = 200
+
+
+class testProfiler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sample_directory = tempfile.TemporaryDirectory()
+        cls.video_path = str(
+            generate_video(
+                Path(cls.sample_directory.name).joinpath("sample.mp4"),
+                SAMPLE_WIDTH,
+                SAMPLE_HEIGHT,
+                SAMPLE_FRAME_COUNT,
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.sample_directory.cleanup()
+
+    def test_disabled(self) -> None:
+        """Checks that nothing is recorded when the profiler is disabled."""
+        profiler = Profiler(enabled=False)
+        profiler.stop("decode", profiler.start())
+        self.assertEqual(profiler.stages(), [])
+        self.assertEqual(profiler.summary(), "")
+        self.assertEqual(profiler.trace()["traceEvents"], [])
+
+    def test_percentiles(self) -> None:
+        """Checks that only the last durations are used for the percentiles."""
+        profiler = Profiler(window=4)
+        for _ in range(10):
+            profiler.stop("decode", profiler.start())
+        profiler.stop("display", profiler.start(), frame=3)
+
+        self.assertEqual(profiler.stages(), ["decode", "display"])
+        values = profiler.percentiles("decode", (0, 100))
+        self.assertIsNotNone(values)
+        self.assertLessEqual(values[0], values[1])  # type: ignore
+        self.assertIsNone(profiler.percentiles("overlay"))
+        self.assertEqual(len(profiler.summary().splitlines()), 3)
+
+    def test_export_trace(self) -> None:
+        """Checks that the trace is written in the Chrome trace format and \
+that its size is bounded."""
+        profiler = Profiler(max_events=5)
+        for frame in range(8):
+            profiler.stop("display", profiler.start(), frame)
+
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "trace.json")
+            profiler.export_trace(filename)
+            with open(filename, encoding="utf-8") as file:
+                trace = json.load(file)
+
+        durations = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        self.assertEqual(
+            [event["args"]["frame"] for event in durations], [3, 4, 5, 6, 7]
+        )
+        self.assertTrue(all(event["dur"] >= 0 for event in durations))
+        self.assertTrue(any(event["ph"] == "M" for event in trace["traceEvents"]))
+
+    def test_video_stages(self) -> None:
+        """Checks that decoding and converting frames are timed, \
+including in the prefetching thread."""
+        profiler = Profiler()
+        video = Video(self.video_path, profiler=profiler)
+        video.get_frame()
+        self.assertEqual(profiler.stages(), ["decode", "convert"])
+
+        video.start_prefetching(max_frames=8)
+        deadline = time.monotonic() + 10
+        threads = set()
+        while len(threads) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+            threads = {event["tid"] for event in profiler.trace()["traceEvents"]}
+        video.stop_prefetching()
+        self.assertGreaterEqual(len(threads), 2)
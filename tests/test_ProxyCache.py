@@ -0,0 +1,130 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+import cv2
+
+from benchmarks.synthetic import generate_video
+from src.models.proxycache import ProxyCache, ProxyWorker, transcode
+from src.models.video import Video
+
+# the sample video is generated by each test case
+SAMPLE_WIDTH = 320
+SAMPLE_HEIGHT = 240
+SAMPLE_FRAME_COUNT = 200
+
+
+class testProxyCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sample_directory = tempfile.TemporaryDirectory()
+        cls.video_path = str(
+            generate_video(
+                Path(cls.sample_directory.name).joinpath("sample.mp4"),
+                SAMPLE_WIDTH,
+                SAMPLE_HEIGHT,
+                SAMPLE_FRAME_COUNT,
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.sample_directory.cleanup()
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ProxyCache(self.directory.name, max_bytes=100)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def write_proxy(self, name: str, size: int, mtime: int) -> Path:
+        """Writes a fake proxy of a given size and modification time."""
+        path = self.cache.path_for(name)
+        path.write_bytes(b"0" * size)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_lookup(self) -> None:
+        """Checks that only existing proxies are found."""
+        self.assertIsNone(self.cache.lookup("missing"))
+        path = self.write_proxy("present", 10, 1000)
+        self.assertEqual(self.cache.lookup("present"), path)
+
+    def test_evict_least_recently_used(self) -> None:
+        """Checks that the least recently used proxies are deleted first, \
+and that looking up a proxy marks it as used."""
+        oldest = self.write_proxy("oldest", 40, 1000)
+        old = self.write_proxy("old", 40, 2000)
+        recent = self.write_proxy("recent", 40, 3000)
+        self.cache.lookup("oldest")
+
+        self.assertEqual(self.cache.evict(), [old])
+        self.assertTrue(oldest.exists())
+        self.assertTrue(recent.exists())
+        self.assertEqual(self.cache.size_bytes(), 80)
+
+    def test_evict_keep(self) -> None:
+        """Checks that the proxy in use is never deleted."""
+        kept = self.write_proxy("kept", 80, 1000)
+        other = self.write_proxy("other", 80, 2000)
+        self.assertEqual(self.cache.evict(keep=kept), [other])
+
+    def test_transcode(self) -> None:
+        """Checks that the proxy has every frame of the video, at a reduced size, \
+and that the video can decode its frames from it."""
+        path = self.cache.path_for("sample")
+        self.assertTrue(transcode(self.video_path, path, max_height=120))
+
+        capture = cv2.VideoCapture(str(path))
+        self.assertEqual(int(capture.get(cv2.CAP_PROP_FRAME_COUNT)), SAMPLE_FRAME_COUNT)
+        self.assertEqual(int(capture.get(cv2.CAP_PROP_FRAME_HEIGHT)), 120)
+        capture.release()
+
+        video = Video(self.video_path)
+        self.assertTrue(video.use_proxy(str(path)))
+        self.assertEqual(video.proxy, str(path))
+        video.go_to(150)
+        frame = video.get_frame()
+        self.assertTrue(frame.startswith(b"P6\n320 240\n255\n"))
+        self.assertEqual(video.current_frame, 151)
+
+    def test_stop_using_proxy(self) -> None:
+        """Checks that frames are decoded from the video again, with the same \
+prefetching, once the proxy is no longer used."""
+        path = self.cache.path_for("sample")
+        self.assertTrue(transcode(self.video_path, path, max_height=120))
+        reference = Video(self.video_path)
+        reference.go_to(150)
+        expected = reference.get_frame()
+
+        video = Video(self.video_path)
+        video.start_prefetching(max_frames=8)
+        self.assertTrue(video.use_proxy(str(path)))
+        video.go_to(150)
+        self.assertNotEqual(video.get_frame(), expected)
+
+        self.assertTrue(video.stop_using_proxy())
+        self.assertIsNone(video.proxy)
+        self.assertTrue(video.prefetching)
+        video.go_to(150)
+        self.assertEqual(video.get_frame(), expected)
+        video.stop_prefetching()
+
+    def test_invalid_proxy(self) -> None:
+        """Checks that a proxy without the same frames as the video is refused."""
+        video = Video(self.video_path)
+        self.assertFalse(video.use_proxy("missing.avi"))
+        self.assertIsNone(video.proxy)
+
+    def test_worker_cancel(self) -> None:
+        """Checks that a cancelled proxy is not kept."""
+        path = self.cache.path_for("cancelled")
+        worker = ProxyWorker(self.video_path, path, SAMPLE_FRAME_COUNT, max_height=120)
+        worker.start()
+        worker.cancel()
+        self.assertFalse(worker.running)
+        if not worker.succeeded:
+            self.assertFalse(path.exists())
+        self.assertEqual(self.cache.proxies(), [path] if worker.succeeded else [])
@@ -0,0 +1,59 @@
+import unittest
+
+import numpy as np
+
+from src.models.point import Point
+from src.models.referenceframe import ReferenceFrame
+from src.models.trajectorystore import TrajectoryStore
+
+
+class testReferenceFrame(unittest.TestCase):
+    def setUp(self) -> None:
+        self.frame = ReferenceFrame(Point(100, 200), 50)
+
+    def test_transformed(self) -> None:
+        """Checks that a point is moved relative to the origin, with the y-axis \
+pointing up, then scaled."""
+        result = self.frame.transformed(Point(150, 100))
+        self.assertEqual(result.x, 1.0)
+        self.assertEqual(result.y, 2.0)
+
+    def test_transformed_batch(self) -> None:
+        """Checks that arrays of points are transformed like single points."""
+        x, y = self.frame.transformed_batch(
+            np.array([150.0, 100.0]), np.array([100.0, 250.0])
+        )
+        self.assertEqual(x.tolist(), [1.0, 0.0])
+        self.assertEqual(y.tolist(), [2.0, -1.0])
+
+    def test_transformed_values(self) -> None:
+        """Checks that frames without a point are skipped and that times \
+match the index of each frame."""
+        points, time = self.frame.transformed_values(
+            [Point(100, 200), None, Point(200, 250)], 40
+        )
+        self.assertEqual(time.tolist(), [0, 80])
+        self.assertEqual(points.x.tolist(), [0, 2])
+        self.assertEqual(points.y.tolist(), [0, -1])
+
+    def test_transformed_store(self) -> None:
+        """Checks that a trajectory store can be transformed."""
+        store = TrajectoryStore(4)
+        store[3] = Point(150, 100)
+        points, time = self.frame.transformed_values(store, 10)
+        self.assertEqual(time.tolist(), [30])
+        self.assertEqual((points[0].x, points[0].y), (1.0, 2.0))
+
+    def test_variable_frame_rate(self) -> None:
+        """Checks that times come from the time of each frame when given."""
+        store = TrajectoryStore(4)
+        store[1] = Point(150, 100)
+        store[3] = Point(150, 100)
+        _, time = self.frame.transformed_values(store, np.array([0, 30, 75, 90.5]))
+        self.assertEqual(time.tolist(), [30, 90.5])
+
+    def test_no_points(self) -> None:
+        """Checks that empty results are returned when there are no points."""
+        points, time = self.frame.transformed_values([None, None], 40)
+        self.assertEqual(len(points), 0)
+        self.assertEqual(len(time), 0)
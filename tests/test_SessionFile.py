@@ -0,0 +1,155 @@
+import tempfile
+import unittest
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.models.point import Point
+from src.models.sessionfile import JOURNAL_RECORD, SessionFile
+from src.models.sessionsnapshot import SessionSnapshot
+from src.models.trackingsession import TrackingSession
+from src.models.trajectorystore import TrajectoryStore
+
+
+def coordinates(points: TrajectoryStore) -> List[Optional[Tuple[float, float]]]:
+    """Returns the coordinates of each point, which can be compared."""
+    return [None if point is None else (point.x, point.y) for point in points]
+
+
+class testSessionFile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name).joinpath("test.vtsession")
+        self.file = SessionFile(self.path, compact_records=3)
+
+        first = TrajectoryStore(10)
+        first[2] = Point(1.5, 2.5)
+        first[4] = Point(3, 4)
+        self.snapshot = SessionSnapshot(
+            "video.mp4",
+            "ab" * 32,
+            10,
+            {"Objet 1": first, "Objet 2": TrajectoryStore(10)},
+            "Objet 2",
+            Point(100, 200),
+            50.0,
+        )
+
+    def tearDown(self) -> None:
+        self.file.close()
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        """Checks that a saved snapshot is read back as is."""
+        self.file.save(self.snapshot)
+        loaded = SessionFile(self.path).load()
+
+        self.assertEqual(loaded.video_path, "video.mp4")
+        self.assertEqual(loaded.video_hash, "ab" * 32)
+        self.assertEqual(loaded.frame_count, 10)
+        self.assertEqual(list(loaded.objects), ["Objet 1", "Objet 2"])
+        self.assertEqual(loaded.active, "Objet 2")
+        self.assertEqual((loaded.origin.x, loaded.origin.y), (100, 200))  # type: ignore
+        self.assertEqual(loaded.scale, 50.0)
+        self.assertIsNone(loaded.mass)
+        self.assertEqual(
+            coordinates(loaded.objects["Objet 1"]),
+            coordinates(self.snapshot.objects["Objet 1"]),
+        )
+        self.assertEqual(loaded.objects["Objet 2"].count, 0)
+        self.assertEqual(loaded.last_frame, 4)
+
+    def test_journal(self) -> None:
+        """Checks that the edits of the journal are applied in order."""
+        self.file.save(self.snapshot)
+        self.assertFalse(self.file.append(1, 7, Point(5, 6)))
+        self.assertFalse(self.file.append(0, 2, None))
+        self.assertTrue(self.file.append(1, 7, Point(8, 9)))
+        self.file.close()
+
+        loaded = SessionFile(self.path).load()
+        self.assertIsNone(loaded.objects["Objet 1"][2])
+        point = loaded.objects["Objet 2"][7]
+        self.assertEqual((point.x, point.y), (8, 9))  # type: ignore
+        self.assertEqual(loaded.last_frame, 7)
+
+    def test_compaction(self) -> None:
+        """Checks that saving empties the journal, and that a journal left \
+after a crash during compaction gives the same points."""
+        self.file.save(self.snapshot)
+        self.file.append(0, 5, Point(1, 1))
+        journal = self.file.journal_path.read_bytes()
+
+        points = self.snapshot.objects["Objet 1"]
+        points[5] = Point(1, 1)
+        self.file.save(self.snapshot)
+        self.assertFalse(self.file.journal_path.exists())
+        self.assertEqual(self.file.journal_records, 0)
+
+        self.file.journal_path.write_bytes(journal)
+        loaded = SessionFile(self.path).load()
+        self.assertEqual(coordinates(loaded.objects["Objet 1"]), coordinates(points))
+
+    def test_partial_record(self) -> None:
+        """Checks that a record cut by a crash is ignored."""
+        self.file.save(self.snapshot)
+        self.file.append(0, 6, Point(1, 1))
+        self.file.close()
+        with open(self.file.journal_path, "ab") as journal:
+            journal.write(JOURNAL_RECORD.pack(0, 7, 2.0, 2.0)[:10])
+
+        loaded = SessionFile(self.path).load()
+        self.assertIsNotNone(loaded.objects["Objet 1"][6])
+        self.assertIsNone(loaded.objects["Objet 1"][7])
+
+    def test_mismatched_restore(self) -> None:
+        """Checks that a session which does not match the frames of the video \
+is not restored, and that neither its snapshot nor its journal is modified."""
+        self.file.save(self.snapshot)
+        self.file.append(0, 6, Point(7, 8))
+        self.file.close()
+        snapshot_bytes = self.path.read_bytes()
+        journal_bytes = self.file.journal_path.read_bytes()
+
+        loaded = SessionFile(self.path).load()
+        with self.assertRaises(ValueError):
+            TrackingSession.from_snapshot(loaded, 11, 40)
+
+        self.assertEqual(self.path.read_bytes(), snapshot_bytes)
+        self.assertEqual(self.file.journal_path.read_bytes(), journal_bytes)
+
+        session = TrackingSession.from_snapshot(loaded, 10, 40)
+        self.assertEqual(session.names, ["Objet 1", "Objet 2"])
+        self.assertEqual(session.active.name, "Objet 2")
+        self.assertEqual(session["Objet 1"].points.count, 3)
+
+    def test_invalid(self) -> None:
+        """Checks that the correct error is raised when a file is not \
+a session file."""
+        self.path.write_bytes(b"not a session")
+        with self.assertRaises(ValueError) as context:
+            self.file.load()
+
+        self.assertEqual(str(context.exception), "Invalid session file")
+
+    def test_large_session(self) -> None:
+        """Checks that a session with many points and a long journal is \
+restored exactly."""
+        frame_count = 300_000
+        points = TrajectoryStore.from_arrays(
+            np.arange(frame_count, dtype=np.float64),
+            np.arange(frame_count, dtype=np.float64) * 2,
+            np.arange(frame_count) % 3 != 0,
+        )
+        snapshot = SessionSnapshot("video.mp4", None, frame_count, {"A": points}, "A")
+        self.file.save(snapshot)
+        journal = SessionFile(self.path)
+        for frame in range(0, 3000, 3):
+            journal.append(0, frame, Point(-1, -1))
+        journal.close()
+
+        loaded = SessionFile(self.path).load().objects["A"]
+        self.assertEqual(loaded.count, frame_count - (frame_count // 3) + 1000)
+        self.assertEqual(loaded.x[3], -1)
+        self.assertEqual(loaded.y[4], 8)
@@ -0,0 +1,39 @@
+import unittest
+
+from src.models.startuptimer import StartupTimer
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.time = 10.0
+
+    def __call__(self) -> float:
+        return self.time
+
+
+class testStartupTimer(unittest.TestCase):
+    def test_mark(self) -> None:
+        """Checks that steps are timed from the start."""
+        clock = FakeClock()
+        timer = StartupTimer(9.5, clock)
+        self.assertEqual(timer.mark("imports"), 500.0)
+        clock.time = 10.25
+        timer.mark("first window")
+
+        self.assertEqual(timer.steps, [("imports", 500.0), ("first window", 750.0)])
+        self.assertEqual(timer.elapsed("first window"), 750.0)
+        self.assertIsNone(timer.elapsed("warm-up"))
+
+    def test_report(self) -> None:
+        """Checks that the report has one line per step, in the order they ended."""
+        clock = FakeClock()
+        timer = StartupTimer(clock=clock)
+        clock.time = 10.3
+        timer.mark("warm-up")
+        clock.time = 10.1
+        timer.mark("view")
+
+        lines = timer.report().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith("view"))
+        self.assertIn("+200.0 ms", lines[1])
@@ -0,0 +1,125 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+import cv2
+
+from benchmarks.synthetic import generate_video
+from src.models.thumbnails import (
+    THUMBNAIL_EXTENSION,
+    THUMBNAIL_HEIGHT,
+    ThumbnailCache,
+    ThumbnailGenerator,
+    split_ranges,
+    thumbnail_frames,
+)
+
+# the sample video is generated by each test case
+SAMPLE_WIDTH = 320
+SAMPLE_HEIGHT = 240
+SAMPLE_FRAME_COUNT = 200
+
+
+class testThumbnails(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sample_directory = tempfile.TemporaryDirectory()
+        cls.video_path = str(
+            generate_video(
+                Path(cls.sample_directory.name).joinpath("sample.mp4"),
+                SAMPLE_WIDTH,
+                SAMPLE_HEIGHT,
+                SAMPLE_FRAME_COUNT,
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.sample_directory.cleanup()
+
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ThumbnailCache("hash", self.directory.name)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_thumbnail_frames(self) -> None:
+        """Checks that the frames are evenly spaced and without duplicates."""
+        self.assertEqual(thumbnail_frames(100, 4), [0, 25, 50, 75])
+        self.assertEqual(thumbnail_frames(3, 10), [0, 1, 2])
+        self.assertEqual(thumbnail_frames(0, 10), [])
+
+    def test_split_ranges(self) -> None:
+        """Checks that every frame is in exactly one contiguous range."""
+        frames = list(range(10))
+        ranges = split_ranges(frames, 3)
+        self.assertEqual(ranges, [[0, 1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        self.assertEqual(split_ranges([1, 2], 8), [[1], [2]])
+
+    def test_nearest(self) -> None:
+        """Checks that the closest cached thumbnail is found."""
+        self.assertIsNone(self.cache.nearest(10))
+        for frame_index in (40, 0, 20):
+            self.cache.add(frame_index)
+        self.assertEqual(self.cache.frames, [0, 20, 40])
+        self.assertEqual(self.cache.nearest(12), (20, self.cache.path(20)))
+        self.assertEqual(self.cache.nearest(100), (40, self.cache.path(40)))
+
+    def write_thumbnails(self, content_hash: str, size: int, mtime: int) -> Path:
+        """Writes a fake thumbnail directory of a given size and modification time."""
+        path = Path(self.directory.name).joinpath(content_hash)
+        path.mkdir()
+        path.joinpath("0" + THUMBNAIL_EXTENSION).write_bytes(b"0" * size)
+        os.utime(path, (mtime, mtime))
+        return path
+
+    def test_evict_least_recently_used(self) -> None:
+        """Checks that the thumbnails of the least recently used videos are \
+deleted first, and that opening a cache marks its video as used."""
+        oldest = self.write_thumbnails("oldest", 40, 1000)
+        old = self.write_thumbnails("old", 40, 2000)
+        recent = self.write_thumbnails("recent", 40, 3000)
+        ThumbnailCache("oldest", self.directory.name)
+
+        cache = ThumbnailCache("recent", self.directory.name, max_bytes=100)
+        self.assertEqual(cache.evict(), [old])
+        self.assertTrue(oldest.exists())
+        self.assertTrue(recent.exists())
+        self.assertEqual(cache.size_bytes(), 80)
+
+    def test_evict_keep(self) -> None:
+        """Checks that the thumbnails of the video of the cache are never deleted."""
+        kept = self.write_thumbnails("kept", 80, 1000)
+        other = self.write_thumbnails("other", 80, 2000)
+        cache = ThumbnailCache("kept", self.directory.name, max_bytes=100)
+        os.utime(kept, (1000, 1000))
+        self.assertEqual(cache.evict(), [other])
+        self.assertTrue(kept.exists())
+
+    def test_generate(self) -> None:
+        """Checks that the thumbnails are rendered by several processes and \
+found again by a new cache."""
+        frames = [0, 50, 120, 180]
+        generator = ThumbnailGenerator(self.video_path, self.cache, frames, jobs=2)
+        generator.start()
+
+        rendered = []
+        deadline = time.monotonic() + 60
+        while generator.running and time.monotonic() < deadline:
+            time.sleep(0.05)
+        rendered.extend(generator.collect())
+
+        self.assertEqual(sorted(frame for frame, _ in rendered), frames)
+        self.assertEqual(self.cache.frames, frames)
+        image = cv2.imread(str(self.cache.path(120)))
+        self.assertEqual(image.shape[0], THUMBNAIL_HEIGHT)
+
+        cache = ThumbnailCache("hash", self.directory.name)
+        self.assertEqual(cache.frames, frames)
+        generator = ThumbnailGenerator(self.video_path, cache, frames, jobs=2)
+        generator.start()
+        self.assertFalse(generator.running)
+        self.assertEqual(generator.collect(), [])
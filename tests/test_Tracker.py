@@ -0,0 +1,112 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from benchmarks.synthetic import disc_center, generate_video
+from src.models.point import Point
+from src.models.tracker import Tracker, TrackingWorker, track
+
+# the sample video is generated by each test case
+SAMPLE_WIDTH = 320
+SAMPLE_HEIGHT = 240
+SAMPLE_FRAME_COUNT = 200
+
+
+def make_frame(x: int, y: int, visible: bool = True) -> np.ndarray:
+    """Returns a textured frame with a bright square centered on a point."""
+    generator = np.random.default_rng(0)
+    frame = generator.integers(0, 60, (240, 320, 3), dtype=np.uint8)
+    if visible:
+        frame[y - 6 : y + 7, x - 6 : x + 7] = 255
+        frame[y - 2 : y + 3, x - 2 : x + 3] = 0
+    return frame
+
+
+class testTracker(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sample_directory = tempfile.TemporaryDirectory()
+        cls.video_path = str(
+            generate_video(
+                Path(cls.sample_directory.name).joinpath("sample.mp4"),
+                SAMPLE_WIDTH,
+                SAMPLE_HEIGHT,
+                SAMPLE_FRAME_COUNT,
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.sample_directory.cleanup()
+
+    def test_follow(self) -> None:
+        """Checks that a moving object is followed."""
+        tracker = Tracker()
+        tracker.start(make_frame(100, 100), Point(100, 100))
+
+        for step in range(1, 10):
+            position, confidence = tracker.update(
+                make_frame(100 + 5 * step, 100 + 2 * step)
+            )
+            self.assertGreater(confidence, tracker.min_confidence)
+            self.assertAlmostEqual(position.x, 100 + 5 * step)
+            self.assertAlmostEqual(position.y, 100 + 2 * step)
+
+    def test_lost(self) -> None:
+        """Checks that the confidence drops when the object disappears \
+and that the last known position is kept."""
+        tracker = Tracker()
+        tracker.start(make_frame(100, 100), Point(100, 100))
+        tracker.update(make_frame(104, 100))
+
+        _, confidence = tracker.update(make_frame(108, 100, visible=False))
+        self.assertLess(confidence, tracker.min_confidence)
+        self.assertEqual((tracker.position.x, tracker.position.y), (104, 100))
+
+    def test_border(self) -> None:
+        """Checks that an object close to the border can be tracked."""
+        tracker = Tracker()
+        tracker.start(make_frame(7, 7), Point(7, 7))
+        position, confidence = tracker.update(make_frame(9, 8))
+        self.assertGreater(confidence, tracker.min_confidence)
+        self.assertEqual((position.x, position.y), (9, 8))
+
+    def test_not_started(self) -> None:
+        """Checks that the correct error is raised when tracking did not start."""
+        with self.assertRaises(ValueError) as context:
+            Tracker().update(make_frame(10, 10))
+
+        self.assertEqual(str(context.exception), "Tracking did not start")
+
+    def test_track_video(self) -> None:
+        """Checks that tracking a video yields one position per frame, \
+starting with the selected point."""
+        start = Point(*disc_center(10, SAMPLE_FRAME_COUNT, SAMPLE_WIDTH, SAMPLE_HEIGHT))
+        results = []
+        for result in track(self.video_path, 10, start):
+            results.append(result)
+            if len(results) == 10:
+                break
+
+        self.assertEqual([index for index, _, _ in results], list(range(10, 20)))
+        self.assertEqual(results[0][2], 1.0)
+        self.assertTrue(all(confidence > 0.6 for _, _, confidence in results))
+        for index, point, _ in results:
+            self.assertEqual(
+                (point.x, point.y),
+                disc_center(index, SAMPLE_FRAME_COUNT, SAMPLE_WIDTH, SAMPLE_HEIGHT),
+            )
+
+    def test_worker(self) -> None:
+        """Checks that the worker puts tracked positions in its queue."""
+        start = disc_center(0, SAMPLE_FRAME_COUNT, SAMPLE_WIDTH, SAMPLE_HEIGHT)
+        worker = TrackingWorker(self.video_path, 0, Point(*start))
+        worker.start()
+        index, point = worker.results.get(timeout=5)
+        worker.cancel()
+
+        self.assertEqual(index, 0)
+        self.assertEqual((point.x, point.y), start)
+        self.assertFalse(worker.running)
@@ -0,0 +1,105 @@
+import unittest
+
+import numpy as np
+
+from src.models.point import Point
+from src.models.referenceframe import ReferenceFrame
+from src.models.trackingsession import OBJECT_COLORS, TrackingSession
+from src.models.trajectorystore import TrajectoryStore
+
+
+class testTrackingSession(unittest.TestCase):
+    def setUp(self) -> None:
+        self.session = TrackingSession(4, np.array([0, 30, 75, 100]))
+        self.session.set_reference_frame(ReferenceFrame(Point(100, 200), 50))
+
+    def test_default_object(self) -> None:
+        """Checks that a session starts with a single active object."""
+        self.assertEqual(self.session.names, ["Objet 1"])
+        self.assertEqual(self.session.active.color, OBJECT_COLORS[0])
+        self.assertEqual(len(self.session.active.points), 4)
+
+    def test_add_select(self) -> None:
+        """Checks that added objects get their own points and color, \
+and that any of them can become active."""
+        second = self.session.add()
+        self.assertEqual(second.name, "Objet 2")
+        self.assertEqual(second.color, OBJECT_COLORS[1])
+        self.assertIsNot(second.points, self.session["Objet 1"].points)
+        self.assertEqual(self.session.active.name, "Objet 1")
+
+        self.assertIs(self.session.select("Objet 2"), second)
+        self.assertIs(self.session.active, second)
+        with self.assertRaises(KeyError):
+            self.session.select("Objet 3")
+        with self.assertRaises(ValueError):
+            self.session.add("Objet 2")
+
+    def test_restore(self) -> None:
+        """Checks that a session can be created with named objects, and that \
+replaced points are transformed."""
+        session = TrackingSession(2, 40, ["A", "B"])
+        self.assertEqual(session.names, ["A", "B"])
+        self.assertEqual(session.position("B"), 1)
+        self.assertEqual(session.active.name, "A")
+
+        session.set_reference_frame(ReferenceFrame(Point(100, 200), 50))
+        session["B"].replace_points(
+            TrajectoryStore.from_points([None, Point(150, 100)])
+        )
+        points, times = session["B"].values()
+        self.assertEqual((points[0].x, points[0].y), (1.0, 2.0))
+        self.assertEqual(times.tolist(), [40])
+        with self.assertRaises(ValueError):
+            session["A"].replace_points(TrajectoryStore(3))
+
+    def test_reference_frame(self) -> None:
+        """Checks that added objects use the reference frame of the session."""
+        second = self.session.add()
+        second.set_point(1, Point(150, 100))
+        points, times = second.values()
+        self.assertEqual((points[0].x, points[0].y), (1.0, 2.0))
+        self.assertEqual(times.tolist(), [30])
+
+    def test_table_single_object(self) -> None:
+        """Checks that a single object keeps the column names of the export."""
+        self.session.active.set_point(2, Point(150, 100))
+        frames, times, columns = self.session.table(kinematics=False)
+        self.assertEqual(frames.tolist(), [2])
+        self.assertEqual(times.tolist(), [75])
+        self.assertEqual(list(columns), ["x", "y"])
+
+    def test_table(self) -> None:
+        """Checks that the values of every object are aligned by frame."""
+        self.session.active.set_point(0, Point(100, 200))
+        self.session.active.set_point(1, Point(150, 200))
+        self.session.add().set_point(1, Point(200, 200))
+
+        frames, times, columns = self.session.table(mass=1.0)
+        self.assertEqual(frames.tolist(), [0, 1])
+        self.assertEqual(times.tolist(), [0, 30])
+        self.assertEqual(columns["x (Objet 1)"].tolist(), [0, 1])
+        self.assertTrue(np.isnan(columns["x (Objet 2)"][0]))
+        self.assertEqual(columns["x (Objet 2)"][1], 2)
+        self.assertIn("Em (Objet 2)", columns)
+
+    def test_table_without_reference_frame(self) -> None:
+        """Checks that the table is empty without a reference frame."""
+        self.session.set_reference_frame(None)
+        self.session.active.set_point(0, Point(100, 200))
+        frames, times, columns = self.session.table()
+        self.assertEqual((len(frames), len(times), columns), (0, 0, {}))
+
+    def test_kinematics_reused(self) -> None:
+        """Checks that the kinematics of an object are only computed again \
+when its points or the smoothing change."""
+        first = self.session.active
+        second = self.session.add()
+        first.set_point(0, Point(100, 200))
+        kinematics = second.kinematics()
+
+        first.set_point(1, Point(150, 200))
+        self.assertIs(second.kinematics(), kinematics)
+        self.assertIsNot(second.kinematics(5), kinematics)
+        second.set_point(2, Point(150, 200))
+        self.assertIsNot(second.kinematics(), kinematics)
@@ -0,0 +1,56 @@
+import unittest
+
+import numpy as np
+
+from src.models.point import Point
+from src.models.trajectorystore import TrajectoryStore
+
+
+class testTrajectoryStore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = TrajectoryStore(5)
+        self.store[1] = Point(2.5, 3)
+        self.store[3] = Point(-1, 4)
+
+    def test_getitem(self) -> None:
+        """Checks that points are returned for frames that have one, None otherwise."""
+        self.assertIsNone(self.store[0])
+        self.assertEqual((self.store[1].x, self.store[1].y), (2.5, 3.0))
+        self.assertEqual(len(self.store), 5)
+        self.assertEqual(self.store.count, 2)
+
+    def test_remove(self) -> None:
+        """Checks that a point can be removed."""
+        self.store[1] = None
+        self.assertIsNone(self.store[1])
+        self.assertEqual(self.store.indices().tolist(), [3])
+
+    def test_arrays(self) -> None:
+        """Checks that the arrays match the points and cannot be modified."""
+        self.assertEqual(self.store.valid.tolist(), [False, True, False, True, False])
+        self.assertEqual(self.store.x[[1, 3]].tolist(), [2.5, -1.0])
+        with self.assertRaises(ValueError):
+            self.store.x[0] = 1
+
+    def test_compressed(self) -> None:
+        """Checks that only the frames with a point are kept."""
+        compressed = self.store.compressed()
+        self.assertEqual(len(compressed), 2)
+        self.assertEqual(compressed.y.tolist(), [3.0, 4.0])
+
+    def test_from_points(self) -> None:
+        """Checks that a store can be created from a list of points and iterated."""
+        store = TrajectoryStore.from_points([None, Point(1, 2)])
+        self.assertEqual([str(point) for point in store], ["None", "(1.0, 2.0)"])
+
+    def test_from_arrays(self) -> None:
+        """Checks that a store can be created from arrays."""
+        store = TrajectoryStore.from_arrays(
+            np.array([1.0, 2.0]), np.array([3.0, 4.0]), np.array([True, False])
+        )
+        self.assertEqual(store.count, 1)
+
+        with self.assertRaises(ValueError) as context:
+            TrajectoryStore.from_arrays(np.zeros(2), np.zeros(3))
+
+        self.assertEqual(str(context.exception), "The arrays have different lengths")
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from src.models.point import Point
+from src.models.referenceframe import ReferenceFrame
+from src.models.trajectorystore import TrajectoryStore
+from src.models.transformcache import TransformCache
+
+
+class testTransformCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.points = TrajectoryStore(5)
+        self.points[1] = Point(150, 100)
+        self.cache = TransformCache(self.points, 40)
+        self.cache.set_reference_frame(ReferenceFrame(Point(100, 200), 50))
+
+    def test_no_reference_frame(self) -> None:
+        """Checks that empty results are returned without a reference frame."""
+        self.cache.set_reference_frame(None)
+        points, time = self.cache.values()
+        self.assertEqual(len(points), 0)
+        self.assertEqual(len(time), 0)
+
+    def test_values(self) -> None:
+        """Checks that the values match a full transformation."""
+        points, time = self.cache.values()
+        self.assertEqual(time.tolist(), [40])
+        self.assertEqual((points[0].x, points[0].y), (1.0, 2.0))
+
+    def test_values_reused(self) -> None:
+        """Checks that nothing is computed again when no point changed."""
+        self.assertIs(self.cache.values(), self.cache.values())
+
+    def test_update(self) -> None:
+        """Checks that a changed point is transformed again, the same way \
+as a full transformation."""
+        self.cache.values()
+        self.points[3] = Point(200, 250)
+        self.cache.update(3)
+        self.points[1] = None
+        self.cache.update(1)
+
+        points, time = self.cache.values()
+        expected, expected_time = ReferenceFrame(
+            Point(100, 200), 50
+        ).transformed_values(self.points, 40)
+        self.assertEqual(time.tolist(), expected_time.tolist())
+        self.assertEqual(points.x.tolist(), expected.x.tolist())
+        self.assertEqual(points.y.tolist(), expected.y.tolist())
+
+    def test_frame_times(self) -> None:
+        """Checks that the time of each frame is used when given."""
+        cache = TransformCache(self.points, np.array([0, 33, 70, 100, 133]))
+        cache.set_reference_frame(ReferenceFrame(Point(100, 200), 50))
+        self.assertEqual(cache.values()[1].tolist(), [33])
+
+    def test_reference_frame_changed(self) -> None:
+        """Checks that every point is transformed again when the reference \
+frame changes."""
+        self.cache.values()
+        self.cache.set_reference_frame(ReferenceFrame(Point(150, 100), 10))
+        points, _ = self.cache.values()
+        self.assertEqual((points[0].x, points[0].y), (0.0, 0.0))
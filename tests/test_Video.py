@@ -1,19 +1,47 @@
+from benchmarks.synthetic import generate_video
+from src.models.frameindex import FrameIndex
+from src.models.point import Point
 from src.models.video import Video
+import tempfile
 import unittest
+from pathlib import Path
 import os
 
+import cv2
+import numpy as np
+
 RESSOURCES_DIRECTORY = os.path.abspath(
     os.path.join(os.path.dirname(__file__), "ressources")
 )
 
-VALID_FILE_PATH = os.path.join(RESSOURCES_DIRECTORY, "sample.mp4")
+# the sample video is generated by each test case
+SAMPLE_WIDTH = 320
+SAMPLE_HEIGHT = 240
+SAMPLE_FRAME_COUNT = 200
+
 IMAGE_PATH = os.path.join(RESSOURCES_DIRECTORY, "image.jpeg")
 
 
 class testVideo(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sample_directory = tempfile.TemporaryDirectory()
+        cls.video_path = str(
+            generate_video(
+                Path(cls.sample_directory.name).joinpath("sample.mp4"),
+                SAMPLE_WIDTH,
+                SAMPLE_HEIGHT,
+                SAMPLE_FRAME_COUNT,
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.sample_directory.cleanup()
+
     def test_open_valid_file(self):
         """Checks that a Video instance can be created from a valid video file."""
-        video = Video(filename=VALID_FILE_PATH)
+        video = Video(filename=self.video_path)
         self.assertIsInstance(video, Video)
 
     def test_open_invalid_file(self):
@@ -32,39 +60,167 @@ class testVideo(unittest.TestCase):
 
     def test_properties(self):
         """Checks that the properties of the instance match the properties of the video."""
-        video = Video(filename=VALID_FILE_PATH)
-        self.assertEqual(video.width, 640)
-        self.assertEqual(video.height, 480)
+        video = Video(filename=self.video_path)
+        self.assertEqual(video.width, SAMPLE_WIDTH)
+        self.assertEqual(video.height, SAMPLE_HEIGHT)
         self.assertEqual(video.frame_duration_ms, 40)
-        self.assertEqual(video.frame_count, 774)
+        self.assertEqual(video.frame_count, SAMPLE_FRAME_COUNT)
+
+    def test_timestamps(self):
+        """Checks that the time of each frame comes from the video."""
+        video = Video(filename=self.video_path)
+        self.assertEqual(len(video.timestamps_ms), SAMPLE_FRAME_COUNT)
+        self.assertEqual(video.timestamp_ms(0), 0)
+        self.assertEqual(video.timestamp_ms(10), 400)
+
+    def test_variable_frame_rate(self):
+        """Checks that times follow the index instead of the frame rate, \
+and that frames missing from the index are spaced by the frame duration."""
+        timestamps = [100.0, 130.0, 200.0]
+        video = Video(self.video_path, FrameIndex([0], timestamps))
+        self.assertEqual(video.timestamps_ms[:5].tolist(), [0, 30, 100, 140, 180])
+        self.assertIs(video.timestamps_ms, video.timestamps_ms)
 
     def test_go_to_valid(self):
         """Checks that Video.go_to works as expected with a valid index."""
-        video = Video(filename=VALID_FILE_PATH)
+        video = Video(filename=self.video_path)
         self.assertTrue(video.go_to(50))
         self.assertEqual(video.current_frame, 50)
 
     def test_go_to_invalid(self):
         """Checks that Video.go_to works as expected with an invalid index."""
-        video = Video(filename=VALID_FILE_PATH)
+        video = Video(filename=self.video_path)
         self.assertFalse(video.go_to(-5))
         self.assertEqual(video.current_frame, 0)
 
     def test_go_back_valid(self):
         """Checks that Video.go_back works as expected with a valid index."""
-        video = Video(filename=VALID_FILE_PATH)
+        video = Video(filename=self.video_path)
         video.go_to(50)
         self.assertTrue(video.go_back())
         self.assertEqual(video.current_frame, 49)
 
     def test_go_back_invalid(self):
         """Checks that Video.go_back works as expected with an invalid index."""
-        video = Video(filename=VALID_FILE_PATH)
+        video = Video(filename=self.video_path)
         self.assertFalse(video.go_back())
         self.assertEqual(video.current_frame, 0)
 
     def test_get_frame(self):
         """Checks that Video.get_frame can return the first frame."""
-        video = Video(filename=VALID_FILE_PATH)
+        video = Video(filename=self.video_path)
         frame = video.get_frame()
         self.assertNotEqual(frame, None)
+
+    def test_to_ppm(self):
+        """Checks that frames are converted to the same PPM and PGM data \
+as OpenCV's encoder."""
+        frame = np.random.default_rng(0).integers(0, 256, (9, 16, 3), np.uint8)
+        self.assertEqual(Video.to_ppm(frame), cv2.imencode(".ppm", frame)[1].tobytes())
+        self.assertIs(type(Video.to_ppm(frame)), bytes)
+
+        gray = frame[:, :, 0].copy()
+        self.assertEqual(Video.to_ppm(gray), cv2.imencode(".pgm", gray)[1].tobytes())
+
+    def test_display_scale(self):
+        """Checks that frames are downsampled for display and that points \
+are mapped back to video pixels."""
+        video = Video(filename=self.video_path, display_scale=0.5)
+        self.assertEqual((video.display_width, video.display_height), (160, 120))
+        self.assertTrue(video.get_frame().startswith(b"P6\n160 120\n255\n"))
+
+        point = video.to_source(Point(100, 50))
+        self.assertEqual((point.x, point.y), (200, 100))
+        point = video.to_display(point)
+        self.assertEqual((point.x, point.y), (100, 50))
+
+    def test_set_display_scale(self):
+        """Checks that prefetched frames use the new display scale."""
+        video = Video(filename=self.video_path)
+        video.start_prefetching(max_frames=8)
+        video.set_display_scale(0.25)
+        self.assertTrue(video.prefetching)
+        self.assertTrue(video.get_frame().startswith(b"P6\n80 60\n255\n"))
+        video.stop_prefetching()
+
+        with self.assertRaises(ValueError):
+            video.set_display_scale(2)
+
+    def test_prefetching(self):
+        """Checks that prefetched frames are identical to decoded frames \
+and that cache hits are counted."""
+        reference = Video(filename=self.video_path)
+        video = Video(filename=self.video_path)
+        video.start_prefetching(max_frames=16)
+        self.assertTrue(video.prefetching)
+
+        for _ in range(8):
+            expected = reference.get_frame()
+            frame = video.get_frame()
+            self.assertEqual(frame, expected)
+
+        video.go_to(2)
+        reference.go_to(2)
+        self.assertEqual(video.get_frame(), reference.get_frame())
+        self.assertEqual(video.current_frame, 3)
+        self.assertGreater(video.cache_hits, 0)
+        self.assertEqual(video.cache_hits + video.cache_misses, 9)
+
+        video.stop_prefetching()
+        self.assertFalse(video.prefetching)
+
+    def test_seek_accuracy(self):
+        """Checks that seeking with the index returns the same frames as \
+reading the video sequentially, without decoding more than one GOP."""
+        reference = Video(filename=self.video_path)
+        frames = [reference.get_frame() for _ in range(60)]
+
+        video = Video(filename=self.video_path)
+        self.assertIsNotNone(video.build_index())
+        gop_size = max(
+            next(k for k in range(1, 60) if video.frame_index.is_keyframe(k)), 1
+        )
+        for target in (45, 3, 59, 46, 12, 0):
+            video.go_to(target)
+            self.assertEqual(video.get_frame(), frames[target])
+            self.assertLess(video.last_seek_grabbed_frames, gop_size)
+
+    def test_skip_frames(self):
+        """Checks that skipped frames are not returned and that the next \
+frame is the right one."""
+        reference = Video(filename=self.video_path)
+        frames = [reference.get_frame() for _ in range(12)]
+
+        video = Video(filename=self.video_path)
+        video.get_frame()
+        self.assertTrue(video.skip_frames(5))
+        self.assertEqual(video.current_frame, 6)
+        self.assertEqual(video.get_frame(), frames[6])
+        self.assertFalse(video.skip_frames(video.frame_count))
+
+    def test_get_previous_frame(self):
+        """Checks that stepping backwards returns the previous frames and \
+decodes the GOP behind the current frame only once."""
+        reference = Video(filename=self.video_path)
+        frames = [reference.get_frame() for _ in range(32)]
+
+        video = Video(filename=self.video_path)
+        video.start_prefetching(max_frames=32)
+        video.build_index()
+        video.go_to(30)
+        video.get_frame()
+
+        self.assertEqual(video.get_previous_frame(), frames[29])
+        self.assertEqual(video.current_frame, 30)
+        misses = video.cache_misses
+        keyframe = video.frame_index.keyframe_before(29)
+        for index in range(28, keyframe - 1, -1):
+            self.assertEqual(video.get_previous_frame(), frames[index])
+        self.assertEqual(video.cache_misses, misses)
+
+    def test_get_previous_frame_start(self):
+        """Checks that there is no frame before the first frame."""
+        video = Video(filename=self.video_path)
+        video.get_frame()
+        self.assertIsNone(video.get_previous_frame())
+        self.assertEqual(video.current_frame, 1)
@@ -0,0 +1,99 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from threading import Event
+
+from benchmarks.synthetic import generate_video
+from src.models.frameindex import FrameIndex
+from src.models.loadingphase import LoadingPhase
+from src.models.videoloader import VideoLoader, count_frames
+
+RESSOURCES_DIRECTORY = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "ressources")
+)
+
+# the sample video is generated by each test case
+SAMPLE_WIDTH = 320
+SAMPLE_HEIGHT = 240
+SAMPLE_FRAME_COUNT = 200
+INVALID_FILE_PATH = os.path.join(RESSOURCES_DIRECTORY, "image.jpeg")
+
+
+def wait(loader: VideoLoader, timeout: float = 30) -> None:
+    """Starts a loader and waits for it to finish."""
+    loader.start()
+    deadline = time.monotonic() + timeout
+    while loader.running and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class testVideoLoader(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.sample_directory = tempfile.TemporaryDirectory()
+        cls.video_path = str(
+            generate_video(
+                Path(cls.sample_directory.name).joinpath("sample.mp4"),
+                SAMPLE_WIDTH,
+                SAMPLE_HEIGHT,
+                SAMPLE_FRAME_COUNT,
+            )
+        )
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.sample_directory.cleanup()
+
+    def test_load(self) -> None:
+        """Checks that the video is opened with its index."""
+        loader = VideoLoader(self.video_path)
+        wait(loader)
+
+        self.assertIsNone(loader.error)
+        self.assertIsNotNone(loader.video)
+        self.assertEqual(loader.video.frame_count, SAMPLE_FRAME_COUNT)  # type: ignore
+        self.assertIsNotNone(loader.video.frame_index)  # type: ignore
+        self.assertIsNotNone(loader.content_hash)
+        self.assertEqual(loader.phase, LoadingPhase.OPENING)
+
+    def test_verify(self) -> None:
+        """Checks that the decodable frames are counted when asked."""
+        loader = VideoLoader(self.video_path, verify=True)
+        wait(loader)
+        self.assertEqual(loader.video.frame_count, SAMPLE_FRAME_COUNT)  # type: ignore
+
+    def test_invalid_file(self) -> None:
+        """Checks that the error is reported when the file is not a video."""
+        with tempfile.NamedTemporaryFile(suffix=".mp4") as file:
+            file.write(b"not a video")
+            file.flush()
+            loader = VideoLoader(file.name)
+            wait(loader)
+
+        self.assertIsNone(loader.video)
+        self.assertIsNotNone(loader.error)
+
+    def test_cancel(self) -> None:
+        """Checks that a cancelled loader does not open the video."""
+        cancelled = Event()
+        cancelled.set()
+        with self.assertRaises(ValueError):
+            FrameIndex.build(self.video_path, cancelled)
+        self.assertIsNone(count_frames(self.video_path, cancelled))
+
+        loader = VideoLoader(self.video_path, verify=True)
+        loader.start()
+        loader.cancel()
+        self.assertFalse(loader.running)
+        self.assertTrue(loader.cancelled)
+
+    def test_count_frames(self) -> None:
+        """Checks that every frame is counted and that progress is reported."""
+        counted = []
+        self.assertEqual(
+            count_frames(self.video_path, progress=counted.append),
+            SAMPLE_FRAME_COUNT,
+        )
+        self.assertEqual(counted[:2], [64, 128])